@@ -7,19 +7,27 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import os
-import sys
 import json
 import argparse
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.edge.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import requests
+import threading
 import pathlib
 import re
+from urllib.parse import urlparse
+import httpFetch
+from httpFetch import By
+from cardStore import CardStore
+from checkpointJournal import CheckpointJournal
+from deckResolver import DeckResolver, archetype_names
+from evolutionGraph import EvolutionGraph
+from iconAtlas import IconAtlas
+from iconStore import IconStore, normalize_icon_name
+from jsonWriter import write_json_object_stream
+from requestScheduler import RetryQueue, TransientRequestError
+from scrapeMetrics import METRICS, increment, timer
+from scraperLogging import setup_logging
+from setManifest import SetManifest
+from sqliteStore import SqliteCardStore
+from webDriverPool import WebDriverPool, wait_for_element
 
 # Get the script's directory
 SCRIPT_DIR = pathlib.Path(__file__).parent.resolve()
@@ -28,12 +36,43 @@ SCRIPT_DIR = pathlib.Path(__file__).parent.resolve()
 CONFIG = {
     'info': False,
     'OUTPUT_FILE': os.path.join(SCRIPT_DIR, "..", "src/data/card_data.json"),
+    'EVOLUTION_GRAPH_FILE': os.path.join(SCRIPT_DIR, "..", "src/data/evolutionGraph.json"),
+    'DECK_RESOLVER_FILE': os.path.join(SCRIPT_DIR, "..", "src/data/deckResolver.json"),  # Archetype name -> card keys
+    'TOURNAMENT_META_FILE': os.path.join(SCRIPT_DIR, "..", "src/data/deckTournamentMeta.json"),  # Archetypes resolved up front
+    'MANIFEST_FILE': os.path.join(SCRIPT_DIR, "set_manifest.json"),
     'ICON_FOLDER': os.path.join(SCRIPT_DIR, "..", "./public/icons/"),
     'ICON_WEBPATH': "./icons/",
+    'ICON_MANIFEST_FILE': os.path.join(SCRIPT_DIR, "icon_manifest.json"),
+    'ICONS_LIST_FILE': os.path.join(SCRIPT_DIR, "..", "src/data/iconsList.js"),
+    'ICON_ATLAS_FOLDER': os.path.join(SCRIPT_DIR, "..", "./public/icons/atlas/"),
+    'ICON_ATLAS_WEBPATH': "./icons/atlas/",
+    'ICON_ATLAS_STATE_FILE': os.path.join(SCRIPT_DIR, "icon_atlas.json"),
     'LOG_FILE': os.path.join(SCRIPT_DIR, 'scraper.log'),
     'CARD_URL': "https://pocket.limitlesstcg.com/cards/",
     'CARD_ICON_URL': "https://r2.limitlesstcg.net/pokemon/gen9/",
     'MAX_WORKERS': 10,
+    'HOST_LIMITS': {  # Concurrent requests per host in the asyncio pipeline
+        'pocket.limitlesstcg.com': 10,
+        'r2.limitlesstcg.net': 4
+    },
+    'HOST_RATES': {  # Requests per second per host, halved while a host answers 429
+        'pocket.limitlesstcg.com': 8,
+        'r2.limitlesstcg.net': 20
+    },
+    'MAX_RETRIES': 3,  # Passes over the retry queue at the end of a run
+    'RETRY_DELAY': 2,  # Seconds before the first retry pass, doubled per pass
+    'QUEUE_SIZE': 200,  # Bound on items waiting between pipeline stages
+    'UPSERT_BATCH_SIZE': 50,  # Most cards the pipeline writes in one database transaction
+    'ENGINE': 'http',  # 'http' (pooled requests) or 'selenium' (headless Edge)
+    'DRIVER_MAX_PAGES': 50,  # Pages a pooled browser serves before it is recycled
+    'HTTP_CACHE_DIR': os.path.join(SCRIPT_DIR, ".http_cache"),
+    'HTTP_CACHE_MAX_MB': 200,
+    'CHECKPOINT_FILE': os.path.join(SCRIPT_DIR, ".checkpoints", "cards.jsonl"),
+    'CHECKPOINT_EVERY': 25,  # Journal records buffered before a flush
+    'CHECKPOINT_SECONDS': 10,  # Maximum age of a buffered journal record
+    'METRICS_FILE': os.path.join(SCRIPT_DIR, "metrics", "{command}.json"),  # Per-stage timers and counters
+    'STORAGE': 'json',  # 'json' (in-memory store, saved as card_data.json) or 'sqlite' (SQLITE_FILE, JSON is an export)
+    'SQLITE_FILE': os.path.join(SCRIPT_DIR, "ptcgp.sqlite3"),
     'WEBDRIVER_OPTIONS': {
         'headless': True,
         'log_level': 'OFF',
@@ -41,31 +80,15 @@ CONFIG = {
     }
 }
 
-# Ensure log directory exists
-os.makedirs(SCRIPT_DIR, exist_ok=True)
-# Ensure icon directory exists
-os.makedirs(CONFIG['ICON_FOLDER'], exist_ok=True)
-
-# Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(CONFIG['LOG_FILE'], mode='w', encoding='utf-8')
-    ]
-)
 logger = logging.getLogger('CardScraper')
 
 class CardDatabase:
     def __init__(self, reset=False):
         self.reset = reset
-        self.df = pd.DataFrame(columns=[
-            '_id', 'setNumber', 'setName', 'cardNumber', 
-            'cardName', 'cardElement', 'cardType', 'cardSubtype',
-            'evolvesFrom', 'webLink', 'iconPath', 'finalEvolution'
-        ])
-        self.df.set_index('_id', inplace=True)
+        self.store = SqliteCardStore(CONFIG['SQLITE_FILE']) if CONFIG['STORAGE'] == 'sqlite' else CardStore()
+        self.evolutions = EvolutionGraph()
+        self.icon_atlas = None
+        self._upsert_lock = threading.Lock()
         
     @staticmethod
     def generate_card_key(set_number, card_number):
@@ -73,30 +96,33 @@ class CardDatabase:
         return f"{set_number}-{card_number}"
 
     def load_existing_data(self):
-        """Load existing card data from JSON if it exists"""
+        """Load existing card data from the SQLite store or from JSON if it exists"""
         try:
             if self.reset:
+                # The old file stays in place until the atomic save replaces it
                 logger.info("Reset flag is set. Starting fresh.")
-                if os.path.exists(CONFIG['OUTPUT_FILE']):
-                    os.remove(CONFIG['OUTPUT_FILE'])
+                if isinstance(self.store, SqliteCardStore):
+                    self.store.clear()
                 return
 
-            if os.path.exists(CONFIG['OUTPUT_FILE']):
+            if isinstance(self.store, SqliteCardStore) and len(self.store):
+                # Only the graph is rebuilt; card rows stay in the database
+                self.evolutions.add_many(self.store.iter_export())
+                self.icon_atlas = self.store.get_value('iconAtlas')
+                logger.info(f"Loaded {len(self.store)} existing cards from {CONFIG['SQLITE_FILE']}")
+            elif os.path.exists(CONFIG['OUTPUT_FILE']):
                 with open(CONFIG['OUTPUT_FILE'], 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     cards_data = data.get('cards', data)
+                    self.store.upsert_many(cards_data.items())
+                    self.evolutions.add_many(cards_data.items())
+                    # Stored flags are refreshed once from the graph; upserts keep them current
+                    self.apply_final_evolutions({name: self.evolutions.is_final(name) for name in self.store.values_of('cardName')})
+                    self.icon_atlas = data.get('iconAtlas') if 'cards' in data else None
+                    if isinstance(self.store, SqliteCardStore):
+                        self.store.set_value('iconAtlas', self.icon_atlas)
                     
-                    # Convert dict to DataFrame
-                    df_data = []
-                    for key, card in cards_data.items():
-                        card['_id'] = key
-                        df_data.append(card)
-                    
-                    if df_data:
-                        self.df = pd.DataFrame(df_data)
-                        self.df.set_index('_id', inplace=True)
-                    
-                logger.info(f"Loaded {len(self.df)} existing cards from JSON")
+                logger.info(f"Loaded {len(self.store)} existing cards from JSON")
             else:
                 logger.info("No existing data found. Starting fresh.")
         except Exception as e:
@@ -105,80 +131,113 @@ class CardDatabase:
     def card_exists(self, set_number, card_number):
         """Check if a card already exists in the database"""
         key = self.generate_card_key(set_number, card_number)
-        try:
-            return key in self.df.index
-        except Exception as e:
-            logger.error(f"Error checking if card exists {key}: {str(e)}")
-            return False
+        return key in self.store
 
     def get_card(self, set_number, card_number):
         """Get a card from the database"""
         key = self.generate_card_key(set_number, card_number)
-        try:
-            if key in self.df.index:
-                return self.df.loc[key].to_dict()
-            return None
-        except Exception as e:
-            logger.error(f"Error getting card {key}: {str(e)}")
-            return None
+        return self.store.get(key)
 
     def save_data_to_json(self):
-        """Save the database contents to a JSON file"""
+        """Save the database contents to a JSON file, with the evolution graph next to it.
+
+        Returns:
+            bool: True if both files were written
+        """
         try:
-            # Convert DataFrame to dict format
-            cards_dict = {}
-            sorted_indices = sorted(self.df.index, key=lambda x: (
-                x.split('-')[0],  # Sort by set number first
-                int(x.split('-')[1])  # Then sort by card number as integer
-            ))
-            
-            for idx in sorted_indices:
-                cards_dict[idx] = self.df.loc[idx].to_dict()
-            
-            output_data = {"cards": cards_dict}
-            
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(CONFIG['OUTPUT_FILE']), exist_ok=True)
-            
-            with open(CONFIG['OUTPUT_FILE'], 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # Stream cards into a temp file and atomically replace the output
+            extra = [('iconAtlas', self.icon_atlas)] if self.icon_atlas else None
+            if isinstance(self.store, SqliteCardStore):
+                self.store.set_value('iconAtlas', self.icon_atlas)
+            with timer('json_save'):
+                write_json_object_stream(CONFIG['OUTPUT_FILE'], self.store.iter_export(), indent=2, wrap_key="cards", extra=extra)
+                saved = self.evolutions.save(CONFIG['EVOLUTION_GRAPH_FILE'])
             logger.info(f"Data saved to {CONFIG['OUTPUT_FILE']}")
+            return saved
         except Exception as e:
             logger.error(f"Error saving data to JSON: {e}")
+            return False
+
+    def save_deck_resolver(self):
+        """Build the deck resolver from the final card set and save it; called once at the end of a scrape"""
+        with timer('json_save'):
+            DeckResolver.build(self.store.iter_export(), archetype_names(CONFIG['TOURNAMENT_META_FILE'])).save(CONFIG['DECK_RESOLVER_FILE'])
 
     def upsert_card(self, card_info):
-        """Insert or update card information in the database"""
-        try:
-            card_id = card_info.pop('_id')
-            self.df.loc[card_id] = pd.Series(card_info)
-        except Exception as e:
-            logger.error(f"Error upserting card {card_info.get('_id')}: {str(e)}")
+        """Insert or update one card. Returns True if it was stored."""
+        return bool(self.upsert_cards([card_info]))
+
+    def upsert_cards(self, card_infos):
+        """Insert or update a batch of cards in a single store transaction.
+
+        Each card goes into the evolution graph first; the batch is then
+        written in one upsert_many call together with the other printings
+        whose final evolution flag it changed.
+
+        Returns:
+            list: Ids of the cards that were stored
+        """
+        with timer('db_upsert'), self._upsert_lock:
+            batch, changed = {}, set()
+            for card_info in card_infos:
+                card_id = card_info.pop('_id', None)
+                try:
+                    changed.update(self.evolutions.add(card_id, card_info))
+                    batch[card_id] = card_info
+                except Exception as e:
+                    logger.error(f"Error upserting card {card_id}: {str(e)}")
+            for card_info in batch.values():
+                card_info['finalEvolution'] = self.evolutions.is_final(card_info.get('cardName') or '')
 
-    def process_final_evolutions(self):
-        """Process all cards to determine if they are final evolutions"""
-        try:
-            # Get all cards that are evolved from
-            evolved_from_cards = set(self.df[self.df['evolvesFrom'].notna()]['evolvesFrom'])
-            
-            # Mark final evolution status
-            self.df['finalEvolution'] = ~self.df['cardName'].isin(evolved_from_cards)
-            
-            logger.info("Processed final evolution status")
-            self.save_data_to_json()
-            return True
-        except Exception as e:
-            logger.error(f"Error processing final evolutions: {e}")
-            return False
+            rows = self._final_evolution_rows({name: self.evolutions.is_final(name) for name in changed}, skip=batch)
+            rows.update(batch)
+            try:
+                self.store.upsert_many(rows.items())
+            except Exception as e:
+                logger.error(f"Error upserting cards {', '.join(map(str, batch))}: {str(e)}")
+                return []
+            return list(batch)
+
+    def _final_evolution_rows(self, flags, skip=()):
+        """Returns {card_id: card} for stored printings whose final evolution flag differs from flags."""
+        rows = {}
+        for name, final in flags.items():
+            for card_id in self.store.ids_by('cardName', name):
+                if card_id in skip:
+                    continue
+                card = self.store.get(card_id)
+                if card is not None and card.get('finalEvolution') != final:
+                    card['finalEvolution'] = final
+                    rows[card_id] = card
+        return rows
+
+    def apply_final_evolutions(self, flags):
+        """Writes {card name: final evolution flag} to every printing of each name."""
+        self.store.upsert_many(self._final_evolution_rows(flags).items())
 
 class CardScraper:
-    def __init__(self, database, latest_only=False):
+    def __init__(self, database, latest_only=False, engine=None, resume=False):
         self.database = database
-        self.max_retries = 3
-        self.retry_delay = 2  # seconds
+        self.max_retries = CONFIG['MAX_RETRIES']
+        self.retry_delay = CONFIG['RETRY_DELAY']  # seconds
+        self.retry_queue = RetryQueue()
+        self.resume = resume
+        self.journal = CheckpointJournal(CONFIG['CHECKPOINT_FILE'], CONFIG['CHECKPOINT_EVERY'],
+                                         CONFIG['CHECKPOINT_SECONDS'])
         self.latest_only = latest_only
+        self.engine = engine or CONFIG['ENGINE']
+        self.manifest = SetManifest(CONFIG['MANIFEST_FILE'])
+        self.icons = IconStore(CONFIG['ICON_FOLDER'], CONFIG['ICON_WEBPATH'], CONFIG['ICON_MANIFEST_FILE'])
+        self.atlas = IconAtlas(CONFIG['ICON_ATLAS_FOLDER'], CONFIG['ICON_ATLAS_WEBPATH'],
+                               CONFIG['ICON_WEBPATH'], CONFIG['ICON_ATLAS_STATE_FILE'])
+        self.driver_pool = WebDriverPool(self.create_new_driver, CONFIG['MAX_WORKERS'], CONFIG['DRIVER_MAX_PAGES'])
         
     def create_new_driver(self):
         """Creates a new WebDriver instance."""
+        from selenium import webdriver
+        from selenium.webdriver.edge.options import Options
+        from selenium.webdriver.edge.service import Service
+
         edge_options = Options()
         edge_options.add_argument("--headless")
         edge_options.add_argument("--log-level=OFF")
@@ -189,78 +248,54 @@ class CardScraper:
         return webdriver.Edge(service=service, options=edge_options)
 
     def download_card_icon(self, card_name):
-        """Downloads the icon for a given card name if it doesn't exist."""
-        # Get card name and convert to lowercase
-        card_name_lower = card_name.strip().lower()
-        name_parts = card_name_lower.split()
-
-        # Remove 'ex' from the end of the card name if it exists
-        if len(name_parts) >= 2 and name_parts[-1].lower() == 'ex':
-            card_name_lower = ' '.join(name_parts[:-1])
-
-        # Remove all spaces from the card name
-        card_name_lower = card_name_lower.replace(" ", "")
-
-        # Replace periods with hyphens
-        card_name_lower = card_name_lower.replace(".", "-")
-
-        # Remove a list of words from the card name 
-        remove_words = ["paldean"]
-        for word in remove_words:   
-            card_name_lower = card_name_lower.replace(word, "")
-
-        # Create paths
-        icon_url = f"{CONFIG['CARD_ICON_URL']}{card_name_lower}.png"
-        icon_path = os.path.join(CONFIG['ICON_FOLDER'], f"{card_name_lower}.png")
-        icon_web_path = os.path.join(CONFIG['ICON_WEBPATH'], f"{card_name_lower}.png")
-
-        # Check if image already exists locally
-        if os.path.exists(icon_path):
-            logger.info(f"Image already exists for {card_name}")
-            return icon_web_path
-
-        # Check if the image exists at url
-        response = requests.head(icon_url)
-        if response.status_code == 200:
-            # Download the image
-            img_response = requests.get(icon_url)
-            with open(icon_path, 'wb') as f:
-                f.write(img_response.content)
-            logger.info(f"Downloaded card image for {card_name}")
-            return icon_web_path
-        else:
-            logger.info(f"No image found for {card_name}")
-            return None
+        """Returns the icon path for a card name, downloading the icon once per alias."""
+        return self.icons.get_or_fetch(normalize_icon_name(card_name), CONFIG['CARD_ICON_URL'])
+
+    def save_icons(self):
+        """Persists the icon manifest, regenerates iconsList.js and repacks new icons into the atlas."""
+        with timer('icon_io'):
+            self.icons.save()
+            self.icons.write_icons_list(CONFIG['ICONS_LIST_FILE'])
+        try:
+            with timer('atlas_build'):
+                atlas_map = self.atlas.build(self.icons.files(), CONFIG['ICON_FOLDER'])
+            if atlas_map:
+                self.database.icon_atlas = atlas_map
+        except Exception as e:
+            logger.error(f"Error building icon atlas: {e}")
 
     def retrieve_missing_icons(self):
         """Loads existing card data and attempts to download missing icons."""
         logger.info("Starting icon retrieval for cards with missing icons...")
         
         try:
-            # Load existing card data
-            with open(CONFIG['OUTPUT_FILE'], 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                cards_data = data.get('cards', {})
+            self.database.load_existing_data()
+            store = self.database.store
+
+            # Resolve each distinct icon alias once, concurrently
+            missing = {}
+            for card_id in store.ids():
+                card_info = store.get(card_id)
+                if card_info.get('cardType') == 'Pokémon' and not card_info.get('iconPath'):
+                    missing[card_id] = normalize_icon_name(card_info['cardName'])
+            logger.info(f"{len(missing)} cards are missing an icon")
+            self.icons.load()
+            icon_host = urlparse(CONFIG['CARD_ICON_URL']).hostname
+            icon_paths = self.icons.fetch_many(missing.values(), CONFIG['CARD_ICON_URL'],
+                                               max_workers=CONFIG['HOST_LIMITS'].get(icon_host, 4))
 
             updated_count = 0
-            for card_id, card_info in cards_data.items():
-                if card_info.get('cardType') == 'Pokémon':
-                    if not card_info.get('iconPath'):
-                        # Attempt to download icon
-                        logger.info(f"Attempt to retreive icon for {card_info['cardName']}")
-                        icon_path = self.download_card_icon(card_info['cardName'])
-                        if icon_path:
-                            cards_data[card_id]['iconPath'] = icon_path
-                            updated_count += 1
-                    else:
-                        logger.info(f"Icon already exists for {card_info['cardName']}")
-                else:
-                    logger.info(f"Not attempting icon for a non-Pokemon card - {card_info['cardName']}")
+            for card_id, alias in missing.items():
+                if icon_paths.get(alias):
+                    store.set_field(card_id, 'iconPath', icon_paths[alias])
+                    updated_count += 1
+            atlas_before = self.database.icon_atlas
+            self.save_icons()
 
             # Save updated data
-            if updated_count > 0:
-                with open(CONFIG['OUTPUT_FILE'], 'w', encoding='utf-8') as f:
-                    json.dump({"cards": cards_data}, f, indent=2, ensure_ascii=False)
+            if updated_count > 0 or self.database.icon_atlas != atlas_before:
+                if not self.database.save_data_to_json():
+                    return False
                 logger.info(f"Updated {updated_count} cards with new icons")
             else:
                 logger.info("No new icons were added")
@@ -270,142 +305,234 @@ class CardScraper:
             logger.error(f"Error during icon retrieval: {e}")
             return False
 
-    def scrape_card_info(self, url, set_code, set_name):
-        """Worker function that scrapes a single card's information."""
-        if not url:
-            logger.error("Empty URL provided")
-            return None
-            
-        driver = None
-        try:
-            # Parse URL for card identification
+    def fetch_card_page_selenium(self, url):
+        """Loads a card page in a pooled browser and returns the fields needed to build card info."""
+        with self.driver_pool.driver() as driver:
             try:
-                path_parts = url.split('/')
-                if len(path_parts) < 2:
-                    raise ValueError(f"Invalid URL format: {url}")
-                set_number = path_parts[-2]
-                card_number = path_parts[-1]
-            except Exception as e:
-                logger.error(f"URL parsing error: {url} - {str(e)}")
-                return None
-            
-            # Check existing card
-            if self.database.card_exists(set_number, card_number):
-                card_key = self.database.generate_card_key(set_number, card_number)
-                card = self.database.get_card(set_number, card_number)
-                logger.info(f"Card {card_key} ({card['cardName']}): already exists, skipping...")
-                return None
-
-            # Initialize webdriver
-            try:
-                driver = self.create_new_driver()
-                driver.get(url)
+                with timer('page_load'):
+                    driver.get(url)
             except Exception as e:
                 logger.error(f"Browser initialization error for {url}: {str(e)}")
-                return None
-            
+                raise TransientRequestError(url, "browser error") from e
+
             # Wait for and verify page load
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "card-text"))
-                )
+                wait_for_element(driver, By.CLASS_NAME, "card-text")
             except Exception as e:
                 logger.error(f"Page load timeout for {url}: {str(e)}")
-                return None
+                raise TransientRequestError(url, "page load timeout") from e
+
+            def element_text(class_name):
+                elements = driver.find_elements(By.CLASS_NAME, class_name)
+                return elements[0].text if elements else None
+
+            with timer('parse'):
+                return {
+                    "url": driver.current_url,
+                    "title": driver.title,
+                    "prints": element_text("prints-current-details"),
+                    "name": element_text("card-text-name"),
+                    "typeTitle": element_text("card-text-title"),
+                    "stage": element_text("card-text-type"),
+                }
 
-            if "Error" in driver.title or "404" in driver.title:
-                logger.error(f"Page not found or error page: {url}")
-                return None
+    def fetch_card_page_http(self, url):
+        """Fetches a card page over pooled HTTP and returns the fields needed to build card info."""
+        try:
+            response, document = httpFetch.fetch_document(url)
+        except TransientRequestError:
+            raise
+        except Exception as e:
+            logger.error(f"Request error for {url}: {str(e)}")
+            return None
 
-            # Check if card is a diamond card
-            try:
-                prints_details = driver.find_element(By.CLASS_NAME, "prints-current-details")
-                if "◊" not in prints_details.text:
-                    logger.info(f"Not a diamond card at {url}")
-                    return None
-            except Exception as e:
-                logger.error(f"Failed to check diamond status for {url}: {str(e)}")
+        if response.status_code != 200 or document.find(class_name="card-text") is None:
+            logger.error(f"Page load failed for {url}: HTTP {response.status_code}")
+            return None
+
+        def element_text(class_name):
+            element = document.find(class_name=class_name)
+            return element.text if element else None
+
+        return {
+            "url": response.url,
+            "title": httpFetch.page_title(document),
+            "prints": element_text("prints-current-details"),
+            "name": element_text("card-text-name"),
+            "typeTitle": element_text("card-text-title"),
+            "stage": element_text("card-text-type"),
+        }
+
+    def fetch_card_page(self, url):
+        """Fetches a card page with the configured engine.
+
+        Raises:
+            TransientRequestError: When the page could not be loaded for a reason worth retrying
+        """
+        if self.engine == 'selenium':
+            return self.fetch_card_page_selenium(url)
+        return self.fetch_card_page_http(url)
+
+    def parse_card_url(self, url):
+        """Returns (set_number, card_number) for a card URL, or None if the card should be skipped."""
+        if not url:
+            logger.error("Empty URL provided")
+            return None
+
+        # Parse URL for card identification
+        try:
+            path_parts = url.split('/')
+            if len(path_parts) < 2:
+                raise ValueError(f"Invalid URL format: {url}")
+            set_number = path_parts[-2]
+            card_number = path_parts[-1]
+        except Exception as e:
+            logger.error(f"URL parsing error: {url} - {str(e)}")
+            return None
+
+        # Check existing card
+        if self.database.card_exists(set_number, card_number):
+            card_key = self.database.generate_card_key(set_number, card_number)
+            card = self.database.get_card(set_number, card_number)
+            logger.info(f"Card {card_key} ({card['cardName']}): already exists, skipping...")
+            self.manifest.mark_resolved(set_number, card_number)
+            increment('cards_skipped_existing')
+            return None
+
+        return set_number, card_number
+
+    def build_card_info(self, url, page, set_number, card_number, set_name):
+        """Builds card info from fetched page fields. The icon path is filled in separately."""
+        if "Error" in page["title"] or "404" in page["title"]:
+            logger.error(f"Page not found or error page: {url}")
+            return None
+
+        # Check if card is a diamond card
+        if page["prints"] is None:
+            logger.error(f"Failed to check diamond status for {url}: prints-current-details not found")
+            return None
+        if "◊" not in page["prints"]:
+            logger.info(f"Not a diamond card at {url}")
+            self.resolve_card(set_number, card_number)
+            return None
+
+        # Get card name (required)
+        card_name = (page["name"] or "").strip()
+        if not card_name:
+            logger.error(f"Empty card name at {url}")
+            return None
+
+        # Get card type (optional)
+        try:
+            card_element = re.split(r'\s-\s', page["typeTitle"])[1].strip()
+        except Exception as e:
+            logger.warning(f"Could not get card type for {card_name} at {url}: {str(e)}")
+            card_element = ""
+
+        # Get type and subtype
+        try:
+            stage_text = page["stage"]
+            evolves_from = ""
+            if "Evolves from" in stage_text:
+                evolves_from = stage_text.split("Evolves from")[1].split()[0].strip()
+            card_type = stage_text.split(' - ')[0].strip() if '-' in stage_text else ""
+            card_subtype = re.split(r'\s-\s', stage_text)[1].strip()
+        except Exception as e:
+            logger.warning(f"Could not get evolution info for {card_name} at {url}: {str(e)}")
+            card_type = ""
+            card_subtype = ""
+            evolves_from = ""
+
+        # Only Pokémon cards are tracked
+        if card_type != "Pokémon":
+            logger.info(f"Not a Pokémon card at {url}")
+            self.resolve_card(set_number, card_number)
+            return None
+
+        return {
+            "_id": self.database.generate_card_key(set_number, card_number),
+            "setNumber": set_number,
+            "setName": set_name,
+            "cardNumber": card_number,
+            "cardName": card_name,
+            "cardElement": card_element,
+            "cardType": card_type,
+            "cardSubtype": card_subtype,
+            "evolvesFrom": evolves_from,
+            "webLink": page["url"],
+            "iconPath": None,
+            "finalEvolution": False
+        }
+
+    def resolve_card(self, set_number, card_number):
+        """Marks a card as permanently skipped in the manifest and the checkpoint journal."""
+        self.manifest.mark_resolved(set_number, card_number)
+        self.journal.record('resolved', set=set_number, card=card_number)
+        increment('cards_skipped_filtered')
+
+    def save_card_info(self, card_info):
+        """Upserts scraped card info into the database."""
+        saved = self.save_card_infos([card_info])
+        return saved[0] if saved else None
+
+    def save_card_infos(self, card_infos):
+        """Upserts a batch of scraped cards in one database transaction.
+
+        Returns:
+            list: The cards that were saved
+        """
+        try:
+            for card_info in card_infos:
+                logger.info(f"Scraped card: {card_info['cardName']} - ({card_info['_id']})")
+            stored = set(self.database.upsert_cards([dict(card_info) for card_info in card_infos]))
+            saved = [card_info for card_info in card_infos if card_info['_id'] in stored]
+            for card_info in saved:
+                self.manifest.mark_resolved(card_info['setNumber'], card_info['cardNumber'])
+                self.journal.record('card', card=card_info)
+                increment('cards_saved')
+            return saved
+        except Exception as e:
+            logger.error(f"Failed to save cards {', '.join(str(card_info.get('_id')) for card_info in card_infos)}: {str(e)}")
+            return []
+
+    def scrape_card_info(self, url, set_code, set_name):
+        """Worker function that scrapes a single card's information."""
+        try:
+            card_ref = self.parse_card_url(url)
+            if card_ref is None:
                 return None
-            
-            # Get card name (required)
-            try:
-                name_element = driver.find_element(By.CLASS_NAME, "card-text-name")
-                card_name = name_element.text.strip()
-                if not card_name:
-                    logger.error(f"Empty card name at {url}")
-                    return None
-            except Exception as e:
-                logger.error(f"Failed to get card name at {url}: {str(e)}")
+            set_number, card_number = card_ref
+
+            page = self.fetch_card_page(url)
+            if page is None:
                 return None
-            
-            # Get card type (optional)
-            try:
-                type_text = driver.find_element(By.CLASS_NAME, "card-text-title").text
-                card_element = re.split(r'\s-\s', type_text)[1].strip()
-            except Exception as e:
-                logger.warning(f"Could not get card type for {card_name} at {url}: {str(e)}")
-                card_element = ""
-                
-            # Get type and subtype
-            try:
-                stage_text = driver.find_element(By.CLASS_NAME, "card-text-type").text
-                evolves_from = ""
-                if "Evolves from" in stage_text:
-                    evolves_from = stage_text.split("Evolves from")[1].split()[0].strip()
-                card_type = stage_text.split(' - ')[0].strip() if '-' in stage_text else ""
-                card_subtype = re.split(r'\s-\s', stage_text)[1].strip()
-            except Exception as e:
-                logger.warning(f"Could not get evolution info for {card_name} at {url}: {str(e)}")
-                card_type = ""
-                card_subtype = ""
-                evolves_from = ""
-            
-            # Try to download card icon if it is a Pokémon card
-            if card_type == "Pokémon":
-                icon_path = self.download_card_icon(card_name)
 
-            # Create and save card info
-            try:
-                card_info = {
-                    "_id": self.database.generate_card_key(set_number, card_number),
-                    "setNumber": set_number,
-                    "setName": set_name,
-                    "cardNumber": card_number,
-                    "cardName": card_name,
-                    "cardElement": card_element,
-                    "cardType": card_type,
-                    "cardSubtype": card_subtype,
-                    "evolvesFrom": evolves_from,
-                    "webLink": driver.current_url,
-                    "iconPath": icon_path,
-                    "finalEvolution": False
-                }
-                
-                logger.info(f"Scraped card: {card_info["cardName"]} - ({card_info["_id"]})")
-                self.database.upsert_card(card_info)
-                return card_info
-            except Exception as e:
-                logger.error(f"Failed to save card info for {card_name} at {url}: {str(e)}")
+            card_info = self.build_card_info(url, page, set_number, card_number, set_name)
+            if card_info is None:
                 return None
-                
+
+            card_info["iconPath"] = self.download_card_icon(card_info["cardName"])
+            return self.save_card_info(card_info)
+        except TransientRequestError as e:
+            logger.warning(f"Deferring card at {url}: {e}")
+            self.retry_queue.defer(url, self.scrape_card_info, url, set_code, set_name)
+            return None
         except Exception as e:
             logger.error(f"Unexpected error scraping card at {url}: {str(e)}")
             return None
-        finally:
-            if driver:                
-                try:
-                    driver.quit()
-                except Exception as e:
-                    logger.warning(f"Failed to close browser for {url}: {str(e)}")
 
-    def scrape_set_info(self, driver):
-        """Gathers set information from the main page."""
+    def scrape_set_info(self, driver=None):
+        """Gathers set information from the main page, over HTTP when no driver is given."""
         logger.info("Gathering set information...")
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr"))
-        )
-        
-        rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+        if driver is None:
+            _, document = httpFetch.fetch_document(CONFIG['CARD_URL'])
+            rows = document.find_elements(By.CSS_SELECTOR, "table tbody tr")
+        else:
+            with timer('page_load'):
+                driver.get(CONFIG['CARD_URL'])
+            wait_for_element(driver, By.CSS_SELECTOR, "table tbody tr", timeout=30)
+            rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+
         set_links = []
         
         for i, row in enumerate(rows):
@@ -435,49 +562,128 @@ class CardScraper:
         logger.info(f"Found {len(set_links)} sets")
         return set_links
 
+    def scrape_card_links(self, set_link, driver=None):
+        """Lists the card URLs of a set that are missing from the set manifest.
+
+        Uses HTTP when no driver is given.
+        """
+        if driver is None:
+            _, document = httpFetch.fetch_document(set_link['url'])
+            card_elements = document.find_elements(By.CSS_SELECTOR, ".card-search-grid a")
+        else:
+            with timer('page_load'):
+                driver.get(set_link['url'])
+            wait_for_element(driver, By.CSS_SELECTOR, ".card-search-grid a")
+            card_elements = driver.find_elements(By.CSS_SELECTOR, ".card-search-grid a")
+
+        card_links = [elem.get_attribute("href") for elem in card_elements]
+        logger.info(f"Found {len(card_links)} cards in set {set_link['setCode']}")
+        return self.manifest.diff(set_link, card_links)
+
+    def scrape_set_cards(self, set_link):
+        """Lists and scrapes one set sequentially. Used to retry a set whose listing failed."""
+        for url in self.scrape_card_links(set_link):
+            self.scrape_card_info(url, set_link['setCode'], set_link['setName'])
+
+    def scrape_all_sets(self):
+        """Discovers and scrapes every set sequentially. Used to retry a set discovery that failed."""
+        for set_link in self.scrape_set_info():
+            try:
+                self.scrape_set_cards(set_link)
+            except TransientRequestError as e:
+                logger.warning(f"Deferring set {set_link['setCode']}: {e}")
+                self.retry_queue.defer(set_link['url'], self.scrape_set_cards, set_link)
+
+    def retry_failed(self):
+        """Drains the retry queue, giving transiently failed cards and sets another chance."""
+        if not len(self.retry_queue):
+            return
+        logger.info(f"Retrying {len(self.retry_queue)} failed requests...")
+        still_failing = self.retry_queue.drain(self.max_retries, self.retry_delay)
+        for url in still_failing:
+            logger.error(f"Giving up on {url} until the next run")
+
+    def scrape_sets_selenium(self):
+        """Scrapes all sets one at a time, fetching each set's cards with a thread pool."""
+        with self.driver_pool.driver() as main_driver:
+            set_links = self.scrape_set_info(main_driver)
+
+        for i, set_link in enumerate(set_links, 1):
+            logger.info(f"Processing set {i}/{len(set_links)}: {set_link['setName']} ({set_link['setCode']})")
+
+            # Release the listing driver before dispatching so workers can use it
+            with self.driver_pool.driver() as main_driver:
+                card_links = self.scrape_card_links(set_link, main_driver)
+
+            with ThreadPoolExecutor(max_workers=CONFIG['MAX_WORKERS']) as executor:
+                future_to_url = {
+                    executor.submit(self.scrape_card_info, url, set_link['setCode'], set_link['setName']): url
+                    for url in card_links
+                }
+
+                completed = 0
+                for future in as_completed(future_to_url):
+                    completed += 1
+                    logger.info(f"Progress: {completed}/{len(card_links)} cards processed")
+
+    def start_checkpoint(self):
+        """Replays the journal of an interrupted run when resuming, otherwise starts a new one."""
+        header, records = self.journal.read() if self.resume else (None, [])
+        if header is None:
+            if self.resume:
+                logger.info("No checkpoint to resume, starting a full run")
+            self.journal.start(command='cards', reset=self.database.reset, latestOnly=self.latest_only)
+            return
+
+        card_infos = [record['card'] for record in records if record['type'] == 'card']
+        self.database.upsert_cards([dict(card_info) for card_info in card_infos])
+        cards, resolved = len(card_infos), 0
+        for record in records:
+            if record['type'] == 'card':
+                self.manifest.mark_resolved(record['card']['setNumber'], record['card']['cardNumber'])
+            elif record['type'] == 'resolved':
+                self.manifest.mark_resolved(record['set'], record['card'])
+                resolved += 1
+        self.journal.reopen()
+        increment('cards_resumed', cards)
+        logger.info(f"Resumed run started {header['started']}: {cards} cards and {resolved} skipped cards restored")
+
     def run(self):
         """Main function to scrape card data with parallel processing."""
         start_time = time.time()
-        main_driver = None
         
         try:
             logger.info("Loading existing card data...")
             self.database.load_existing_data()
+            if self.database.reset:
+                self.manifest.reset()
+            else:
+                self.manifest.load()
+            self.icons.load()
+            self.start_checkpoint()
             
             logger.info("Initializing scraper...")
-            main_driver = self.create_new_driver()
-            main_driver.get(CONFIG['CARD_URL'])
-            
-            set_links = self.scrape_set_info(main_driver)
-            
-            for i, set_link in enumerate(set_links, 1):
-                logger.info(f"Processing set {i}/{len(set_links)}: {set_link['setName']} ({set_link['setCode']})")
-                
-                main_driver.get(set_link['url'])
-                WebDriverWait(main_driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".card-search-grid a"))
-                )
-                
-                card_elements = main_driver.find_elements(By.CSS_SELECTOR, ".card-search-grid a")
-                card_links = [elem.get_attribute("href") for elem in card_elements]
-                logger.info(f"Found {len(card_links)} cards in set {set_link['setCode']}")
-                
-                with ThreadPoolExecutor(max_workers=CONFIG['MAX_WORKERS']) as executor:
-                    future_to_url = {
-                        executor.submit(self.scrape_card_info, url, set_link['setCode'], set_link['setName']): url
-                        for url in card_links
-                    }
-                    
-                    completed = 0
-                    for future in as_completed(future_to_url):
-                        completed += 1
-                        logger.info(f"Progress: {completed}/{len(card_links)} cards processed")
-            
-            self.database.save_data_to_json()
-            
-            # Process final evolutions after scraping
-            logger.info("Processing final evolution status...")
-            self.database.process_final_evolutions()
+            if self.engine == 'selenium':
+                self.scrape_sets_selenium()
+            else:
+                import asyncio
+                from cardPipeline import CardPipeline
+
+                pipeline = CardPipeline(self, CONFIG['CARD_URL'], CONFIG['CARD_ICON_URL'],
+                                        CONFIG['HOST_LIMITS'], CONFIG['QUEUE_SIZE'], CONFIG['UPSERT_BATCH_SIZE'])
+                asyncio.run(pipeline.run())
+
+            self.retry_failed()
+
+            self.save_icons()
+            if not self.database.save_data_to_json():
+                # The set manifest would mark these sets unchanged; the journal lets --resume save them again
+                logger.error("Saving card data failed; keeping the checkpoint journal and the previous set manifest")
+                return False
+            self.database.save_deck_resolver()
+            with timer('json_save'):
+                self.manifest.save()
+            self.journal.close(completed=True)
             
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -488,35 +694,81 @@ class CardScraper:
             logger.error(f"An error occurred during main scraping: {e}")
             return False
         finally:
-            if main_driver:
-                main_driver.quit()
+            self.journal.close()
+            self.driver_pool.close()
+
+def add_cli_arguments(parser, command='cards'):
+    """Adds the options of the 'cards' or 'icons' command to parser."""
+    if command == 'cards':
+        parser.add_argument('--reset', action='store_true', default=False,
+                           help='Reset the database and ignore existing data')
+        parser.add_argument('--latest-only', action='store_true', default=False,
+                           help='Grab only the latest sets and cards')
+        parser.add_argument('--engine', choices=['http', 'selenium'], default=CONFIG['ENGINE'],
+                           help='Fetch card pages over pooled HTTP (default) or with a headless browser')
+        parser.add_argument('--resume', action='store_true', default=False,
+                           help='Continue an interrupted run from its checkpoint journal')
+    parser.add_argument('--no-cache', action='store_true', default=False,
+                       help='Bypass the conditional-GET HTTP cache')
+    parser.add_argument('--storage', choices=['json', 'sqlite'], default=CONFIG['STORAGE'],
+                       help='Keep cards in memory and rewrite card_data.json (default), or in an SQLite database with JSON as an export')
+    parser.add_argument('--metrics-file', default=None,
+                       help='Where to write per-stage timers and counters as JSON (default: scraper/metrics/<command>.json)')
+    parser.add_argument('--prometheus-file', default=None,
+                       help='Also write the metrics in Prometheus text format (e.g. for a textfile collector)')
+
+def run_cli(args, command='cards'):
+    """Runs the 'cards' scrape or the 'icons' backfill with parsed arguments."""
+    setup_logging(CONFIG['LOG_FILE'])
+    METRICS.reset(command)
+    engine = getattr(args, 'engine', CONFIG['ENGINE'])
+    reset = getattr(args, 'reset', False)
+    CONFIG['STORAGE'] = getattr(args, 'storage', CONFIG['STORAGE'])
+
+    logger.info(f"Starting scraper with {CONFIG['MAX_WORKERS']} concurrent workers ({engine} engine)...")
+    httpFetch.configure(
+        pool_size=CONFIG['MAX_WORKERS'],
+        cache_dir="" if args.no_cache else CONFIG['HTTP_CACHE_DIR'],
+        cache_max_bytes=CONFIG['HTTP_CACHE_MAX_MB'] * 1024 * 1024,
+        host_rates=CONFIG['HOST_RATES']
+    )
+    
+    resume = getattr(args, 'resume', False)
+    latest_only = getattr(args, 'latest_only', False)
+    if resume:
+        # An interrupted run is continued in the mode it was started with
+        header, _ = CheckpointJournal(CONFIG['CHECKPOINT_FILE']).read()
+        if header:
+            reset = header.get('reset', reset)
+            latest_only = header.get('latestOnly', latest_only)
+
+    database = CardDatabase(reset=reset)
+    scraper = CardScraper(database, latest_only, engine=engine, resume=resume)
+    
+    try:
+        if command == 'icons':
+            logger.info("Running in icons-only mode")
+            success = scraper.retrieve_missing_icons()
+        else:
+            if reset:
+                logger.info("Reset mode enabled - existing data will be ignored")
+            success = scraper.run()
+    finally:
+        METRICS.export(getattr(args, 'metrics_file', None) or CONFIG['METRICS_FILE'].format(command=command),
+                       getattr(args, 'prometheus_file', None))
+    
+    if success:
+        logger.info("Operation completed successfully")
+    return success
 
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Scrape card data from Limitless TCG')
-    parser.add_argument('--reset', action='store_true', default=False,
-                       help='Reset the database and ignore existing data')
+    add_cli_arguments(parser, 'cards')
     parser.add_argument('--icons-only', action='store_true', default=False,
                        help='Only retrieve missing icons for existing card data')
-    parser.add_argument('--latest-only', action='store_true', default=False,
-                       help='Grab only the latest sets and cards')
     args = parser.parse_args()
-
-    logger.info(f"Starting scraper with {CONFIG['MAX_WORKERS']} concurrent workers...")
-    
-    database = CardDatabase(reset=args.reset)
-    scraper = CardScraper(database, args.latest_only)
-    
-    if args.icons_only:
-        logger.info("Running in icons-only mode")
-        success = scraper.retrieve_missing_icons()
-    else:
-        if args.reset:
-            logger.info("Reset mode enabled - existing data will be ignored")
-        success = scraper.run()
-    
-    if success:
-        logger.info("Operation completed successfully")
+    run_cli(args, 'icons' if args.icons_only else 'cards')
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,193 @@
+"""
+asyncio card scraping pipeline.
+Set discovery, card listing, card detail fetching, icon download and
+database upserts run as overlapping stages connected by bounded queues,
+so a slow card in one set never holds up the listing of the next one.
+The upsert stage writes whatever cards are waiting in one transaction.
+Blocking requests run in a thread pool, throttled per host. Set discovery,
+sets and cards that fail transiently are handed to the scraper's retry
+queue; any other set discovery error fails the run.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from requestScheduler import TransientRequestError
+
+logger = logging.getLogger('CardPipeline')
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class CardPipeline:
+    def __init__(self, scraper, card_url, icon_url, host_limits, queue_size=200, batch_size=50, default_host_limit=4):
+        """
+        Args:
+            scraper (CardScraper): Provides the per-card fetch, parse, icon and save steps
+            card_url (str): Set index page, used to route set discovery to its host
+            icon_url (str): Icon base URL, used to route icon downloads to their host
+            host_limits (dict): Maximum concurrent requests per hostname
+            queue_size (int): Maximum items waiting between two stages
+            batch_size (int): Most cards written to the database in one transaction
+            default_host_limit (int): Limit for hosts missing from host_limits
+        """
+        self.scraper = scraper
+        self.card_url = card_url
+        self.icon_url = icon_url
+        self.host_limits = dict(host_limits)
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.default_host_limit = default_host_limit
+        self.host_semaphores = {}
+        self.completed = 0
+        self.saved = 0
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).hostname or ''
+        if host not in self.host_semaphores:
+            limit = self.host_limits.get(host, self.default_host_limit)
+            self.host_semaphores[host] = asyncio.Semaphore(limit)
+        return self.host_semaphores[host]
+
+    async def _on_host(self, url, func, *args):
+        """Runs a blocking request for url in the thread pool under its host's limit."""
+        async with self._host_semaphore(url):
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _run_stage(self, name, inbox, handler, workers, outbox=None, downstream_workers=0):
+        """Runs handler over inbox items with a fixed number of workers.
+
+        Each handler returns a list of items for outbox. Once every worker has
+        seen the end marker, one end marker per downstream worker is queued.
+        """
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                try:
+                    results = await handler(item)
+                except Exception as e:
+                    logger.error(f"Error in {name} stage: {e}")
+                    results = None
+                if outbox is not None:
+                    for result in results or []:
+                        await outbox.put(result)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if outbox is not None:
+            for _ in range(downstream_workers):
+                await outbox.put(_DONE)
+
+    async def _run_batch_stage(self, name, inbox, handler):
+        """Runs handler over the items waiting in inbox, up to batch_size at a time, until the end marker."""
+        done = False
+        while not done:
+            batch = [await inbox.get()]
+            while len(batch) < self.batch_size and not inbox.empty():
+                batch.append(inbox.get_nowait())
+            items = [item for item in batch if item is not _DONE]
+            done = len(items) < len(batch)
+            if items:
+                try:
+                    await handler(items)
+                except Exception as e:
+                    logger.error(f"Error in {name} stage: {e}")
+
+    async def _discover_sets(self, outbox, downstream_workers):
+        try:
+            set_links = await self._on_host(self.card_url, self.scraper.scrape_set_info)
+            for set_link in set_links:
+                await outbox.put(set_link)
+        except TransientRequestError as e:
+            logger.warning(f"Deferring set discovery: {e}")
+            self.scraper.retry_queue.defer(self.card_url, self.scraper.scrape_all_sets)
+        finally:
+            for _ in range(downstream_workers):
+                await outbox.put(_DONE)
+
+    async def _list_cards(self, set_link):
+        logger.info(f"Listing set {set_link['setName']} ({set_link['setCode']})")
+        try:
+            card_links = await self._on_host(set_link['url'], self.scraper.scrape_card_links, set_link)
+        except TransientRequestError as e:
+            logger.warning(f"Deferring set {set_link['setCode']}: {e}")
+            self.scraper.retry_queue.defer(set_link['url'], self.scraper.scrape_set_cards, set_link)
+            return []
+        return [(url, set_link) for url in card_links]
+
+    async def _fetch_card(self, item):
+        url, set_link = item
+        try:
+            card_ref = self.scraper.parse_card_url(url)
+            if card_ref is None:
+                return []
+            try:
+                page = await self._on_host(url, self.scraper.fetch_card_page, url)
+            except TransientRequestError as e:
+                logger.warning(f"Deferring card at {url}: {e}")
+                self.scraper.retry_queue.defer(url, self.scraper.scrape_card_info, url,
+                                               set_link['setCode'], set_link['setName'])
+                return []
+            if page is None:
+                return []
+            card_info = self.scraper.build_card_info(url, page, *card_ref, set_link['setName'])
+            return [card_info] if card_info else []
+        finally:
+            self.completed += 1
+            logger.info(f"Progress: {self.completed} cards processed")
+
+    async def _fetch_icon(self, card_info):
+        card_info["iconPath"] = await self._on_host(
+            self.icon_url, self.scraper.download_card_icon, card_info["cardName"]
+        )
+        return [card_info]
+
+    async def _upsert(self, card_infos):
+        self.saved += len(self.scraper.save_card_infos(card_infos))
+
+    async def run(self):
+        """Runs all stages to completion.
+
+        Raises:
+            Exception: When set discovery failed for a reason other than a transient request error
+        """
+        card_host_limit = self.host_limits.get(urlparse(self.card_url).hostname, self.default_host_limit)
+        icon_host_limit = self.host_limits.get(urlparse(self.icon_url).hostname, self.default_host_limit)
+        listing_workers = 2
+        detail_workers = card_host_limit
+        icon_workers = icon_host_limit
+
+        # Enough threads for every host to run at its limit at the same time
+        executor = ThreadPoolExecutor(max_workers=sum(self.host_limits.values()) + self.default_host_limit)
+        asyncio.get_running_loop().set_default_executor(executor)
+
+        sets_queue = asyncio.Queue(self.queue_size)
+        links_queue = asyncio.Queue(self.queue_size)
+        cards_queue = asyncio.Queue(self.queue_size)
+        upsert_queue = asyncio.Queue(self.queue_size)
+
+        try:
+            # Every stage is let finish so the end markers reach all workers before an error is raised
+            results = await asyncio.gather(
+                self._discover_sets(sets_queue, listing_workers),
+                self._run_stage("listing", sets_queue, self._list_cards, listing_workers,
+                                links_queue, detail_workers),
+                self._run_stage("card detail", links_queue, self._fetch_card, detail_workers,
+                                cards_queue, icon_workers),
+                self._run_stage("icon", cards_queue, self._fetch_icon, icon_workers,
+                                upsert_queue, 1),
+                self._run_batch_stage("upsert", upsert_queue, self._upsert),
+                return_exceptions=True
+            )
+        finally:
+            executor.shutdown(wait=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        logger.info(f"Pipeline finished: {self.completed} cards processed, {self.saved} saved")
@@ -0,0 +1,131 @@
+"""
+Thread-safe in-memory card store.
+Cards are kept as __slots__ records in a dict keyed by card id, with
+secondary indexes on cardName, setNumber and evolvesFrom, so upserts and
+lookups are O(1) and exports need no per-row conversion overhead.
+"""
+
+import threading
+from collections import defaultdict
+
+CARD_FIELDS = (
+    'setNumber', 'setName', 'cardNumber',
+    'cardName', 'cardElement', 'cardType', 'cardSubtype',
+    'evolvesFrom', 'webLink', 'iconPath', 'finalEvolution'
+)
+
+INDEXED_FIELDS = ('cardName', 'setNumber', 'evolvesFrom')
+
+
+class CardRecord:
+    __slots__ = CARD_FIELDS
+
+    def __init__(self, data):
+        for field in CARD_FIELDS:
+            setattr(self, field, data.get(field))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in CARD_FIELDS}
+
+
+def card_sort_key(card_id):
+    """Sorts by set number first, then by card number as an integer."""
+    set_number, _, card_number = card_id.rpartition('-')
+    return (set_number, int(card_number)) if card_number.isdigit() else (set_number, float('inf'))
+
+
+class CardStore:
+    def __init__(self):
+        self._records = {}
+        self._indexes = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._records)
+
+    def __contains__(self, card_id):
+        with self._lock:
+            return card_id in self._records
+
+    def _unindex(self, card_id, record):
+        for field in INDEXED_FIELDS:
+            value = getattr(record, field)
+            bucket = self._indexes[field].get(value)
+            if bucket is not None:
+                bucket.discard(card_id)
+                if not bucket:
+                    del self._indexes[field][value]
+
+    def _index(self, card_id, record):
+        for field in INDEXED_FIELDS:
+            self._indexes[field][getattr(record, field)].add(card_id)
+
+    def upsert(self, card_id, data):
+        """Inserts or replaces a card."""
+        record = CardRecord(data)
+        with self._lock:
+            previous = self._records.get(card_id)
+            if previous is not None:
+                self._unindex(card_id, previous)
+            self._records[card_id] = record
+            self._index(card_id, record)
+
+    def upsert_many(self, items):
+        """Inserts or replaces (card_id, data) pairs under a single lock."""
+        with self._lock:
+            for card_id, data in items:
+                self.upsert(card_id, data)
+
+    def get(self, card_id):
+        """Returns a card as a dict, or None."""
+        with self._lock:
+            record = self._records.get(card_id)
+            return record.to_dict() if record is not None else None
+
+    def set_field(self, card_id, field, value):
+        """Updates one field of a stored card, keeping indexes in sync."""
+        with self._lock:
+            record = self._records[card_id]
+            if field in INDEXED_FIELDS:
+                self._unindex(card_id, record)
+            setattr(record, field, value)
+            if field in INDEXED_FIELDS:
+                self._index(card_id, record)
+
+    def ids_by(self, field, value):
+        """Returns the ids of cards whose indexed field equals value."""
+        with self._lock:
+            return set(self._indexes[field].get(value, ()))
+
+    def values_of(self, field):
+        """Returns the distinct values of an indexed field."""
+        with self._lock:
+            return set(self._indexes[field].keys())
+
+    def ids(self):
+        with self._lock:
+            return list(self._records.keys())
+
+    def iter_export(self):
+        """Yields (card_id, dict) pairs sorted by set and card number.
+
+        Ids are snapshotted up front; each record is copied under the lock.
+        """
+        with self._lock:
+            card_ids = sorted(self._records, key=card_sort_key)
+        for card_id in card_ids:
+            with self._lock:
+                record = self._records.get(card_id)
+                if record is None:
+                    continue
+                data = record.to_dict()
+            yield card_id, data
+
+    def export(self):
+        """Returns all cards as {card_id: dict}, sorted by set and card number."""
+        with self._lock:
+            return {
+                card_id: self._records[card_id].to_dict()
+                for card_id in sorted(self._records, key=card_sort_key)
+            }
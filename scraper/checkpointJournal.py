@@ -0,0 +1,126 @@
+"""
+Append-only checkpoint journal for long scrape runs.
+A run writes a header describing its work (mode, snapshot date, deck list)
+and then one JSON line per finished unit of work. Lines are buffered and
+flushed every few records or seconds, so a crash loses at most that much.
+A run started with --resume replays the journal instead of redoing the
+work; a run that completes deletes it.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger('CheckpointJournal')
+
+FORMAT = 1
+
+
+class CheckpointJournal:
+    def __init__(self, path, flush_every=25, flush_seconds=10.0):
+        """
+        Args:
+            path (str): JSON-lines journal file
+            flush_every (int): Buffered records that trigger a flush
+            flush_seconds (float): Maximum age of a buffered record before a flush
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self._buffer = []
+        self._file = None
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def read(self):
+        """Reads the journal written by an earlier run.
+
+        A torn last line (the run died mid-write) is ignored.
+
+        Returns:
+            tuple: (header dict, list of record dicts), or (None, []) without a usable journal
+        """
+        if not self.exists():
+            return None, []
+        header, records = None, []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Ignoring unreadable line {line_number} of {self.path}")
+                        continue
+                    if entry.get('type') == 'start':
+                        header = entry
+                    else:
+                        records.append(entry)
+        except Exception as e:
+            logger.error(f"Error reading checkpoint journal {self.path}: {e}")
+            return None, []
+        if header is None or header.get('format') != FORMAT:
+            logger.warning(f"Checkpoint journal {self.path} has no usable header, ignoring it")
+            return None, []
+        return header, records
+
+    def start(self, **header):
+        """Starts a new journal, replacing any earlier one."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            self._file = open(self.path, 'w', encoding='utf-8')
+            entry = dict(header, type='start', format=FORMAT, started=datetime.now().isoformat(timespec='seconds'))
+            self._buffer.append(json.dumps(entry))
+            self._flush()
+
+    def reopen(self):
+        """Continues appending to the journal of an interrupted run."""
+        with self._lock:
+            torn = False
+            with open(self.path, 'rb') as f:
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b'\n'
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if torn:
+                # Terminate a half-written last line so new records start cleanly
+                self._file.write('\n')
+
+    def record(self, kind, **payload):
+        """Buffers one finished unit of work, flushing when the buffer is full or old."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._buffer.append(json.dumps(dict(payload, type=kind)))
+            if len(self._buffer) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_seconds:
+                self._flush()
+
+    def _flush(self):
+        if self._buffer and self._file is not None:
+            self._file.write('\n'.join(self._buffer) + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self, completed=False):
+        """Flushes and closes the journal. A completed run's journal is deleted."""
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+                if not completed:
+                    logger.info(f"Checkpoint saved to {self.path}; rerun with --resume to continue")
+            if completed and self.exists():
+                os.remove(self.path)
+                logger.info(f"Run completed, removed checkpoint journal {self.path}")
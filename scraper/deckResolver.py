@@ -0,0 +1,183 @@
+"""
+Resolver index from deck archetype names to canonical card keys.
+Tournament meta names decks by free text ("Giratina ex Darkrai ex") while
+the match history stores card keys ("A2b-35"). The card scraper builds
+this index from the card database: every card name (normalized, with "ex"
+aliases) maps to one canonical key, the earliest printing, and every
+reprint maps to that same key. Archetypes seen in the tournament meta are
+resolved up front, so both sides can be turned into comparable deck keys
+with dictionary lookups instead of scanning card_data.json by name.
+"""
+
+import json
+import logging
+import os
+import re
+import unicodedata
+from collections import defaultdict
+
+from cardStore import card_sort_key
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('DeckResolver')
+
+FORMAT = 1
+
+# Longest card name in words ("Alolan Raichu ex", "Mr. Mime"), bounding the greedy match
+MAX_NAME_WORDS = 4
+
+EX_SUFFIX = ' ex'
+
+
+def normalize_name(name):
+    """Lower-cases, strips accents and collapses whitespace: 'Flabébé  EX' -> 'flabebe ex'."""
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def deck_key(card_keys):
+    """Order-independent key of a deck's resolved cards, e.g. 'A2-110|A2b-35'."""
+    return '|'.join(sorted(key for key in card_keys if key))
+
+
+class DeckResolver:
+    def __init__(self, names=None, printings=None, archetypes=None):
+        """
+        Args:
+            names (dict): Normalized card name -> canonical card key
+            printings (dict): Card key -> canonical card key
+            archetypes (dict): Archetype name -> {"cards", "deckKey", "unresolved"}
+        """
+        self.names = names or {}
+        self.printings = printings or {}
+        self.archetypes = archetypes or {}
+
+    @classmethod
+    def build(cls, cards, archetype_names=()):
+        """Builds the index from (card_id, card) pairs.
+
+        The canonical key of a name is its earliest printing by set and
+        card number. A base name without its own card ("Giratina") is an
+        alias of its "ex" card.
+
+        Args:
+            cards (iterable): (card_id, card dict) pairs
+            archetype_names (iterable): Deck names to resolve up front
+
+        Returns:
+            DeckResolver: The built index
+        """
+        by_name = defaultdict(list)
+        for card_id, card in cards:
+            if card.get('cardName'):
+                by_name[normalize_name(card['cardName'])].append(card_id)
+
+        names, printings = {}, {}
+        for name, card_ids in by_name.items():
+            card_ids.sort(key=card_sort_key)
+            names[name] = card_ids[0]
+            printings.update((card_id, card_ids[0]) for card_id in card_ids)
+        for name in list(names):
+            if name.endswith(EX_SUFFIX):
+                names.setdefault(name[:-len(EX_SUFFIX)], names[name])
+
+        resolver = cls(names, printings)
+        resolver.add_archetypes(archetype_names)
+        return resolver
+
+    def canonical(self, card_key):
+        """Maps any printing to its canonical key; unknown keys are returned unchanged."""
+        return self.printings.get(card_key, card_key)
+
+    def card_for_name(self, name):
+        """Returns the canonical key of a card name, or None."""
+        normalized = normalize_name(name)
+        key = self.names.get(normalized)
+        if key is None and not normalized.endswith(EX_SUFFIX):
+            key = self.names.get(normalized + EX_SUFFIX)
+        return key
+
+    def resolve(self, archetype):
+        """Splits an archetype name into card names by greedy longest match.
+
+        Returns:
+            dict: {"cards": canonical keys in name order, "deckKey": str,
+                "unresolved": words no card name matched}
+        """
+        cached = self.archetypes.get(archetype)
+        if cached is not None:
+            return cached
+
+        words = normalize_name(archetype).split(' ')
+        cards, unresolved = [], []
+        i = 0
+        while i < len(words):
+            for j in range(min(len(words), i + MAX_NAME_WORDS), i, -1):
+                key = self.names.get(' '.join(words[i:j]))
+                if key is not None:
+                    cards.append(key)
+                    i = j
+                    break
+            else:
+                unresolved.append(words[i])
+                i += 1
+        return {"cards": cards, "deckKey": deck_key(cards), "unresolved": unresolved}
+
+    def add_archetypes(self, archetype_names):
+        """Resolves and caches archetype names. Returns the number of new ones."""
+        added, partial = 0, []
+        for archetype in archetype_names:
+            if archetype and archetype not in self.archetypes:
+                self.archetypes[archetype] = self.resolve(archetype)
+                added += 1
+                if self.archetypes[archetype]["unresolved"]:
+                    partial.append(archetype)
+        if partial:
+            logger.warning(f"{len(partial)} archetypes only partly resolved to cards: {', '.join(partial[:10])}")
+        return added
+
+    def to_dict(self):
+        return {
+            "format": FORMAT,
+            "names": dict(sorted(self.names.items())),
+            "printings": dict(sorted(self.printings.items(), key=lambda item: card_sort_key(item[0]))),
+            "archetypes": dict(sorted(self.archetypes.items()))
+        }
+
+    def save(self, path):
+        """Writes the index to path atomically."""
+        try:
+            write_json_atomic(path, self.to_dict(), indent=2)
+            logger.info(f"Deck resolver with {len(self.names)} names and {len(self.archetypes)} archetypes saved to {path}")
+        except Exception as e:
+            logger.error(f"Error saving deck resolver: {e}")
+
+    @classmethod
+    def load(cls, path):
+        """Reads an index written by save(); an empty resolver if it is missing or unreadable."""
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != FORMAT:
+                logger.warning(f"Unsupported deck resolver format in {path}, ignoring it")
+                return cls()
+            return cls(data.get('names'), data.get('printings'), data.get('archetypes'))
+        except Exception as e:
+            logger.error(f"Error loading deck resolver from {path}: {e}")
+            return cls()
+
+
+def archetype_names(tournament_meta_path):
+    """Returns the distinct deck names in a tournament meta file ({date: [deck, ...]})."""
+    if not os.path.exists(tournament_meta_path):
+        return []
+    try:
+        with open(tournament_meta_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return sorted({deck.get('Deck Name') for decks in data.values() for deck in decks} - {None})
+    except Exception as e:
+        logger.error(f"Error reading deck names from {tournament_meta_path}: {e}")
+        return []
@@ -0,0 +1,183 @@
+"""
+Evolution graph of the scraped cards, keyed by card name.
+Every card is an edge from its evolvesFrom name to its own name, and every
+printing of a name (reprints, alternate arts) is grouped under that name.
+The graph is updated card by card as cards are upserted, so final
+evolution flags stay correct without rescanning the database, and it is
+persisted next to the card data so deck-to-card resolution can look up
+chains (Basic -> Stage 1 -> Stage 2) directly.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('EvolutionGraph')
+
+FORMAT = 1
+
+# Evolution chains are at most Basic -> Stage 1 -> Stage 2; deeper walks mean a cycle in bad data
+MAX_DEPTH = 8
+
+
+class EvolutionGraph:
+    def __init__(self):
+        self._cards = {}  # card id -> (card name, evolves-from name)
+        self._printings = defaultdict(dict)  # card name -> {card id: evolves-from name}
+        self._children = defaultdict(lambda: defaultdict(set))  # name -> {child name: card ids}
+        self._stages = {}  # card name -> cardSubtype
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._printings)
+
+    def __contains__(self, name):
+        with self._lock:
+            return name in self._printings
+
+    def _detach(self, card_id):
+        """Removes a card's edge. Returns the names whose final flag may have changed."""
+        name, parent = self._cards.pop(card_id)
+        printings = self._printings[name]
+        printings.pop(card_id, None)
+        if not printings:
+            del self._printings[name]
+            self._stages.pop(name, None)
+        if parent:
+            children = self._children[parent]
+            children[name].discard(card_id)
+            if not children[name]:
+                del children[name]
+            if not children:
+                del self._children[parent]
+                return {parent}
+        return set()
+
+    def add(self, card_id, card):
+        """Adds or moves one card.
+
+        Args:
+            card_id (str): Card key, e.g. "A1-4"
+            card (dict): Card data with cardName, evolvesFrom and cardSubtype
+
+        Returns:
+            dict: {card name: final evolution flag} for names whose flag changed,
+                plus the card's own name
+        """
+        name = card.get('cardName') or ''
+        parent = card.get('evolvesFrom') or ''
+        with self._lock:
+            previous = self._cards.get(card_id)
+            if previous == (name, parent):
+                self._stages[name] = card.get('cardSubtype') or self._stages.get(name)
+                return {name: self.is_final(name)}
+
+            touched = {name}
+            if previous is not None:
+                touched |= {previous[0], previous[1]}
+            if parent:
+                touched.add(parent)
+            touched.discard('')
+            before = {n: self.is_final(n) for n in touched if n in self._printings}
+
+            if previous is not None:
+                self._detach(card_id)
+            self._cards[card_id] = (name, parent)
+            self._printings[name][card_id] = parent
+            if card.get('cardSubtype'):
+                self._stages[name] = card['cardSubtype']
+            if parent:
+                self._children[parent][name].add(card_id)
+
+            changed = {name: self.is_final(name)}
+            for other in touched:
+                if other in self._printings and before.get(other) != self.is_final(other):
+                    changed[other] = self.is_final(other)
+            return changed
+
+    def add_many(self, items):
+        """Adds (card_id, card) pairs, e.g. when loading stored card data."""
+        with self._lock:
+            for card_id, card in items:
+                self.add(card_id, card)
+
+    def is_final(self, name):
+        """A name is a final evolution when no stored card evolves from it."""
+        with self._lock:
+            return name not in self._children
+
+    def parent(self, name):
+        """Returns the name a card evolves from ('' for a Basic or an unknown name)."""
+        with self._lock:
+            parents = sorted({p for p in self._printings.get(name, {}).values() if p})
+            return parents[0] if parents else ''
+
+    def children(self, name):
+        with self._lock:
+            return sorted(self._children.get(name, ()))
+
+    def printings(self, name):
+        """Returns the card ids printed under a name (its reprint group)."""
+        with self._lock:
+            return sorted(self._printings.get(name, ()))
+
+    def ancestors(self, name):
+        """Returns the names from the line's Basic down to name, inclusive."""
+        with self._lock:
+            line = [name]
+            while len(line) < MAX_DEPTH:
+                parent = self.parent(line[0])
+                if not parent or parent in line:
+                    break
+                line.insert(0, parent)
+            return line
+
+    def chains(self, name):
+        """Returns every full evolution line through name, Basic first.
+
+        A branching family (Eevee) has one line per final evolution; a
+        Stage 1 lists the lines of each Stage 2 that evolves from it.
+        """
+        with self._lock:
+            head = self.ancestors(name)
+            lines = []
+            stack = [head]
+            while stack:
+                line = stack.pop()
+                children = [child for child in self.children(line[-1]) if child not in line]
+                if not children or len(line) >= MAX_DEPTH:
+                    lines.append(line)
+                else:
+                    stack.extend(line + [child] for child in reversed(children))
+            return lines
+
+    def to_dict(self):
+        """Returns the graph as a JSON-serializable dict keyed by card name."""
+        with self._lock:
+            return {
+                "format": FORMAT,
+                "cards": {
+                    name: {
+                        "stage": self._stages.get(name),
+                        "evolvesFrom": self.parent(name),
+                        "evolvesTo": self.children(name),
+                        "finalEvolution": self.is_final(name),
+                        "chains": self.chains(name),
+                        "printings": self.printings(name)
+                    }
+                    for name in sorted(self._printings)
+                }
+            }
+
+    def save(self, path):
+        """Writes the graph to path atomically. Returns True on success."""
+        try:
+            write_json_atomic(path, self.to_dict(), indent=2)
+            logger.info(f"Evolution graph with {len(self)} card names saved to {path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving evolution graph: {e}")
+            return False
@@ -0,0 +1,178 @@
+"""
+On-disk HTTP response cache with conditional revalidation.
+Each URL is stored as a body file plus a small JSON metadata file holding
+the ETag and Last-Modified validators. Entries are evicted least recently
+used first once the cache grows past its size limit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger('HttpCache')
+
+
+class HttpCache:
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024):
+        """
+        Args:
+            directory (str): Folder holding cached entries
+            max_bytes (int): Total body size kept before LRU eviction
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> [size, last access]
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def _write_temp(self, path, data):
+        """Writes data to a temp file unique to this call, next to path. Returns the temp path."""
+        fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def _load_index(self):
+        """Rebuilds the in-memory LRU index from the files on disk."""
+        for name in os.listdir(self.directory):
+            if not name.endswith('.body'):
+                continue
+            key = name[:-len('.body')]
+            meta_path, body_path = self._paths(key)
+            if not os.path.exists(meta_path):
+                continue
+            stat = os.stat(body_path)
+            self._entries[key] = [stat.st_size, stat.st_mtime]
+        logger.info(f"HTTP cache has {len(self._entries)} entries in {self.directory}")
+
+    @property
+    def size(self):
+        with self._lock:
+            return sum(size for size, _ in self._entries.values())
+
+    def lookup(self, url):
+        """Returns the cached metadata for url, or None."""
+        key = self.key_for(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+        meta_path, _ = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry for {url}: {e}")
+            self._remove(key)
+            return None
+
+    def conditional_headers(self, meta):
+        """Builds If-None-Match / If-Modified-Since headers from cached metadata."""
+        headers = {}
+        if meta and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta and meta.get('lastModified'):
+            headers['If-Modified-Since'] = meta['lastModified']
+        return headers
+
+    def read_body(self, url):
+        """Returns the cached body for url and marks the entry as recently used."""
+        key = self.key_for(url)
+        _, body_path = self._paths(key)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        now = time.time()
+        with self._lock:
+            if key in self._entries:
+                self._entries[key][1] = now
+            self.hits += 1
+        try:
+            os.utime(body_path, (now, now))
+        except OSError:
+            pass
+        return body
+
+    def store(self, url, response):
+        """Caches a 200 response if it carries a validator."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._lock:
+            self.misses += 1
+        if response.status_code != 200 or not (etag or last_modified):
+            return False
+
+        key = self.key_for(url)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'url': url,
+            'finalUrl': response.url,
+            'etag': etag,
+            'lastModified': last_modified,
+            'contentType': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'storedAt': time.time()
+        }
+        temp_paths = []
+        try:
+            # Write to temp files first so readers never see a partial entry; each
+            # writer gets its own temp files, so concurrent stores of a URL cannot interleave
+            temp_paths.append(self._write_temp(body_path, response.content))
+            temp_paths.append(self._write_temp(meta_path, json.dumps(meta).encode('utf-8')))
+            os.replace(temp_paths[0], body_path)
+            os.replace(temp_paths[1], meta_path)
+        except Exception as e:
+            logger.warning(f"Failed to cache {url}: {e}")
+            for tmp_path in temp_paths:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            return False
+
+        with self._lock:
+            self._entries[key] = [len(response.content), time.time()]
+        self.evict()
+        return True
+
+    def _remove(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits max_bytes."""
+        with self._lock:
+            total = sum(size for size, _ in self._entries.values())
+            if total <= self.max_bytes:
+                return 0
+            by_age = sorted(self._entries.items(), key=lambda item: item[1][1])
+            victims = []
+            for key, (size, _) in by_age:
+                if total <= self.max_bytes:
+                    break
+                victims.append(key)
+                total -= size
+        for key in victims:
+            self._remove(key)
+        logger.info(f"Evicted {len(victims)} entries from HTTP cache")
+        return len(victims)
@@ -0,0 +1,314 @@
+"""
+Pooled HTTP fetching and static HTML parsing for the Limitless scrapers.
+Pages on pocket.limitlesstcg.com and play.limitlesstcg.com are server
+rendered, so most of what the Selenium drivers do can be replaced with a
+plain GET parsed with BeautifulSoup behind a Selenium-like element API.
+"""
+
+import logging
+import re
+import threading
+from urllib.parse import urljoin
+
+from httpCache import HttpCache
+from requestScheduler import RequestScheduler, TransientRequestError
+from scrapeMetrics import increment, timer
+
+# Configuration
+CONFIG = {
+    'TIMEOUT': 20,  # seconds
+    'POOL_SIZE': 10,  # Keep-alive connections per host
+    'RETRIES': 3,  # Retries on connection errors, timeouts, 429 and 5xx, with jittered exponential backoff
+    'RETRY_DELAY': 0.5,  # Base backoff in seconds, doubled per attempt
+    'MAX_RETRY_DELAY': 30,  # Cap on a single backoff
+    'HOST_RATES': {},  # Requests per second per hostname
+    'DEFAULT_RATE': 10,  # Requests per second for other hosts
+    'USER_AGENT': "Mozilla/5.0 (compatible; ptcgp-meta-scraper)",
+    'CACHE_DIR': None,  # Conditional-GET cache folder, disabled when None
+    'CACHE_MAX_BYTES': 200 * 1024 * 1024
+}
+
+logger = logging.getLogger('HttpFetch')
+
+_session = None
+_cache = None
+_scheduler = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the shared requests session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # requests is imported on first use so commands that never fetch start faster
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # Retries are left to the request scheduler
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=CONFIG['POOL_SIZE'], pool_maxsize=CONFIG['POOL_SIZE'])
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({'User-Agent': CONFIG['USER_AGENT']})
+            _session = session
+        return _session
+
+
+def get_cache():
+    """Returns the shared response cache, or None when caching is disabled."""
+    global _cache
+    with _session_lock:
+        if _cache is None and CONFIG['CACHE_DIR']:
+            _cache = HttpCache(CONFIG['CACHE_DIR'], CONFIG['CACHE_MAX_BYTES'])
+        return _cache
+
+
+def get_scheduler():
+    """Returns the shared request scheduler, creating it on first use."""
+    global _scheduler
+    with _session_lock:
+        if _scheduler is None:
+            import requests
+
+            _scheduler = RequestScheduler(
+                host_rates=CONFIG['HOST_RATES'], default_rate=CONFIG['DEFAULT_RATE'],
+                max_retries=CONFIG['RETRIES'], retry_delay=CONFIG['RETRY_DELAY'],
+                max_delay=CONFIG['MAX_RETRY_DELAY'],
+                retry_exceptions=(requests.ConnectionError, requests.Timeout,
+                                  requests.exceptions.ChunkedEncodingError)
+            )
+        return _scheduler
+
+
+def configure(pool_size=None, cache_dir=None, cache_max_bytes=None, host_rates=None, retries=None,
+              retry_delay=None):
+    """Resizes the connection pool, sets up the response cache and the per-host rate limits.
+
+    Must be called before the first request.
+    """
+    global _session, _cache, _scheduler
+    with _session_lock:
+        if pool_size:
+            CONFIG['POOL_SIZE'] = pool_size
+        if cache_dir is not None:
+            CONFIG['CACHE_DIR'] = cache_dir
+        if cache_max_bytes:
+            CONFIG['CACHE_MAX_BYTES'] = cache_max_bytes
+        if host_rates is not None:
+            CONFIG['HOST_RATES'] = dict(host_rates)
+        if retries is not None:
+            CONFIG['RETRIES'] = retries
+        if retry_delay is not None:
+            CONFIG['RETRY_DELAY'] = retry_delay
+        if _session is not None:
+            _session.close()
+            _session = None
+        _cache = None
+        _scheduler = None
+
+
+def fetch(url, method='GET', **kwargs):
+    """Performs a rate-limited request through the shared session and returns the response.
+
+    Raises:
+        TransientRequestError: When the host kept answering 429/5xx or timing out
+    """
+    kwargs.setdefault('timeout', CONFIG['TIMEOUT'])
+    session = get_session()
+    return get_scheduler().request(url, lambda: session.request(method, url, **kwargs))
+
+
+def _response_from_cache(cache, meta):
+    """Rebuilds a 200 response from a cache entry."""
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = meta.get('finalUrl') or meta['url']
+    response.encoding = meta.get('encoding')
+    response._content = cache.read_body(meta['url'])
+    response.headers = CaseInsensitiveDict({
+        k: v for k, v in (
+            ('ETag', meta.get('etag')),
+            ('Last-Modified', meta.get('lastModified')),
+            ('Content-Type', meta.get('contentType')),
+        ) if v
+    })
+    response.from_cache = True
+    return response
+
+
+def fetch_cached(url):
+    """GETs a URL through the response cache.
+
+    Cached entries are revalidated with If-None-Match / If-Modified-Since,
+    and a 304 is answered from disk. Without a cache this is a plain GET.
+    Either way the response has a from_cache flag.
+    """
+    cache = get_cache()
+    if cache is None:
+        response = fetch(url)
+        response.from_cache = False
+        return response
+
+    meta = cache.lookup(url)
+    response = fetch(url, headers=cache.conditional_headers(meta))
+    if response.status_code == 304 and meta:
+        try:
+            cached = _response_from_cache(cache, meta)
+            increment('http_cache_hits')
+            return cached
+        except OSError as e:
+            # Entry was evicted between lookup and read
+            logger.warning(f"Cache entry for {url} disappeared, refetching: {e}")
+            response = fetch(url)
+
+    cache.store(url, response)
+    increment('http_cache_misses')
+    response.from_cache = False
+    return response
+
+
+def fetch_document(url):
+    """Fetches a page through the cache and parses it. Returns (response, document)."""
+    with timer('page_load'):
+        response = fetch_cached(url)
+    with timer('parse'):
+        document = parse_html(response.text, base_url=response.url)
+    return response, document
+
+
+# Elements whose boundaries are rendered as line breaks
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li',
+    'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'tfoot',
+    'thead', 'tr', 'ul'
+}
+
+# Elements whose content is never rendered
+SKIP_TEXT_TAGS = {'script', 'style', 'template', 'noscript'}
+
+# Attributes Selenium resolves to absolute URLs
+URL_ATTRIBUTES = {'href', 'src'}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class By:
+    """Locator strategies with the same values as selenium's By, without importing Selenium."""
+    CSS_SELECTOR = 'css selector'
+    CLASS_NAME = 'class name'
+    TAG_NAME = 'tag name'
+
+
+class NoSuchElementError(LookupError):
+    """Raised by HtmlNode.find_element when nothing matches."""
+
+
+class HtmlNode:
+    """A BeautifulSoup element with a Selenium-like read API.
+
+    Lets the HTTP and Selenium engines share the same extraction code;
+    selectors are evaluated by soupsieve.
+    """
+
+    def __init__(self, element, base_url=None):
+        self.element = element
+        self.base_url = base_url
+
+    def _wrap(self, elements):
+        return [HtmlNode(element, self.base_url) for element in elements]
+
+    @property
+    def tag(self):
+        return self.element.name
+
+    def get_attribute(self, name):
+        """Returns an attribute value, resolving links like Selenium does."""
+        value = self.element.get(name)
+        if isinstance(value, list):
+            value = ' '.join(value)
+        if value is not None and name in URL_ATTRIBUTES and self.base_url:
+            return urljoin(self.base_url, value)
+        return value
+
+    @staticmethod
+    def _filters(class_name):
+        # class_=None would only match elements without a class attribute
+        return {} if class_name is None else {'class_': class_name}
+
+    def find_all(self, tag=None, class_name=None):
+        """Returns all descendants matching a tag and/or a single class name."""
+        return self._wrap(self.element.find_all(tag or True, **self._filters(class_name)))
+
+    def find(self, tag=None, class_name=None):
+        element = self.element.find(tag or True, **self._filters(class_name))
+        return HtmlNode(element, self.base_url) if element is not None else None
+
+    def find_elements(self, by, value):
+        """Selenium-compatible lookup for By.CSS_SELECTOR, By.CLASS_NAME and By.TAG_NAME."""
+        if by == By.CSS_SELECTOR:
+            return self.select(value)
+        if by == By.CLASS_NAME:
+            return self.find_all(class_name=value)
+        if by == By.TAG_NAME:
+            return self.find_all(tag=value)
+        raise ValueError(f"Unsupported locator strategy: {by}")
+
+    def find_element(self, by, value):
+        matches = self.find_elements(by, value)
+        if not matches:
+            raise NoSuchElementError(f"No element matches {by}={value!r}")
+        return matches[0]
+
+    def select(self, selector):
+        """Returns descendants matching a CSS selector."""
+        return self._wrap(self.element.select(selector))
+
+    def select_one(self, selector):
+        element = self.element.select_one(selector)
+        return HtmlNode(element, self.base_url) if element is not None else None
+
+    @property
+    def text(self):
+        """Rendered text, approximating Selenium's WebElement.text."""
+        chunks = []
+        _collect_text(self.element, chunks)
+        lines = (' '.join(line.split()) for line in ''.join(chunks).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+
+def _collect_text(element, chunks):
+    from bs4.element import NavigableString, PreformattedString
+
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            # Comments, doctypes and CDATA are not rendered
+            if not isinstance(child, PreformattedString):
+                chunks.append(_WHITESPACE.sub(' ', child))
+        elif child.name not in SKIP_TEXT_TAGS:
+            block = child.name in BLOCK_TAGS
+            if block:
+                chunks.append('\n')
+            _collect_text(child, chunks)
+            if block:
+                chunks.append('\n')
+            elif child.name in ('td', 'th'):
+                chunks.append(' ')
+
+
+def parse_html(html, base_url=None):
+    """Parses an HTML document with BeautifulSoup's stdlib-backed parser."""
+    # bs4 is imported on first use so commands that never parse start faster
+    from bs4 import BeautifulSoup
+
+    return HtmlNode(BeautifulSoup(html, 'html.parser'), base_url=base_url)
+
+
+def page_title(document):
+    """Returns the document <title> text, or an empty string."""
+    title = document.find('title')
+    return title.text if title else ""
@@ -0,0 +1,188 @@
+"""
+WebP sprite atlas built from the icon store.
+Icons are downsized to fit a fixed grid cell and packed into a few lossless
+WebP sheets, with a coordinate map keyed by iconPath for the front end. The
+build is incremental: icons keep their slot across runs, and only sheets
+that gained, lost or changed an icon are re-encoded. The packing state is
+committed next to the sheets, so a fresh checkout stays incremental too.
+Pillow is optional; without it the atlas step is skipped.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('IconAtlas')
+
+CONFIG = {
+    'CELL': 48,  # Cell size in pixels; UI icons render at 20-24 CSS px, so 2x density
+    'COLUMNS': 32,
+    'ROWS': 32,
+    'SHEET_NAME': "icons-{index}.webp"
+}
+
+
+class IconAtlas:
+    def __init__(self, directory, web_path, icon_web_path, state_path):
+        """
+        Args:
+            directory (str): Folder the sheets are written to
+            web_path (str): Front-end path of that folder
+            icon_web_path (str): Front-end path of the individual icons (the iconPath prefix)
+            state_path (str): JSON file recording each icon's slot and content hash
+        """
+        self.directory = directory
+        self.web_path = web_path
+        self.icon_web_path = icon_web_path
+        self.state_path = state_path
+        self.layout = {"cell": CONFIG['CELL'], "columns": CONFIG['COLUMNS'], "rows": CONFIG['ROWS']}
+        self.sheets = []  # [{"file", "version"}]
+        self.icons = {}  # icon file -> {"sha", "sheet", "slot", "w", "h"}
+
+    @property
+    def slots_per_sheet(self):
+        return self.layout['columns'] * self.layout['rows']
+
+    def _load_state(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading atlas state, rebuilding: {e}")
+            return
+        if state.get('layout') != self.layout:
+            logger.info("Atlas layout changed, rebuilding all sheets")
+            return
+        self.sheets = state.get('sheets', [])
+        self.icons = state.get('icons', {})
+
+    def _save_state(self):
+        state = {
+            "format": 1,
+            "layout": self.layout,
+            "sheets": self.sheets,
+            "icons": dict(sorted(self.icons.items()))
+        }
+        write_json_atomic(self.state_path, state, indent=2)
+
+    def _sheet_path(self, index):
+        return os.path.join(self.directory, CONFIG['SHEET_NAME'].format(index=index))
+
+    def _allocate_slots(self):
+        """Yields free (sheet, slot) pairs in packing order."""
+        used = {(entry['sheet'], entry['slot']) for entry in self.icons.values()}
+        sheet = 0
+        while True:
+            for slot in range(self.slots_per_sheet):
+                if (sheet, slot) not in used:
+                    yield sheet, slot
+            sheet += 1
+
+    def _origin(self, slot):
+        cell = self.layout['cell']
+        return (slot % self.layout['columns']) * cell, (slot // self.layout['columns']) * cell
+
+    def build(self, icon_files, icon_folder):
+        """Packs new or changed icons into the sheets.
+
+        Args:
+            icon_files (dict): Icon file name -> content hash, e.g. from IconStore.files()
+            icon_folder (str): Folder holding the icon files
+
+        Returns:
+            dict: Coordinate map for card_data.json, or None when Pillow is unavailable
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            logger.warning("Pillow is not installed; skipping the icon atlas")
+            return None
+
+        self._load_state()
+        dirty = {}  # sheet -> {('clear', slot) | ('paint', icon file)}
+
+        for file_name in [name for name in self.icons if name not in icon_files]:
+            entry = self.icons.pop(file_name)
+            dirty.setdefault(entry['sheet'], set()).add(('clear', entry['slot']))
+
+        free_slots = self._allocate_slots()
+        for file_name, digest in sorted(icon_files.items()):
+            entry = self.icons.get(file_name)
+            if entry is not None and entry['sha'] == digest:
+                continue
+            if entry is None:
+                sheet, slot = next(free_slots)
+                entry = self.icons[file_name] = {"sha": digest, "sheet": sheet, "slot": slot, "w": 0, "h": 0}
+            entry['sha'] = digest
+            dirty.setdefault(entry['sheet'], set()).add(('paint', file_name))
+
+        sheet_count = max((entry['sheet'] for entry in self.icons.values()), default=-1) + 1
+        del self.sheets[sheet_count:]
+        self.sheets += [None] * (sheet_count - len(self.sheets))
+
+        # A sheet missing on disk or from the state is repainted from its sources
+        fresh = {index for index in range(sheet_count)
+                 if self.sheets[index] is None or not os.path.exists(self._sheet_path(index))}
+        for index in fresh:
+            dirty[index] = {('paint', name) for name, entry in self.icons.items() if entry['sheet'] == index}
+        dirty = {index: actions for index, actions in dirty.items() if index < sheet_count}
+
+        os.makedirs(self.directory, exist_ok=True)
+        cell = self.layout['cell']
+        size = (self.layout['columns'] * cell, self.layout['rows'] * cell)
+        for index in sorted(dirty):
+            path = self._sheet_path(index)
+            actions = dirty[index]
+            if index in fresh:
+                sheet = Image.new('RGBA', size, (0, 0, 0, 0))
+            else:
+                with Image.open(path) as existing:
+                    sheet = existing.convert('RGBA')
+
+            blank = Image.new('RGBA', (cell, cell), (0, 0, 0, 0))
+            for action, target in sorted(actions, key=lambda item: (item[0], str(item[1]))):  # clears first
+                if action == 'clear':
+                    sheet.paste(blank, self._origin(target))
+                elif action == 'paint':
+                    entry = self.icons[target]
+                    with Image.open(os.path.join(icon_folder, target)) as source:
+                        icon = source.convert('RGBA')
+                    icon.thumbnail((cell, cell), Image.LANCZOS)  # only ever downsizes
+                    sheet.paste(blank, self._origin(entry['slot']))
+                    sheet.paste(icon, self._origin(entry['slot']))
+                    entry['w'], entry['h'] = icon.size
+
+            sheet.save(path, 'WEBP', lossless=True, method=6)
+            with open(path, 'rb') as f:
+                version = hashlib.sha1(f.read()).hexdigest()[:10]
+            self.sheets[index] = {"file": os.path.basename(path), "version": version}
+
+        # Remove sheets that no longer hold any icon
+        current_sheets = {sheet['file'] for sheet in self.sheets if sheet}
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith('.webp') and file_name not in current_sheets:
+                os.remove(os.path.join(self.directory, file_name))
+
+        self._save_state()
+        repainted = sum(1 for actions in dirty.values() for action, _ in actions if action == 'paint')
+        logger.info(f"Icon atlas: {len(self.icons)} icons in {len(self.sheets)} sheets, "
+                    f"{len(dirty)} sheets re-encoded ({repainted} icons packed)")
+        return self.coordinate_map()
+
+    def coordinate_map(self):
+        """Map written into card_data.json: iconPath -> [sheet, x, y, width, height]."""
+        icons = {}
+        for file_name, entry in sorted(self.icons.items()):
+            x, y = self._origin(entry['slot'])
+            icons[os.path.join(self.icon_web_path, file_name)] = [entry['sheet'], x, y, entry['w'], entry['h']]
+        return {
+            "cell": self.layout['cell'],
+            "sheetSize": [self.layout['columns'] * self.layout['cell'], self.layout['rows'] * self.layout['cell']],
+            "sheets": [f"{os.path.join(self.web_path, sheet['file'])}?v={sheet['version']}" for sheet in self.sheets],
+            "icons": icons
+        }
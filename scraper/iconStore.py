@@ -0,0 +1,204 @@
+"""
+Content-addressed store for card icons.
+Card names are normalized to an icon alias first ("Mewtwo ex" and "Mewtwo"
+share one), each alias is fetched at most once, and downloaded bytes are
+keyed by their SHA-256 so aliases that resolve to the same image point at a
+single file. The manifest also drives the generated iconsList.js.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpFetch
+from jsonWriter import write_json_atomic, write_text_atomic
+from scrapeMetrics import increment, timer
+
+logger = logging.getLogger('IconStore')
+
+# Words dropped from card names before building the icon alias
+REMOVE_WORDS = ("paldean",)
+
+
+def normalize_icon_name(card_name):
+    """Maps a card name to its icon alias, e.g. 'Mr. Mime ex' -> 'mr-mime'."""
+    name = card_name.strip().lower()
+    name_parts = name.split()
+
+    # Remove 'ex' from the end of the card name if it exists
+    if len(name_parts) >= 2 and name_parts[-1] == 'ex':
+        name = ' '.join(name_parts[:-1])
+
+    name = name.replace(" ", "").replace(".", "-")
+    for word in REMOVE_WORDS:
+        name = name.replace(word, "")
+    return name
+
+
+class IconStore:
+    def __init__(self, folder, web_path, manifest_path):
+        """
+        Args:
+            folder (str): Directory the icon files are written to
+            web_path (str): Path prefix the front end uses for that directory
+            manifest_path (str): JSON file holding blobs and aliases
+        """
+        self.folder = folder
+        self.web_path = web_path
+        self.manifest_path = manifest_path
+        self.blobs = {}  # sha256 -> {"file", "bytes"}
+        self.aliases = {}  # icon alias -> sha256
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def load(self):
+        """Loads the manifest and indexes icon files that it does not know yet."""
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                self.blobs = manifest.get('blobs', {})
+                self.aliases = manifest.get('aliases', {})
+            except Exception as e:
+                logger.error(f"Error loading icon manifest, rebuilding from {self.folder}: {e}")
+                self.blobs, self.aliases = {}, {}
+
+        # Drop entries whose file was removed
+        self.blobs = {
+            digest: blob for digest, blob in self.blobs.items()
+            if os.path.exists(os.path.join(self.folder, blob['file']))
+        }
+        self.aliases = {alias: digest for alias, digest in self.aliases.items() if digest in self.blobs}
+
+        known_files = {blob['file'] for blob in self.blobs.values()}
+        indexed = 0
+        if os.path.isdir(self.folder):
+            for file_name in sorted(os.listdir(self.folder)):
+                if not file_name.endswith('.png') or file_name in known_files:
+                    continue
+                with open(os.path.join(self.folder, file_name), 'rb') as f:
+                    content = f.read()
+                digest = hashlib.sha256(content).hexdigest()
+                self.blobs.setdefault(digest, {"file": file_name, "bytes": len(content)})
+                self.aliases.setdefault(file_name[:-len('.png')], digest)
+                indexed += 1
+        logger.info(f"Icon store has {len(self.aliases)} aliases over {len(self.blobs)} files ({indexed} newly indexed)")
+
+    def save(self):
+        with self._lock:
+            manifest = {
+                "format": 1,
+                "blobs": dict(sorted(self.blobs.items())),
+                "aliases": dict(sorted(self.aliases.items()))
+            }
+        write_json_atomic(self.manifest_path, manifest, indent=2)
+
+    def web_path_for(self, alias):
+        """Returns the front-end path of an alias's icon, or None if it has none yet."""
+        with self._lock:
+            digest = self.aliases.get(alias)
+            if digest is None:
+                return None
+            return os.path.join(self.web_path, self.blobs[digest]['file'])
+
+    def add(self, alias, content):
+        """Stores downloaded icon bytes under alias. Identical images share one file.
+
+        Returns:
+            str: Front-end path of the icon
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            blob = self.blobs.get(digest)
+            if blob is None:
+                file_name = f"{alias}.png"
+                os.makedirs(self.folder, exist_ok=True)
+                tmp_path = os.path.join(self.folder, file_name + '.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, os.path.join(self.folder, file_name))
+                blob = self.blobs[digest] = {"file": file_name, "bytes": len(content)}
+            elif blob['file'] != f"{alias}.png":
+                logger.info(f"Icon for {alias} is identical to {blob['file']}, storing as an alias")
+            self.aliases[alias] = digest
+            return os.path.join(self.web_path, blob['file'])
+
+    def get_or_fetch(self, alias, icon_url):
+        """Returns an alias's icon path, downloading it once if needed.
+
+        Concurrent callers asking for the same alias wait for the first download.
+        """
+        with self._lock:
+            if alias in self.aliases:
+                increment('icons_reused')
+                return os.path.join(self.web_path, self.blobs[self.aliases[alias]]['file'])
+            event = self._in_flight.get(alias)
+            owner = event is None
+            if owner:
+                event = self._in_flight[alias] = threading.Event()
+
+        if not owner:
+            event.wait()
+            return self.web_path_for(alias)
+
+        try:
+            with timer('icon_io'):
+                response = httpFetch.fetch_cached(f"{icon_url}{alias}.png")
+                if response.status_code != 200:
+                    logger.info(f"No image found for {alias}")
+                    increment('icons_missing')
+                    return None
+                logger.info(f"Downloaded icon {alias}")
+                increment('icons_downloaded')
+                return self.add(alias, response.content)
+        except Exception as e:
+            logger.error(f"Error downloading icon {alias}: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._in_flight.pop(alias, None)
+            event.set()
+
+    def fetch_many(self, aliases, icon_url, max_workers=8):
+        """Downloads every alias without an icon concurrently, each at most once.
+
+        Returns:
+            dict: alias -> icon path (None where no image exists)
+        """
+        unique = sorted(set(aliases))
+        pending = [alias for alias in unique if self.web_path_for(alias) is None]
+        logger.info(f"{len(unique)} icon aliases requested, {len(pending)} to download")
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda alias: self.get_or_fetch(alias, icon_url), pending))
+        return {alias: self.web_path_for(alias) for alias in unique}
+
+    def files(self):
+        """Icon file name -> content hash, one entry per stored image."""
+        with self._lock:
+            return {blob['file']: digest for digest, blob in self.blobs.items()}
+
+    def file_names(self):
+        """Sorted icon file names, one per stored image."""
+        with self._lock:
+            return sorted(blob['file'] for blob in self.blobs.values())
+
+    def write_icons_list(self, path):
+        """Regenerates the iconsList.js fallback module from the manifest."""
+        names = [f"'{name}'" for name in self.file_names()]
+        rows = [', '.join(names[i:i + 5]) for i in range(0, len(names), 5)]
+        text = (
+            "// This file contains a list of all Pokemon icon filenames for fallback purposes\n"
+            "// Used when directory listing is not available\n"
+            "\n"
+            "const iconsList = [\n"
+            + ",\n".join(f"  {row}" for row in rows)
+            + "\n];\n"
+            "\n"
+            "export default iconsList;"
+        )
+        write_text_atomic(path, text)
+        logger.info(f"Wrote {len(names)} icon names to {path}")
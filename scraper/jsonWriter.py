@@ -0,0 +1,175 @@
+"""
+Streaming, atomic JSON writers for the scraper output files.
+Top-level objects are written entry by entry into a temp file next to the
+target and renamed into place, so readers never see a half-written file
+and the full document never has to be encoded in one piece. Tournament
+meta can additionally be sharded into one file per date plus an index.
+"""
+
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger('JsonWriter')
+
+
+def _encode_entry(key, value, indent, level):
+    """Encodes one 'key: value' member exactly as json.dump(indent=...) would."""
+    pad = ' ' * (indent * level)
+    encoded = json.dumps(value, indent=indent, ensure_ascii=False)
+    if indent:
+        encoded = encoded.replace('\n', '\n' + pad)
+    return f"{pad}{json.dumps(key, ensure_ascii=False)}: {encoded}"
+
+
+def _open_temp(path, mode='w'):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    os.chmod(tmp_path, 0o644)
+    return os.fdopen(fd, mode, encoding=None if 'b' in mode else 'utf-8'), tmp_path
+
+
+def _commit_temp(f, tmp_path, path):
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+    os.replace(tmp_path, path)
+
+
+def write_json_atomic(path, data, indent=2):
+    """Writes any JSON value to path via a temp file and an atomic rename."""
+    f, tmp_path = _open_temp(path)
+    try:
+        for chunk in json.JSONEncoder(indent=indent, ensure_ascii=False).iterencode(data):
+            f.write(chunk)
+        _commit_temp(f, tmp_path, path)
+    except BaseException:
+        f.close()
+        os.remove(tmp_path)
+        raise
+
+
+def write_text_atomic(path, text):
+    """Writes a text file via a temp file and an atomic rename."""
+    f, tmp_path = _open_temp(path)
+    try:
+        f.write(text)
+        _commit_temp(f, tmp_path, path)
+    except BaseException:
+        f.close()
+        os.remove(tmp_path)
+        raise
+
+
+def write_json_object_stream(path, items, indent=2, wrap_key=None, extra=None):
+    """Streams (key, value) pairs as a JSON object to path, atomically.
+
+    Output is byte-identical to json.dump(dict(items), indent=indent,
+    ensure_ascii=False). With wrap_key the object is nested one level down,
+    e.g. {"cards": {...}}, and extra (key, value) pairs are written as its
+    siblings, e.g. {"cards": {...}, "iconAtlas": {...}}.
+
+    Returns:
+        int: Number of entries written
+    """
+    f, tmp_path = _open_temp(path)
+    count = 0
+    try:
+        level = 1
+        if wrap_key is not None:
+            f.write('{\n' + ' ' * indent + json.dumps(wrap_key, ensure_ascii=False) + ': ')
+            level = 2
+        f.write('{')
+        for key, value in items:
+            f.write(',\n' if count else '\n')
+            f.write(_encode_entry(key, value, indent, level))
+            count += 1
+        if count:
+            f.write('\n' + ' ' * (indent * (level - 1)))
+        f.write('}')
+        if wrap_key is not None:
+            for key, value in extra or ():
+                f.write(',\n' + _encode_entry(key, value, indent, 1))
+            f.write('\n}')
+        _commit_temp(f, tmp_path, path)
+        return count
+    except BaseException:
+        f.close()
+        os.remove(tmp_path)
+        raise
+
+
+def append_json_object_entry(path, key, value, indent=4):
+    """Appends one member to a top-level JSON object file, encoding only the new member.
+
+    The existing members are copied byte for byte into a temp file, the new
+    member is written after them and the temp file is renamed over path, so
+    a crash leaves either the old or the new file. The result is
+    byte-identical to re-dumping the object with the new key last. The
+    caller must make sure the key is not already present.
+    """
+    with open(path, 'rb') as src:
+        src.seek(0, os.SEEK_END)
+        size = src.tell()
+        tail_start = max(0, size - 4096)
+        src.seek(tail_start)
+        tail = src.read()
+
+        body = tail.rstrip()
+        if not body.endswith(b'}'):
+            raise ValueError(f"{path} does not end with a JSON object")
+        body = body[:-1].rstrip()
+        if not body and tail_start > 0:
+            raise ValueError(f"Could not locate the end of the last member in {path}")
+        empty = body.endswith(b'{')
+
+        f, tmp_path = _open_temp(path, 'wb')
+        try:
+            src.seek(0)
+            remaining = tail_start + len(body)
+            while remaining:
+                chunk = src.read(min(remaining, 1024 * 1024))
+                f.write(chunk)
+                remaining -= len(chunk)
+            separator = '\n' if empty else ',\n'
+            f.write((separator + _encode_entry(key, value, indent, 1) + '\n}').encode('utf-8'))
+            _commit_temp(f, tmp_path, path)
+        except BaseException:
+            f.close()
+            os.remove(tmp_path)
+            raise
+
+
+def shard_path(directory, date):
+    return os.path.join(directory, f"{date}.json")
+
+
+def write_meta_shards(directory, data_by_date, indent=4):
+    """Writes each date to its own shard file and refreshes the index.
+
+    Accepts a {date: decks} mapping or an iterable of (date, decks) pairs.
+    """
+    os.makedirs(directory, exist_ok=True)
+    items = data_by_date.items() if hasattr(data_by_date, 'items') else data_by_date
+    for date, decks in items:
+        write_json_atomic(shard_path(directory, date), decks, indent=indent)
+    return update_meta_index(directory)
+
+
+def update_meta_index(directory):
+    """Rebuilds index.json listing the available date shards."""
+    shards = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.json') or name == 'index.json':
+            continue
+        date = name[:-len('.json')]
+        shards[date] = {
+            "file": name,
+            "bytes": os.path.getsize(os.path.join(directory, name))
+        }
+    index = {"dates": sorted(shards, reverse=True), "shards": shards}
+    write_json_atomic(os.path.join(directory, 'index.json'), index, indent=2)
+    logger.info(f"Meta shard index updated with {len(shards)} dates")
+    return index
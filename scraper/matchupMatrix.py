@@ -0,0 +1,166 @@
+"""
+Vectorized matchup matrix for tournament meta snapshots.
+A snapshot's matchup tables are parsed once into a decks x opponents x
+{wins, losses, ties, matches} integer array. Folding non-top opponents into
+"Other", filling in missing matchups and recomputing win rates are array
+operations; the string dict format is only produced at the edge.
+"""
+
+import numpy as np
+
+from metaParsing import parse_int
+
+WINS, LOSSES, TIES, MATCHES = range(4)
+FIELDS = ('wins', 'losses', 'ties', 'matches')
+
+OTHER = "Other"
+EMPTY_MATCHUP = {"Matches": "0", "Score": "0-0", "Win Rate": "0%"}
+
+
+def parse_matchup(matchup_data):
+    """Parses one matchup dict into (wins, losses, ties, matches)."""
+    matches = parse_int(matchup_data.get("Matches", "0"))
+
+    score = matchup_data.get("Score")
+    if score is not None:
+        score_parts = [parse_int(part) for part in score.split('-', 2)]
+        score_parts += [0] * (3 - len(score_parts))
+        wins, losses, ties = score_parts
+    else:
+        # Estimate from win rate if no score is available
+        win_rate_str = matchup_data.get("Win Rate", "0%").replace('%', '')
+        win_rate = float(win_rate_str) / 100 if win_rate_str and win_rate_str != "0" else 0
+        wins = int(matches * win_rate) if matches > 0 else 0
+        losses = matches - wins if matches > 0 else 0
+        ties = 0
+
+    return wins, losses, ties, matches
+
+
+def win_rates(counts):
+    """Win percentage (wins / matches * 100) for any [..., 4] count array; 0 where no matches."""
+    counts = np.asarray(counts)
+    matches = counts[..., MATCHES]
+    rates = np.divide(
+        counts[..., WINS], matches,
+        out=np.zeros(matches.shape, dtype=float), where=matches > 0
+    )
+    return rates * 100
+
+
+class MatchupMatrix:
+    def __init__(self, deck_names, opponents, counts, present):
+        """
+        Args:
+            deck_names (list): Row labels, one per deck in the snapshot
+            opponents (list): Column labels, every opponent seen plus all deck names
+            counts (ndarray): int64 array of shape (decks, opponents, 4)
+            present (ndarray): bool array of shape (decks, opponents), True where a matchup was scraped
+        """
+        self.deck_names = deck_names
+        self.opponents = opponents
+        self.column = {name: i for i, name in enumerate(opponents)}
+        self.counts = counts
+        self.present = present
+
+    @classmethod
+    def from_snapshot(cls, decks):
+        """Parses every matchup string of a snapshot exactly once."""
+        deck_names = [deck["Deck Name"] for deck in decks]
+
+        # Columns: all deck names first, then every other opponent in first-seen order
+        column = dict.fromkeys(deck_names)
+        for deck in decks:
+            column.update(dict.fromkeys(deck.get("Matchups", {})))
+        opponents = list(column)
+        column = {name: i for i, name in enumerate(opponents)}
+
+        rows, cols, values = [], [], []
+        for row, deck in enumerate(decks):
+            for opponent, matchup_data in deck.get("Matchups", {}).items():
+                rows.append(row)
+                cols.append(column[opponent])
+                values.append(parse_matchup(matchup_data))
+
+        # Scatter all parsed cells in one assignment
+        counts = np.zeros((len(decks), len(opponents), 4), dtype=np.int64)
+        present = np.zeros((len(decks), len(opponents)), dtype=bool)
+        if values:
+            counts[rows, cols] = np.array(values, dtype=np.int64)
+            present[rows, cols] = True
+
+        return cls(deck_names, opponents, counts, present)
+
+    def top_mask(self, top_names=None):
+        """Boolean column mask of opponents that are in top_names (default: all decks)."""
+        top_names = set(self.deck_names if top_names is None else top_names)
+        return np.array([name in top_names for name in self.opponents], dtype=bool)
+
+    def fold_other(self, top_names=None):
+        """Sums every non-top opponent column per deck. Returns an int64 (decks, 4) array."""
+        non_top = ~self.top_mask(top_names)
+        return (self.counts[:, non_top, :] * self.present[:, non_top, None]).sum(axis=1)
+
+    def missing(self, top_names=None):
+        """Boolean (decks, opponents) mask of top matchups that were never scraped."""
+        return ~self.present & self.top_mask(top_names)[None, :]
+
+    def win_rates(self):
+        """Recomputed win percentage for every cell."""
+        return win_rates(self.counts)
+
+    def normalized_matchups(self, decks, top_names=None):
+        """Emits the normalized dict format for each deck.
+
+        Scraped matchups against top decks keep their original strings,
+        non-top opponents are replaced by a single "Other" entry and missing
+        top matchups are filled with zero records.
+
+        Returns:
+            list: (matchups dict, other matches, missing opponent names) per deck
+        """
+        top_array = self.top_mask(top_names)
+        other_array = self.fold_other(top_names)
+
+        # Convert to Python values once; only formatting happens per deck
+        top = top_array.tolist()
+        other = other_array.tolist()
+        other_rates = win_rates(other_array).tolist()
+        missing_rows, missing_cols = np.nonzero(self.missing(top_names))
+        missing_by_row = [[] for _ in decks]
+        for row, col in zip(missing_rows.tolist(), missing_cols.tolist()):
+            missing_by_row[row].append(self.opponents[col])
+
+        results = []
+        for row, deck in enumerate(decks):
+            current = deck.get("Matchups", {})
+            matchups = {name: data for name, data in current.items() if top[self.column[name]]}
+
+            other_matches = other[row][MATCHES]
+            if other_matches > 0:
+                matchups[OTHER] = {
+                    "Matches": str(other_matches),
+                    "Score": f"{other[row][WINS]}-{other[row][LOSSES]}",
+                    "Win Rate": f"{other_rates[row]:.1f}%"
+                }
+
+            missing_names = missing_by_row[row]
+            for name in missing_names:
+                matchups[name] = dict(EMPTY_MATCHUP)
+
+            results.append((matchups, other_matches, missing_names))
+        return results
+
+
+def normalize_snapshot(decks, top_names=None):
+    """Normalizes a snapshot's matchups in place.
+
+    Returns:
+        list: (deck name, other matches, missing opponent names) per deck
+    """
+    matrix = MatchupMatrix.from_snapshot(decks)
+    report = []
+    for deck, (matchups, other_matches, missing_names) in zip(decks, matrix.normalized_matchups(decks, top_names)):
+        deck["Matchups"] = matchups
+        report.append((deck["Deck Name"], other_matches, missing_names))
+    return report
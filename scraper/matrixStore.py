@@ -0,0 +1,129 @@
+"""
+Date-partitioned store for full matchup matrices.
+A full-matrix scrape collects the matchup table of every archetype in the
+meta list, not just the top MAX_DECKS. Each day is kept as one immutable
+partition holding the meta list and the non-empty cells of the
+decks x opponents x {wins, losses, ties, matches} matrix, so any top-N
+snapshot can be cut from it later without scraping again.
+"""
+
+import json
+import logging
+import os
+
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('MatrixStore')
+
+MANIFEST_NAME = 'manifest.json'
+
+# Meta list fields kept per deck (everything except the matchups)
+DECK_FIELDS = ("Rank", "Deck Name", "URL", "Count", "Share", "Win %")
+
+
+class MatchupMatrixStore:
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.partitions = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.partitions = json.load(f).get('partitions', {})
+
+    def _save_manifest(self):
+        manifest = {"format": 1, "partitions": dict(sorted(self.partitions.items()))}
+        write_json_atomic(self.manifest_path, manifest, indent=2)
+
+    def partition_path(self, date):
+        return os.path.join(self.directory, f"{date}.json")
+
+    def dates(self):
+        """Returns the stored dates in ascending order."""
+        return sorted(self.partitions)
+
+    def __contains__(self, date):
+        return date in self.partitions
+
+    def __len__(self):
+        return len(self.partitions)
+
+    def append(self, date, decks, replace=False):
+        """Stores a full snapshot (decks with their raw scraped matchups) as a sparse matrix.
+
+        Returns:
+            bool: True if the partition was written
+        """
+        from matchupMatrix import MatchupMatrix
+
+        if date in self.partitions and not replace:
+            logger.warning(f"Matrix for {date} already exists; not overwriting")
+            return False
+
+        matrix = MatchupMatrix.from_snapshot(decks)
+        rows, cols = matrix.present.nonzero()
+        cells = [
+            [row, col] + counts
+            for row, col, counts in zip(rows.tolist(), cols.tolist(), matrix.counts[rows, cols].tolist())
+        ]
+        partition = {
+            "format": 1,
+            "date": date,
+            "decks": [{field: deck.get(field) for field in DECK_FIELDS} for deck in decks],
+            # Columns are the decks in meta order, then these opponents
+            "extraOpponents": matrix.opponents[len(decks):],
+            "fields": ["wins", "losses", "ties", "matches"],
+            "cells": cells
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.partition_path(date)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(partition, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+        self.partitions[date] = {
+            "file": os.path.basename(path),
+            "decks": len(decks),
+            "cells": len(cells),
+            "bytes": os.path.getsize(path)
+        }
+        self._save_manifest()
+        logger.info(f"Stored matchup matrix {date}: {len(decks)} decks, {len(cells)} non-empty cells")
+        return True
+
+    def read(self, date):
+        """Returns the raw partition dict of a date."""
+        with open(self.partition_path(date), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def snapshot(self, date, top_n=None):
+        """Cuts a snapshot of the top_n decks from a stored matrix.
+
+        The result has the scraped snapshot format (matchup strings per
+        opponent, every opponent the deck met), ready for
+        check_and_normalize_matchups to fold everyone outside the cut into
+        "Other".
+
+        Args:
+            date (str): Stored matrix date
+            top_n (int): Decks to keep in meta-list order (default: all)
+
+        Returns:
+            list: Deck dicts with "Matchups"
+        """
+        partition = self.read(date)
+        decks = partition["decks"][:top_n] if top_n else partition["decks"]
+        names = [deck["Deck Name"] for deck in partition["decks"]] + partition["extraOpponents"]
+
+        snapshot = [dict(deck, Matchups={}) for deck in decks]
+        for row, col, wins, losses, ties, matches in partition["cells"]:
+            if row >= len(snapshot):
+                continue
+            rate = 100 * wins / matches if matches else 0
+            snapshot[row]["Matchups"][names[col]] = {
+                "Matches": str(matches),
+                "Score": f"{wins} - {losses} - {ties}",
+                "Win Rate": f"{rate:.2f}%"
+            }
+        return snapshot
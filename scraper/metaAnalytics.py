@@ -0,0 +1,225 @@
+"""
+Precomputed meta analytics built after each deck scrape.
+Produces per-deck share / win-rate / count / rank time series, overall
+records, day-over-day deltas, a matchup-weighted expected win rate against
+the current field with confidence intervals, tier scores, and each date's
+deck listing with parsed, sorted matchups, so the UI loads this one
+artifact instead of parsing and aggregating every snapshot in the browser.
+The artifact only depends on the snapshots, so an unchanged history
+rewrites it byte for byte.
+"""
+
+import logging
+import math
+
+import numpy as np
+
+from jsonWriter import write_json_atomic
+from matchupMatrix import MatchupMatrix, OTHER, WINS, LOSSES, TIES, MATCHES, win_rates
+from metaParsing import parse_int, parse_percent
+
+logger = logging.getLogger('MetaAnalytics')
+
+Z_95 = 1.96
+
+# Tiers by the lower bound of the expected win rate against the field (percent)
+TIER_THRESHOLDS = (('S', 54.0), ('A', 51.5), ('B', 49.0), ('C', 45.0))
+LOWEST_TIER = 'D'
+
+# Column order of the per-date matchup rows
+MATCHUP_COLUMNS = ("opponent", "winRate", "matches", "record")
+
+
+def wilson_interval(wins, matches, z=Z_95):
+    """Wilson score interval for a win proportion, in percent. Returns (low, high)."""
+    if matches <= 0:
+        return None, None
+    p = wins / matches
+    denominator = 1 + z * z / matches
+    centre = (p + z * z / (2 * matches)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / matches + z * z / (4 * matches * matches)) / denominator
+    return round((centre - margin) * 100, 2), round((centre + margin) * 100, 2)
+
+
+def tier_for(score):
+    if score is None:
+        return None
+    for tier, threshold in TIER_THRESHOLDS:
+        if score >= threshold:
+            return tier
+    return LOWEST_TIER
+
+
+def expected_field_win_rates(decks):
+    """Matchup-weighted expected win rate of each deck against the given snapshot's field.
+
+    Each opponent is weighted by its share; 'Other' gets the share not
+    covered by the listed decks. Opponents never played are left out of
+    the weighting for that deck.
+
+    Returns:
+        list: (expected win rate, ci low, ci high, total wins, total matches) per deck
+    """
+    matrix = MatchupMatrix.from_snapshot(decks)
+    shares = {deck["Deck Name"]: parse_percent(deck.get("Share")) or 0.0 for deck in decks}
+    other_share = max(0.0, 100.0 - sum(shares.values()))
+
+    weights = np.array([
+        shares.get(name, other_share if name == OTHER else 0.0)
+        for name in matrix.opponents
+    ])
+    matches = matrix.counts[..., MATCHES]
+    played = matches > 0
+    rates = win_rates(matrix.counts) / 100
+    weight_matrix = weights[None, :] * played
+    weight_totals = weight_matrix.sum(axis=1)
+    normalized = np.divide(
+        weight_matrix, weight_totals[:, None],
+        out=np.zeros(weight_matrix.shape), where=weight_totals[:, None] > 0
+    )
+    expected = (normalized * rates).sum(axis=1)
+
+    # Variance of a weighted sum of independent proportions
+    variance_terms = np.divide(
+        rates * (1 - rates), matches,
+        out=np.zeros(rates.shape), where=played
+    )
+    std_error = np.sqrt((normalized ** 2 * variance_terms).sum(axis=1))
+    total_wins = matrix.counts[..., WINS].sum(axis=1)
+    total_matches = matches.sum(axis=1)
+
+    results = []
+    for row in range(len(decks)):
+        if weight_totals[row] <= 0:
+            results.append((None, None, None, int(total_wins[row]), int(total_matches[row])))
+            continue
+        e = expected[row] * 100
+        margin = Z_95 * std_error[row] * 100
+        results.append((round(e, 2), round(e - margin, 2), round(e + margin, 2),
+                        int(total_wins[row]), int(total_matches[row])))
+    return results
+
+
+def build_meta_analytics(snapshots):
+    """Builds the analytics artifact from (date, decks) pairs in date order."""
+    snapshots = list(snapshots)
+    dates = [date for date, _ in snapshots]
+    deck_names = list(dict.fromkeys(deck["Deck Name"] for _, decks in snapshots for deck in decks))
+    position = {name: i for i, name in enumerate(deck_names)}
+
+    # Dense (decks x dates) series; NaN where a deck was not in that day's list
+    shape = (len(deck_names), len(dates))
+    share = np.full(shape, np.nan)
+    win_rate = np.full(shape, np.nan)
+    count = np.full(shape, np.nan)
+    rank = np.full(shape, np.nan)
+    records = [[None] * len(dates) for _ in deck_names]
+    matchups = [{} for _ in deck_names]
+    urls = [None] * len(deck_names)
+    rankings = {}
+    for col, (date, decks) in enumerate(snapshots):
+        totals = MatchupMatrix.from_snapshot(decks).counts.sum(axis=1)
+        for deck, total in zip(decks, totals):
+            row = position[deck["Deck Name"]]
+            share[row, col] = _or_nan(parse_percent(deck.get("Share")))
+            win_rate[row, col] = _or_nan(parse_percent(deck.get("Win %")))
+            count[row, col] = parse_int(deck.get("Count"))
+            rank[row, col] = parse_int(deck.get("Rank"))
+            records[row][col] = [int(total[WINS]), int(total[LOSSES]), int(total[TIES])]
+            matchups[row][date] = matchup_rows(deck)
+            urls[row] = deck.get("URL") or urls[row]
+        rankings[date] = list(dict.fromkeys(deck["Deck Name"] for deck in decks))
+
+    def series(values):
+        return [None if np.isnan(v) else round(float(v), 2) for v in values]
+
+    def int_series(values):
+        return [None if np.isnan(v) else int(v) for v in values]
+
+    latest_date = dates[-1] if dates else None
+    previous_date = dates[-2] if len(dates) > 1 else None
+    field_date, field_decks = _field_snapshot(snapshots)
+    field = {deck["Deck Name"]: result for deck, result in zip(field_decks, expected_field_win_rates(field_decks))}
+
+    decks_out = {}
+    for name, row in position.items():
+        entry = {
+            "url": urls[row],
+            "share": series(share[row]),
+            "winRate": series(win_rate[row]),
+            "count": int_series(count[row]),
+            "rank": int_series(rank[row]),
+            "record": records[row],
+        }
+        if len(dates) > 1:
+            entry["delta"] = {
+                "share": _delta(share[row, -1], share[row, -2]),
+                "winRate": _delta(win_rate[row, -1], win_rate[row, -2]),
+                "rank": _delta(rank[row, -2], rank[row, -1], integer=True),  # positive means moved up
+            }
+        if name in field:
+            expected, low, high, wins, matches = field[name]
+            entry["field"] = {
+                "expectedWinRate": expected,
+                "expectedWinRateCI": [low, high],
+                "matches": matches,
+                "observedWinRateCI": list(wilson_interval(wins, matches)),
+                "tierScore": low,
+                "tier": tier_for(low),
+            }
+        entry["matchups"] = matchups[row]
+        decks_out[name] = entry
+
+    present_latest = {deck["Deck Name"] for deck in snapshots[-1][1]} if snapshots else set()
+    present_previous = {deck["Deck Name"] for deck in snapshots[-2][1]} if previous_date else set()
+    return {
+        "dates": dates,
+        "latestDate": latest_date,
+        "previousDate": previous_date,
+        "fieldDate": field_date,
+        "newDecks": sorted(present_latest - present_previous) if previous_date else [],
+        "droppedDecks": sorted(present_previous - present_latest),
+        "tierThresholds": dict(TIER_THRESHOLDS),
+        "matchupColumns": list(MATCHUP_COLUMNS),
+        "rankings": rankings,
+        "decks": decks_out,
+    }
+
+
+def matchup_rows(deck):
+    """A deck's played matchups as [opponent, win rate, matches, score] rows, most played first."""
+    rows = []
+    for opponent, matchup in deck.get("Matchups", {}).items():
+        matches = parse_int(matchup.get("Matches"))
+        if matches > 0:
+            rows.append([opponent, parse_percent(matchup.get("Win Rate")), matches, matchup.get("Score")])
+    rows.sort(key=lambda row: -row[2])
+    return rows
+
+
+def _field_snapshot(snapshots):
+    """Latest (date, decks) with any recorded matches; a failed matchup scrape leaves only zero records."""
+    for date, decks in reversed(snapshots):
+        if any(parse_int(matchup.get("Matches")) > 0
+               for deck in decks for matchup in deck.get("Matchups", {}).values()):
+            return date, decks
+    return None, []
+
+
+def _or_nan(value):
+    return np.nan if value is None else value
+
+
+def _delta(current, previous, integer=False):
+    if np.isnan(current) or np.isnan(previous):
+        return None
+    difference = current - previous
+    return int(difference) if integer else round(float(difference), 2)
+
+
+def write_meta_analytics(store, path):
+    """Builds the analytics from every stored snapshot and writes the artifact."""
+    analytics = build_meta_analytics(store.iter_snapshots())
+    write_json_atomic(path, analytics, indent=2)
+    logger.info(f"Meta analytics for {len(analytics['decks'])} decks over {len(analytics['dates'])} dates saved to {path}")
+    return analytics
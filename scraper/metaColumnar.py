@@ -0,0 +1,191 @@
+"""
+Columnar export of the tournament meta history.
+Each snapshot is flattened into two typed tables, one row per deck and one
+row per (deck, opponent) matchup with integer wins/losses/ties/matches, and
+written as one Parquet or Arrow IPC file per date:
+
+    <directory>/decks/2025-05-13.parquet
+    <directory>/matchups/2025-05-13.parquet
+
+A date range then loads by reading just its files (memory-mapped), either
+through read_meta_table() or directly with pandas.read_parquet /
+pyarrow.dataset on a table folder. pyarrow is optional; without it the
+export is skipped.
+"""
+
+import logging
+import os
+from datetime import date as Date
+
+import numpy as np
+
+from matchupMatrix import MatchupMatrix, WINS, LOSSES, TIES, MATCHES
+from metaParsing import parse_int, parse_percent
+
+logger = logging.getLogger('MetaColumnar')
+
+TABLES = ('decks', 'matchups')
+
+# File extension per format; Arrow IPC files are written uncompressed so they memory-map without copying
+EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+
+def _schemas(pa):
+    return {
+        'decks': pa.schema([
+            ('date', pa.date32()),
+            ('rank', pa.int16()),
+            ('deck_name', pa.string()),
+            ('url', pa.string()),
+            ('count', pa.int32()),
+            ('share', pa.float64()),
+            ('win_rate', pa.float64()),
+        ]),
+        'matchups': pa.schema([
+            ('date', pa.date32()),
+            ('deck_name', pa.string()),
+            ('opponent', pa.string()),
+            ('wins', pa.int32()),
+            ('losses', pa.int32()),
+            ('ties', pa.int32()),
+            ('matches', pa.int32()),
+            ('win_rate', pa.float64()),
+        ]),
+    }
+
+
+def flatten_snapshot(date, decks):
+    """Flattens one snapshot into column dicts for the decks and matchups tables.
+
+    Matchup counts come from the vectorized MatchupMatrix parse, so each
+    "W - L - T" string is parsed exactly once.
+
+    Args:
+        date (str): Snapshot date (YYYY-MM-DD)
+        decks (list): Deck dicts in the scraped format
+
+    Returns:
+        tuple: (deck columns, matchup columns), dicts of column name -> list or array
+    """
+    day = Date.fromisoformat(date)
+    deck_columns = {
+        'date': [day] * len(decks),
+        'rank': [parse_int(deck.get('Rank')) or None for deck in decks],
+        'deck_name': [deck.get('Deck Name') for deck in decks],
+        'url': [deck.get('URL') for deck in decks],
+        'count': [parse_int(deck.get('Count')) for deck in decks],
+        'share': [parse_percent(deck.get('Share')) for deck in decks],
+        'win_rate': [parse_percent(deck.get('Win %')) for deck in decks],
+    }
+
+    matrix = MatchupMatrix.from_snapshot(decks)
+    rows, cols = matrix.present.nonzero()
+    counts = matrix.counts[rows, cols].astype(np.int32)
+    opponents = np.array(matrix.opponents, dtype=object)
+    deck_names = np.array(matrix.deck_names, dtype=object)
+    matchup_columns = {
+        'date': [day] * len(rows),
+        'deck_name': deck_names[rows],
+        'opponent': opponents[cols],
+        'wins': counts[:, WINS],
+        'losses': counts[:, LOSSES],
+        'ties': counts[:, TIES],
+        'matches': counts[:, MATCHES],
+        'win_rate': [
+            parse_percent(decks[row]["Matchups"][matrix.opponents[col]].get("Win Rate"))
+            for row, col in zip(rows.tolist(), cols.tolist())
+        ],
+    }
+    return deck_columns, matchup_columns
+
+
+def partition_path(directory, table, date, fmt='parquet'):
+    return os.path.join(directory, table, f"{date}{EXTENSIONS[fmt]}")
+
+
+def write_snapshot(directory, date, decks, fmt='parquet'):
+    """Writes one snapshot's decks and matchups files. Returns the row counts."""
+    import pyarrow as pa
+
+    schemas = _schemas(pa)
+    written = {}
+    for table, columns in zip(TABLES, flatten_snapshot(date, decks)):
+        arrow_table = pa.Table.from_pydict(columns, schema=schemas[table])
+        path = partition_path(directory, table, date, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        if fmt == 'arrow':
+            with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+        else:
+            import pyarrow.parquet as pq
+
+            pq.write_table(arrow_table, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+        written[table] = arrow_table.num_rows
+    return written
+
+
+def export_meta_columnar(store, directory, fmt='parquet', force_dates=()):
+    """Writes columnar files for force_dates and for any stored date without them.
+
+    Args:
+        store: MetaSnapshotStore or SqliteMetaStore
+        directory (str): Export root holding the decks/ and matchups/ folders
+        fmt (str): 'parquet' or 'arrow'
+        force_dates (iterable): Dates rewritten even if their files exist
+
+    Returns:
+        int: Dates written, or None when pyarrow is unavailable
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        logger.error("pyarrow is not installed (see python_requirements.txt); skipping the columnar meta export")
+        return None
+
+    force_dates = set(force_dates)
+    pending = [
+        date for date in store.dates()
+        if date in force_dates or not all(os.path.exists(partition_path(directory, table, date, fmt)) for table in TABLES)
+    ]
+    rows = dict.fromkeys(TABLES, 0)
+    for date in pending:
+        for table, count in write_snapshot(directory, date, store.read(date), fmt).items():
+            rows[table] += count
+    logger.info(f"Wrote {fmt} meta tables for {len(pending)} dates to {directory} "
+                f"({rows['decks']} deck rows, {rows['matchups']} matchup rows)")
+    return len(pending)
+
+
+def read_meta_table(directory, table='decks', start=None, end=None, fmt='parquet'):
+    """Loads one table for the dates within [start, end] (inclusive, ISO strings).
+
+    Only the files of the requested dates are opened, and they are
+    memory-mapped; call .to_pandas() on the result for a DataFrame.
+
+    Returns:
+        pyarrow.Table: The concatenated rows (empty with the table's schema if no date matches)
+    """
+    import pyarrow as pa
+
+    folder = os.path.join(directory, table)
+    extension = EXTENSIONS[fmt]
+    dates = sorted(
+        name[:-len(extension)] for name in (os.listdir(folder) if os.path.isdir(folder) else ())
+        if name.endswith(extension)
+    )
+    dates = [date for date in dates if (start is None or date >= start) and (end is None or date <= end)]
+
+    tables = []
+    for date in dates:
+        path = partition_path(directory, table, date, fmt)
+        if fmt == 'arrow':
+            tables.append(pa.ipc.open_file(pa.memory_map(path, 'r')).read_all())
+        else:
+            import pyarrow.parquet as pq
+
+            tables.append(pq.read_table(path, memory_map=True))
+    if not tables:
+        return _schemas(pa)[table].empty_table()
+    return pa.concat_tables(tables)
@@ -0,0 +1,89 @@
+"""
+Multi-process historical matchup correction.
+Each worker process loads one date partition, normalizes it and returns
+it; the parent writes results back as they complete, so memory holds only
+the snapshots in flight and the repair pass scales with core count.
+This module stays free of scraper imports so worker start-up is cheap.
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matchupMatrix import normalize_snapshot
+
+logger = logging.getLogger('MetaCorrection')
+
+
+def correct_partition(store, date):
+    """Worker: loads and normalizes one snapshot. Returns (date, decks, timing).
+
+    store arrives pickled: a partition store brings its manifest, an SQLite
+    store just its path and reconnects in the worker.
+    """
+    start = time.perf_counter()
+    decks = store.read(date)
+    loaded = time.perf_counter()
+    report = normalize_snapshot(decks)
+    normalized = time.perf_counter()
+
+    timing = {
+        "decks": len(decks),
+        "otherFolds": sum(1 for _, other_matches, _ in report if other_matches > 0),
+        "filledMatchups": sum(len(missing) for _, _, missing in report),
+        "load": loaded - start,
+        "normalize": normalized - loaded,
+    }
+    return date, decks, timing
+
+
+def correct_store(store, processes=None):
+    """Normalizes every partition of store across a process pool.
+
+    Results are written back one partition at a time as workers finish;
+    the store's manifest is written once at the end.
+
+    Returns:
+        dict: Per-date timing breakdown (load, normalize, write seconds and counts)
+    """
+    timings = {}
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {
+                executor.submit(correct_partition, store, date): date
+                for date in store.dates()
+            }
+            for future in as_completed(futures):
+                date = futures[future]
+                try:
+                    date, decks, timing = future.result()
+                except Exception as e:
+                    logger.error(f"Correction failed for {date}: {e}")
+                    continue
+                write_start = time.perf_counter()
+                store.append(date, decks, replace=True, flush=False)
+                timing["write"] = time.perf_counter() - write_start
+                timings[date] = timing
+                logger.info(f"Corrected {date} ({len(timings)}/{len(futures)})")
+    finally:
+        store.flush()
+    return timings
+
+
+def format_timing_report(timings):
+    """Formats the per-date timing breakdown as a table."""
+    lines = [f"{'Date':<12}{'Decks':>6}{'Other':>6}{'Filled':>7}{'Load ms':>9}{'Norm ms':>9}{'Write ms':>9}"]
+    totals = {"load": 0.0, "normalize": 0.0, "write": 0.0}
+    for date in sorted(timings):
+        t = timings[date]
+        for key in totals:
+            totals[key] += t[key]
+        lines.append(
+            f"{date:<12}{t['decks']:>6}{t['otherFolds']:>6}{t['filledMatchups']:>7}"
+            f"{t['load'] * 1000:>9.1f}{t['normalize'] * 1000:>9.1f}{t['write'] * 1000:>9.1f}"
+        )
+    lines.append(
+        f"{'Total':<12}{'':>6}{'':>6}{'':>7}"
+        f"{totals['load'] * 1000:>9.1f}{totals['normalize'] * 1000:>9.1f}{totals['write'] * 1000:>9.1f}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,427 @@
+"""
+Delta-chain encoding of the tournament meta history.
+Consecutive daily snapshots mostly list the same archetypes with slightly
+different numbers, so only every BASE_EVERY-th snapshot is stored in full
+(a base); the days between are stored as deltas against the previous day:
+added and dropped archetypes, changed fields, changed or removed matchups
+and the new deck order. Any date is rebuilt by replaying the deltas since
+its base, and storage grows with the amount of change rather than with the
+number of days. MetaDeltaStore is a snapshot store like MetaSnapshotStore
+(selected with --storage delta), so the scrape, correction, analytics and
+export steps read every date through it.
+
+Each delta also carries a small summary (share changes, rank moves,
+new/dropped archetypes, matches added per deck) that can be read without
+reconstructing anything.
+"""
+
+import copy
+import json
+import logging
+import os
+from decimal import Decimal, ROUND_HALF_UP
+
+from jsonWriter import write_json_atomic
+from matchupMatrix import EMPTY_MATCHUP
+from metaParsing import parse_int, parse_percent
+
+logger = logging.getLogger('MetaDelta')
+
+MANIFEST_NAME = 'manifest.json'
+FORMAT = 1
+
+# Field order of a scraped matchup, packed into a list inside deltas when it cannot be stored as count increments
+MATCHUP_FIELDS = ("Matches", "Score", "Win Rate")
+
+
+def keyed_decks(decks):
+    """Keys decks by name; a name listed twice (two variants) gets '#2', '#3', ... on its repeats."""
+    keyed, seen = {}, {}
+    for deck in decks:
+        name = deck["Deck Name"]
+        seen[name] = seen.get(name, 0) + 1
+        keyed[name if seen[name] == 1 else f"{name}#{seen[name]}"] = deck
+    return keyed
+
+
+def format_matchup(wins, losses, ties):
+    """Renders counts the way Limitless shows them: '1820 - 1820 - 84', '48.87%' (half-up)."""
+    matches = wins + losses + ties
+    rate = (Decimal(100 * wins) / matches).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    return {"Matches": str(matches), "Score": f"{wins} - {losses} - {ties}", "Win Rate": f"{rate}%"}
+
+
+def _counts(matchup):
+    """(wins, losses, ties) of a matchup that format_matchup reproduces exactly, else None."""
+    if not matchup:
+        return None
+    parts = str(matchup.get("Score", "")).split(' - ')
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    counts = tuple(int(part) for part in parts)
+    if sum(counts) == 0 or format_matchup(*counts) != matchup:
+        return None
+    return counts
+
+
+def _pack_matchup(old, new):
+    """Encodes a changed matchup compactly.
+
+    Returns:
+        0 for the empty placeholder, [+wins, +losses, +ties] when both sides
+            are in Limitless' own format, else [Matches, Score, Win Rate], or
+            the dict itself if it has other fields
+    """
+    if new == EMPTY_MATCHUP:
+        return 0
+    old_counts, new_counts = _counts(old), _counts(new)
+    if old_counts is not None and new_counts is not None:
+        return [n - o for n, o in zip(new_counts, old_counts)]
+    if list(new) == list(MATCHUP_FIELDS):
+        return [new[field] for field in MATCHUP_FIELDS]
+    return new
+
+
+def _unpack_matchup(old, packed):
+    if packed == 0:
+        return dict(EMPTY_MATCHUP)
+    if isinstance(packed, dict):
+        return copy.deepcopy(packed)
+    if isinstance(packed[0], int):
+        return format_matchup(*(o + d for o, d in zip(_counts(old), packed)))
+    return dict(zip(MATCHUP_FIELDS, packed))
+
+
+def diff_snapshots(previous, current):
+    """Computes the delta that turns the previous snapshot into the current one.
+
+    Args:
+        previous (list): Deck dicts of the earlier snapshot
+        current (list): Deck dicts of the later snapshot
+
+    Returns:
+        dict: Delta with "order", "added", "dropped", "changed", "summary"
+            and, for decks whose matchups plain replay would order
+            differently, "matchupOrder" (positions in the replayed order)
+    """
+    before = keyed_decks(previous)
+    after = keyed_decks(current)
+
+    added = {key: deck for key, deck in after.items() if key not in before}
+    dropped = [key for key in before if key not in after]
+    changed = {}
+    for key, deck in after.items():
+        old = before.get(key)
+        if old is None:
+            continue
+        fields = {field: value for field, value in deck.items() if field != "Matchups" and old.get(field) != value}
+        old_matchups, new_matchups = old.get("Matchups", {}), deck.get("Matchups", {})
+        set_matchups = {opponent: _pack_matchup(old_matchups.get(opponent), matchup)
+                        for opponent, matchup in new_matchups.items() if old_matchups.get(opponent) != matchup}
+        drop_matchups = [opponent for opponent in old_matchups if opponent not in new_matchups]
+        if set_matchups or drop_matchups:
+            fields["Matchups"] = {"set": set_matchups, "drop": drop_matchups}
+        if fields:
+            changed[key] = fields
+
+    delta = {
+        "order": list(after),
+        "added": added,
+        "dropped": dropped,
+        "changed": changed,
+        "summary": summarize(before, after),
+    }
+
+    # Where replay would order a deck's matchups differently, record the
+    # target order as positions in the replayed order
+    replayed = keyed_decks(apply_delta(previous, delta))
+    matchup_order = {}
+    for key, deck in after.items():
+        replayed_order = list(replayed[key].get("Matchups", {}))
+        target_order = list(deck.get("Matchups", {}))
+        if replayed_order != target_order:
+            position = {opponent: i for i, opponent in enumerate(replayed_order)}
+            matchup_order[key] = [position[opponent] for opponent in target_order]
+    if matchup_order:
+        delta["matchupOrder"] = matchup_order
+    return delta
+
+
+def apply_delta(previous, delta):
+    """Replays a delta on the previous snapshot. The previous snapshot is left untouched.
+
+    Returns:
+        list: Deck dicts of the later snapshot
+    """
+    decks = keyed_decks(previous)
+    result = []
+    for key in delta["order"]:
+        if key in delta["added"]:
+            result.append(copy.deepcopy(delta["added"][key]))
+            continue
+        deck = dict(decks[key])
+        changes = delta["changed"].get(key, {})
+        matchups = dict(deck.get("Matchups", {}))
+        for field, value in changes.items():
+            if field != "Matchups":
+                deck[field] = value
+        if "Matchups" in changes:
+            for opponent in changes["Matchups"]["drop"]:
+                matchups.pop(opponent, None)
+            for opponent, packed in changes["Matchups"]["set"].items():
+                matchups[opponent] = _unpack_matchup(matchups.get(opponent), packed)
+        order = delta.get("matchupOrder", {}).get(key)
+        if order is not None:
+            items = list(matchups.items())
+            matchups = dict(items[i] for i in order)
+        if "Matchups" in deck or matchups:
+            deck["Matchups"] = matchups
+        result.append(deck)
+    return result
+
+
+def summarize(before, after):
+    """Share changes (percentage points), rank moves, new/dropped archetypes and matches added per deck.
+
+    Args:
+        before (dict): Earlier snapshot keyed by keyed_decks()
+        after (dict): Later snapshot keyed by keyed_decks()
+    """
+    summary = {
+        "added": [name for name in after if name not in before],
+        "dropped": [name for name in before if name not in after],
+        "shareChanges": {},
+        "rankMoves": {},
+        "matchesAdded": {},
+    }
+    for name, deck in after.items():
+        old = before.get(name)
+        if old is None:
+            continue
+        old_share, new_share = parse_percent(old.get("Share", "")), parse_percent(deck.get("Share", ""))
+        if old_share is not None and new_share is not None and old_share != new_share:
+            summary["shareChanges"][name] = round(new_share - old_share, 2)
+        if old.get("Rank") != deck.get("Rank"):
+            summary["rankMoves"][name] = [parse_int(old.get("Rank")), parse_int(deck.get("Rank"))]
+        matches = (sum(parse_int(m.get("Matches")) for m in deck.get("Matchups", {}).values())
+                   - sum(parse_int(m.get("Matches")) for m in old.get("Matchups", {}).values()))
+        if matches:
+            summary["matchesAdded"][name] = matches
+    return summary
+
+
+class MetaDeltaStore:
+    """MetaSnapshotStore interface over a chain of base snapshots and per-day deltas.
+
+    Appends are buffered and encoded on flush(): the chain is re-encoded
+    from the earliest appended date on, into files of a new generation,
+    and only then does the manifest switch over to them, so a crash leaves
+    the previous chain readable. Files of older generations are removed
+    after the switch.
+    """
+
+    def __init__(self, directory, base_every=7):
+        """
+        Args:
+            directory (str): Folder for the manifest, base and delta files
+            base_every (int): A full base snapshot is stored at least every this many dates
+        """
+        self.directory = directory
+        self.base_every = max(1, base_every)
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.entries = {}
+        self.generation = 0
+        self._pending = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('format') == FORMAT:
+                self.entries = manifest.get('dates', {})
+                self.generation = manifest.get('generation', 0)
+
+    def dates(self):
+        """Returns the stored dates in ascending order."""
+        return sorted(set(self.entries) | set(self._pending))
+
+    def __contains__(self, date):
+        return date in self.entries or date in self._pending
+
+    def __len__(self):
+        return len(set(self.entries) | set(self._pending))
+
+    def _write(self, date, kind, payload):
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{date}.{kind}.{self.generation}.json"
+        path = os.path.join(self.directory, name)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return {"type": kind, "file": name, "bytes": os.path.getsize(path)}
+
+    def _read(self, date):
+        entry = self.entries[date]
+        with open(os.path.join(self.directory, entry['file']), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _encode(self, entries, date, decks, previous_date, previous_decks):
+        """Adds date to entries as a base or as a delta against previous_decks."""
+        since_base = 0
+        for earlier in sorted(entries, reverse=True):
+            if entries[earlier]['type'] == 'base':
+                break
+            since_base += 1
+        if previous_decks is None or since_base + 1 >= self.base_every:
+            entries[date] = self._write(date, 'base', decks)
+            return
+        delta = diff_snapshots(previous_decks, decks)
+        if apply_delta(previous_decks, delta) != decks:
+            # Something the delta format cannot express; a base keeps the chain exact
+            logger.warning(f"Delta for {date} does not replay exactly, storing a base instead")
+            entries[date] = self._write(date, 'base', decks)
+            return
+        delta["previous"] = previous_date
+        entries[date] = self._write(date, 'delta', delta)
+        entries[date]["previous"] = previous_date
+
+    def _iter_encoded(self, start=None):
+        """Yields (date, decks) of the encoded chain from start on, replaying each delta once."""
+        decks = None
+        for date in sorted(self.entries):
+            if start is not None and date < start:
+                continue
+            if decks is None:
+                decks = self._snapshot_encoded(date)
+            elif self.entries[date]['type'] == 'base':
+                decks = self._read(date)
+            else:
+                decks = apply_delta(decks, self._read(date))
+            yield date, decks
+
+    def _snapshot_encoded(self, date):
+        chain = []
+        current = date
+        while self.entries[current]['type'] == 'delta':
+            chain.append(current)
+            current = self.entries[current]['previous']
+        decks = self._read(current)
+        for delta_date in reversed(chain):
+            decks = apply_delta(decks, self._read(delta_date))
+        return decks
+
+    def append(self, date, decks, replace=False, flush=True):
+        """Stores a snapshot; an existing date is only replaced when replace is True.
+
+        With flush=False the snapshot is kept in memory until flush(), so a
+        batch of appends re-encodes the chain once.
+
+        Returns:
+            bool: True if the snapshot was stored
+        """
+        if not replace and date in self:
+            logger.warning(f"Snapshot for {date} already exists; not overwriting")
+            return False
+        self._pending[date] = decks
+        if flush:
+            self.flush()
+        logger.info(f"Stored snapshot {date} with {len(decks)} decks")
+        return True
+
+    def flush(self):
+        """Re-encodes the chain from the earliest pending date on and switches the manifest to it."""
+        if not self._pending:
+            return
+        start = min(self._pending)
+        entries = {date: entry for date, entry in self.entries.items() if date < start}
+        previous_date = max(entries, default=None)
+        previous = self._snapshot_encoded(previous_date) if previous_date else None
+
+        tail = dict(self._iter_encoded(start))
+        tail.update(self._pending)
+        self.generation += 1
+        for date in sorted(tail):
+            self._encode(entries, date, tail[date], previous_date, previous)
+            previous_date, previous = date, tail[date]
+
+        manifest = {"format": FORMAT, "baseEvery": self.base_every, "generation": self.generation,
+                    "dates": dict(sorted(entries.items()))}
+        write_json_atomic(self.manifest_path, manifest, indent=2)
+        self.entries = entries
+        self._pending = {}
+
+        referenced = {entry['file'] for entry in entries.values()} | {MANIFEST_NAME}
+        for name in os.listdir(self.directory):
+            if name.endswith('.json') and name not in referenced:
+                os.remove(os.path.join(self.directory, name))
+
+        sizes = [entry['bytes'] for entry in entries.values()]
+        bases = sum(1 for entry in entries.values() if entry['type'] == 'base')
+        logger.info(f"Encoded {len(tail)} dates into {self.directory}: {bases} bases and "
+                    f"{len(entries) - bases} deltas, {sum(sizes) / 1024:.1f} KB in total")
+
+    def snapshot(self, date):
+        """Reconstructs one date by replaying the deltas since its base.
+
+        Returns:
+            list: Deck dicts of the snapshot
+
+        Raises:
+            KeyError: When the date is not stored
+        """
+        if date in self._pending:
+            return copy.deepcopy(self._pending[date])
+        if date not in self.entries:
+            raise KeyError(date)
+        return self._snapshot_encoded(date)
+
+    def read(self, date):
+        """Returns one snapshot as a list of decks."""
+        return self.snapshot(date)
+
+    def iter_decks(self, date):
+        """Yields the decks of one snapshot in their stored order."""
+        yield from self.snapshot(date)
+
+    def read_range(self, start=None, end=None):
+        """Returns {date: decks} for dates within [start, end] (inclusive, ISO strings)."""
+        return {
+            date: decks
+            for date, decks in self.iter_snapshots()
+            if (start is None or date >= start) and (end is None or date <= end)
+        }
+
+    def summary(self, date):
+        """Returns the change summary of a delta date, or None for a base."""
+        if self.entries[date]['type'] != 'delta':
+            return None
+        return self._read(date)['summary']
+
+    def iter_snapshots(self):
+        """Yields (date, decks) in date order, replaying each delta once."""
+        encoded = self._iter_encoded()
+        current = next(encoded, None)
+        for date in self.dates():
+            while current is not None and current[0] < date:
+                current = next(encoded, None)
+            if date in self._pending:
+                yield date, copy.deepcopy(self._pending[date])
+            else:
+                yield current
+                current = next(encoded, None)
+
+    def import_snapshots(self, snapshots):
+        """Bulk-loads (date, decks) pairs, e.g. from the date partitions, in one encoding pass. Returns the count."""
+        count = 0
+        for date, decks in snapshots:
+            self.append(date, decks, replace=True, flush=False)
+            count += 1
+        self.flush()
+        return count
+
+    def import_json(self, path):
+        """One-time migration of a monolithic {date: decks} file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        count = self.import_snapshots(data.items())
+        logger.info(f"Imported {count} snapshots from {path}")
+        return count
@@ -0,0 +1,22 @@
+"""
+Parsers for the display strings of the Limitless deck pages.
+Counts, ranks, shares and win rates are stored as scraped ("3,724",
+"20.22%"); every module that turns them into numbers uses these helpers so
+blanks and 'N/A' are handled the same way everywhere.
+"""
+
+
+def parse_int(text):
+    """Parses counts like '3,724' or ' 1820 '. Returns 0 for blanks."""
+    try:
+        return int(text.replace(',', ''))
+    except (ValueError, AttributeError):
+        return 0
+
+
+def parse_percent(text):
+    """Parses '20.22%' into 20.22. Returns None for blanks and 'N/A'."""
+    try:
+        return float(str(text).replace('%', '').replace(',', '').strip())
+    except ValueError:
+        return None
@@ -0,0 +1,121 @@
+"""
+Append-only, date-partitioned store for tournament meta snapshots.
+Each day is an immutable JSON Lines partition (one deck per line) listed in
+a small manifest, so adding a day only writes that day's data and history
+queries memory-map just the partitions they need.
+"""
+
+import json
+import logging
+import mmap
+import os
+
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('MetaStore')
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class MetaSnapshotStore:
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.partitions = {}
+        self._load_manifest()
+
+    def _load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.partitions = json.load(f).get('partitions', {})
+
+    def flush(self):
+        """Writes the manifest. Needed after appends made with flush=False."""
+        manifest = {"format": 1, "partitions": dict(sorted(self.partitions.items()))}
+        write_json_atomic(self.manifest_path, manifest, indent=2)
+
+    def partition_path(self, date):
+        return os.path.join(self.directory, f"{date}.jsonl")
+
+    def dates(self):
+        """Returns the stored dates in ascending order."""
+        return sorted(self.partitions)
+
+    def __contains__(self, date):
+        return date in self.partitions
+
+    def __len__(self):
+        return len(self.partitions)
+
+    def append(self, date, decks, replace=False, flush=True):
+        """Writes a snapshot as a new partition.
+
+        Partitions are immutable; an existing date is only rewritten when
+        replace is True (e.g. a same-day re-run or a historical correction).
+        Bulk writers pass flush=False and call flush() once at the end
+        instead of rewriting the manifest per date.
+
+        Returns:
+            bool: True if the partition was written
+        """
+        if date in self.partitions and not replace:
+            logger.warning(f"Snapshot for {date} already exists; not overwriting")
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.partition_path(date)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for deck in decks:
+                f.write(json.dumps(deck, ensure_ascii=False, separators=(',', ':')))
+                f.write('\n')
+        os.replace(tmp_path, path)
+
+        self.partitions[date] = {
+            "file": os.path.basename(path),
+            "decks": len(decks),
+            "bytes": os.path.getsize(path)
+        }
+        if flush:
+            self.flush()
+        logger.info(f"Stored snapshot {date} with {len(decks)} decks")
+        return True
+
+    def iter_decks(self, date):
+        """Yields the decks of one snapshot, reading its partition through mmap."""
+        if date not in self.partitions:
+            raise KeyError(date)
+        path = self.partition_path(date)
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            for line in iter(m.readline, b''):
+                if line.strip():
+                    yield json.loads(line)
+
+    def read(self, date):
+        """Returns one snapshot as a list of decks."""
+        return list(self.iter_decks(date))
+
+    def read_range(self, start=None, end=None):
+        """Returns {date: decks} for dates within [start, end] (inclusive, ISO strings)."""
+        return {
+            date: self.read(date)
+            for date in self.dates()
+            if (start is None or date >= start) and (end is None or date <= end)
+        }
+
+    def iter_snapshots(self):
+        """Yields (date, decks) in date order, one partition at a time."""
+        for date in self.dates():
+            yield date, self.read(date)
+
+    def import_json(self, path):
+        """One-time migration of a monolithic {date: decks} file into partitions."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for date, decks in data.items():
+            self.append(date, decks, replace=True, flush=False)
+        self.flush()
+        logger.info(f"Imported {len(data)} snapshots from {path}")
+        return len(data)
@@ -0,0 +1,126 @@
+"""
+ptcgp-scrape: single entry point for the card and deck scrapers.
+Usage: python scraper/ptcgpScrape.py {cards,icons,decks,correct,bench,bench-startup} [options]
+
+Only the module behind the chosen subcommand is imported, and those modules
+load Selenium, requests and NumPy on first use, so light commands and
+--help start in roughly the time of a bare interpreter.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Subcommand: (module, help)
+COMMANDS = {
+    'cards': ('cardDataScrapper', "Scrape sets and cards into card_data.json"),
+    'icons': ('cardDataScrapper', "Download missing icons for existing cards"),
+    'decks': ('scrapeDeckData', "Scrape the deck meta table and matchups"),
+    'correct': ('scrapeDeckData', "Re-normalize matchups of every stored snapshot"),
+    'bench': ('scrapeBenchmark', "Measure scraper throughput against offline HTML fixtures"),
+}
+
+# Modules a light subcommand must not load just to start
+HEAVY_MODULES = ('selenium', 'pandas', 'numpy', 'requests')
+
+BENCH_CONFIG = {
+    'RUNS': 7,
+    'BUDGET_MS': 150,  # Allowed start-up overhead over a bare interpreter
+}
+
+
+def load_command(command):
+    """Imports the module that implements a subcommand."""
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    return importlib.import_module(COMMANDS[command][0])
+
+
+def _time_run(argv, runs):
+    """Median wall time in milliseconds of running argv in a fresh interpreter."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _loaded_heavy_modules(command):
+    """Heavy modules present after importing a subcommand, checked in a fresh interpreter."""
+    probe = (
+        f"import sys; sys.path.insert(0, {SCRIPT_DIR!r}); import ptcgpScrape, json; "
+        f"ptcgpScrape.load_command({command!r}); "
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return [f"<import failed: {result.stderr.strip().splitlines()[-1:]}>"]
+    return json.loads(result.stdout)
+
+
+def bench_startup(runs=None, budget_ms=None):
+    """Times '--help' for every subcommand against a bare interpreter.
+
+    Fails (returns False) if a subcommand's start-up overhead exceeds the
+    budget or importing it pulls in one of HEAVY_MODULES.
+    """
+    runs = runs or BENCH_CONFIG['RUNS']
+    budget_ms = budget_ms or BENCH_CONFIG['BUDGET_MS']
+    script = os.path.abspath(__file__)
+
+    baseline = _time_run([sys.executable, "-c", "pass"], runs)
+    print(f"{'Command':<22}{'Median ms':>10}{'Overhead':>10}  Heavy modules")
+    print(f"{'python -c pass':<22}{baseline:>10.1f}{0.0:>10.1f}")
+
+    ok = True
+    cases = [('--help', None)] + [(f"{command} --help", command) for command in COMMANDS]
+    for label, command in cases:
+        median = _time_run([sys.executable, script] + label.split(), runs)
+        overhead = median - baseline
+        heavy = _loaded_heavy_modules(command) if command else []
+        passed = overhead <= budget_ms and not heavy
+        ok = ok and passed
+        print(f"{label:<22}{median:>10.1f}{overhead:>10.1f}  {', '.join(heavy) or '-'}{'' if passed else '  FAIL'}")
+
+    print(f"Start-up budget {budget_ms} ms over baseline: {'OK' if ok else 'EXCEEDED'}")
+    return ok
+
+
+def build_parser(command=None):
+    """Builds the CLI parser. Only the selected subcommand's module is imported for its options."""
+    parser = argparse.ArgumentParser(prog="ptcgp-scrape", description="PTCG Pocket card and deck scrapers")
+    subparsers = parser.add_subparsers(dest="command", metavar="{" + ",".join(list(COMMANDS) + ['bench-startup']) + "}")
+    subparsers.required = True
+
+    for name, (_, help_text) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if name == command:
+            load_command(name).add_cli_arguments(subparser, name)
+
+    bench = subparsers.add_parser('bench-startup', help="Measure start-up time of every subcommand")
+    bench.add_argument("--runs", type=int, default=BENCH_CONFIG['RUNS'], help="Runs per command (median is reported)")
+    bench.add_argument("--budget-ms", type=float, default=BENCH_CONFIG['BUDGET_MS'], help="Allowed overhead over a bare interpreter")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    args = build_parser(command if command in COMMANDS else None).parse_args(argv)
+
+    if args.command == 'bench-startup':
+        return 0 if bench_startup(args.runs, args.budget_ms) else 1
+    success = load_command(args.command).run_cli(args, args.command)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
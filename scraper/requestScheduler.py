@@ -0,0 +1,221 @@
+"""
+Central request scheduler for the Limitless hosts.
+Every request waits for a token from its host's bucket. 429, 5xx and
+timeouts are retried with exponential backoff and full jitter, and a 429
+halves the host's rate, which then recovers gradually on success. Work
+that still fails is parked in a RetryQueue and drained at the end of a run
+instead of being dropped.
+"""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from scrapeMetrics import increment
+
+logger = logging.getLogger('RequestScheduler')
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransientRequestError(Exception):
+    """Raised when a request still fails after all scheduler retries."""
+
+    def __init__(self, url, reason):
+        super().__init__(f"{reason} for {url}")
+        self.url = url
+        self.reason = reason
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate backs off on throttling (AIMD)."""
+
+    MIN_RATE_FRACTION = 0.1
+    RECOVERY_FRACTION = 0.05
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Requests per second when not throttled
+            burst (float): Bucket size; defaults to one second of requests
+        """
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttle(self):
+        """Halves the rate and empties the bucket after a 429."""
+        with self._lock:
+            self.rate = max(self.base_rate * self.MIN_RATE_FRACTION, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def recover(self):
+        """Raises the rate a step back towards its base after a success."""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * self.RECOVERY_FRACTION)
+
+
+class RequestScheduler:
+    def __init__(self, host_rates=None, default_rate=10.0, max_retries=3, retry_delay=1.0,
+                 max_delay=60.0, retry_exceptions=()):
+        """
+        Args:
+            host_rates (dict): Requests per second per hostname
+            default_rate (float): Rate for hosts missing from host_rates
+            max_retries (int): Retries per request before giving up
+            retry_delay (float): Base backoff in seconds, doubled per attempt
+            max_delay (float): Cap on a single backoff
+            retry_exceptions (tuple): Exception types treated as transient (timeouts, resets)
+        """
+        self.host_rates = dict(host_rates or {})
+        self.default_rate = default_rate
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.buckets = {}
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        with self._lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.host_rates.get(host, self.default_rate))
+            return self.buckets[host]
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+        increment(f"http_{key}")
+
+    def backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, never shorter than a server's Retry-After."""
+        delay = random.uniform(0, min(self.max_delay, self.retry_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(self.max_delay, retry_after))
+        return delay
+
+    @staticmethod
+    def retry_after(response):
+        """Parses a Retry-After header (seconds or HTTP date) into seconds."""
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+
+    def request(self, url, send):
+        """Runs send() for url under its host's rate limit, retrying transient failures.
+
+        Returns:
+            The response of the first attempt that is not a 429/5xx
+
+        Raises:
+            TransientRequestError: When every attempt failed transiently
+        """
+        bucket = self.bucket(urlparse(url).hostname or '')
+        reason = None
+        for attempt in range(self.max_retries + 1):
+            bucket.acquire()
+            self._count("requests")
+            response = None
+            try:
+                response = send()
+            except self.retry_exceptions as e:
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    bucket.recover()
+                    return response
+                reason = f"HTTP {response.status_code}"
+                if response.status_code == 429:
+                    self._count("throttled")
+                    bucket.throttle()
+
+            if attempt == self.max_retries:
+                break
+            delay = self.backoff(attempt, self.retry_after(response))
+            self._count("retries")
+            logger.warning(f"{reason} for {url}, retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
+
+        self._count("failed")
+        raise TransientRequestError(url, reason)
+
+
+class RetryQueue:
+    """Work that failed transiently during a run, retried once the run is done."""
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def defer(self, key, func, *args):
+        """Queues func(*args) for a later retry. A key is only queued once."""
+        with self._lock:
+            if key not in self._items:
+                logger.info(f"Queued {key} for retry")
+                increment('retry_deferred')
+            self._items.setdefault(key, (func, args))
+
+    def drain(self, rounds=3, cooldown=2.0):
+        """Retries queued work sequentially for up to rounds passes.
+
+        Work that fails again is expected to defer itself, which queues it for
+        the next pass.
+
+        Returns:
+            list: Keys that still failed after the last pass
+        """
+        for round_number in range(1, rounds + 1):
+            with self._lock:
+                items, self._items = self._items, {}
+            if not items:
+                break
+            logger.info(f"Retry pass {round_number}/{rounds}: {len(items)} items after {cooldown:.1f}s cooldown")
+            time.sleep(cooldown)
+            for key, (func, args) in items.items():
+                try:
+                    func(*args)
+                except Exception as e:
+                    logger.error(f"Retry of {key} failed: {e}")
+                    self.defer(key, func, *args)
+            cooldown *= 2
+
+        with self._lock:
+            remaining = list(self._items)
+        if remaining:
+            logger.error(f"{len(remaining)} items still failing after {rounds} retry passes: {', '.join(remaining[:10])}")
+        return remaining
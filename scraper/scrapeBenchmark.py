@@ -0,0 +1,475 @@
+"""
+Throughput benchmark for the card and deck scrapers.
+The scrapers run unchanged against HTML fixtures served by a local HTTP
+stand-in for the Limitless hosts, with an optional per-request delay to
+mimic network latency. Each stage reports pages/sec, p50/p95 latency and
+peak RSS, optionally across a sweep of MAX_WORKERS values. Results can be
+saved as JSON and compared with an earlier run to catch regressions.
+
+Fixtures are either recorded from the live site with --record, or
+generated at a configurable scale when no fixture directory is given.
+"""
+
+import base64
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+logger = logging.getLogger('ScrapeBenchmark')
+
+CONFIG = {
+    'SETS': 2,  # Generated sets
+    'CARDS_PER_SET': 120,  # Generated cards per set
+    'DECKS': 20,  # Generated decks (and matchup pages)
+    'LATENCY_MS': 20,  # Delay the stand-in server adds to every response
+    'WORKERS': [1, 4, 10],  # MAX_WORKERS values to sweep
+    'NORMALIZE_REPEATS': 50,  # Runs of check_and_normalize_matchups per sweep point
+    'TOLERANCE': 15,  # Allowed change against a baseline, in percent
+    'RECORD_SETS': 1,  # Sets captured by --record
+}
+
+# 1x1 transparent PNG served for any icon missing from the fixtures
+STUB_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+ELEMENTS = ["Grass", "Fire", "Water", "Lightning", "Psychic", "Fighting", "Darkness", "Metal", "Colorless"]
+
+# Navigation and footer markup shared by generated pages, so parsing costs
+# roughly what it costs on the live site
+_NAV = "".join(f'<li><a href="/cards?q=set:{i}">Menu entry {i}</a></li>' for i in range(60))
+_FOOTER = "".join(f'<p class="footer-note">Footer paragraph {i} with some filler text.</p>' for i in range(20))
+
+
+def _page(title, body):
+    return (
+        f'<!DOCTYPE html><html><head><title>{title} – Limitless</title>'
+        f'<script>window.dataLayer = [];</script></head><body>'
+        f'<header><nav><ul>{_NAV}</ul></nav></header><main>{body}</main>'
+        f'<footer>{_FOOTER}</footer></body></html>'
+    )
+
+
+def _fixture_path(directory, url):
+    """Fixture file for a URL; the query string is ignored."""
+    path = urlparse(url).path.strip('/')
+    return os.path.join(directory, *path.split('/'), 'index.html') if path else os.path.join(directory, 'index.html')
+
+
+def _write(directory, url, html):
+    path = _fixture_path(directory, url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def generate_fixtures(directory, sets=None, cards_per_set=None, decks=None):
+    """Writes a synthetic site with the markup the scrapers read.
+
+    Every tenth card is not a diamond card and every seventh is a Trainer,
+    so the skip paths are exercised alongside full scrapes.
+
+    Returns:
+        dict: Number of sets, cards and decks generated
+    """
+    sets = sets or CONFIG['SETS']
+    cards_per_set = cards_per_set or CONFIG['CARDS_PER_SET']
+    decks = decks or CONFIG['DECKS']
+
+    set_rows = []
+    for s in range(1, sets + 1):
+        set_code, set_name = f"B{s}", f"Benchmark Set {s}"
+        set_rows.append(f'<tr><td><a href="/cards/{set_code}">{set_name}<br><span>{set_code}</span></a></td>'
+                        f'<td>{cards_per_set}</td></tr>')
+        grid = "".join(f'<a href="/cards/{set_code}/{n}"><img src="/img/{set_code}_{n}.webp"></a>'
+                       for n in range(1, cards_per_set + 1))
+        _write(directory, f"/cards/{set_code}", _page(set_name, f'<div class="card-search-grid">{grid}</div>'))
+
+        for n in range(1, cards_per_set + 1):
+            name = f"Benchmon {s}-{n}" + (" ex" if n % 5 == 0 else "")
+            element = ELEMENTS[n % len(ELEMENTS)]
+            if n % 7 == 0:
+                type_line = "Trainer - Supporter"
+            elif n % 3 == 0:
+                type_line = f'Pokémon - Stage 1 - Evolves from <a href="/cards?q=x">Benchmon {s}-{n - 1}</a>'
+            else:
+                type_line = "Pokémon - Basic"
+            rarity = "☆" if n % 10 == 0 else "◊◊"
+            body = (
+                '<div class="card-page-main"><div class="card-details"><div class="card-text">'
+                '<div class="card-text-section"><p class="card-text-title">'
+                f'<span class="card-text-name"><a href="/cards?q=name:x">{name}</a></span> - {element} - 90 HP</p>'
+                f'<p class="card-text-type">{type_line}</p></div>'
+                '<div class="card-text-attack"><p class="card-text-attack-info">Tackle 30</p>'
+                '<p class="card-text-attack-effect">Flip a coin.</p></div></div>'
+                f'<div class="prints-current-details"><span>{set_name} ({set_code})</span><br>'
+                f'<span>#{n} · {rarity}</span></div></div></div>'
+            )
+            _write(directory, f"/cards/{set_code}/{n}", _page(f"{name} - {set_name} ({set_code}) #{n}", body))
+
+    set_rows.append('<tr><td><a href="/cards/P-A">P-A</a></td><td>0</td></tr>')
+    _write(directory, "/cards/", _page("Sets", f'<table><tbody>{"".join(set_rows)}</tbody></table>'))
+
+    names = [f"Bench Deck {d}" for d in range(1, decks + 1)]
+    meta_rows = []
+    for d, name in enumerate(names, 1):
+        slug = f"bench-deck-{d}"
+        meta_rows.append(
+            f'<tr><td>{d}</td><td><img></td><td><a href="/decks/{slug}/?game=POCKET">{name}</a></td>'
+            f'<td>{1000 - d * 10}</td><td>{round(20 / d, 2)}%</td><td>x</td><td>{50 + (d % 7) - 3}.00%</td></tr>'
+        )
+        _write(directory, f"/decks/{slug}/",
+               _page(name, f'<a href="/decks/{slug}/matchups/?game=POCKET">Matchups</a>'))
+        rows = "".join(
+            f'<tr><td><img></td><td>{opponent}</td><td>{100 + o}</td><td>{50 + o} - {50} - {o % 3}</td>'
+            f'<td>{round(100 * (50 + o) / (100 + o), 2)}%</td></tr>'
+            for o, opponent in enumerate(names) if opponent != name
+        )
+        _write(directory, f"/decks/{slug}/matchups/",
+               _page(f"{name} matchups", f'<table class="striped"><tbody>{rows}</tbody></table>'))
+    _write(directory, "/decks", _page("Decks", f'<table class="meta"><tbody>{"".join(meta_rows)}</tbody></table>'))
+
+    return {"sets": sets, "cards": sets * cards_per_set, "decks": decks}
+
+
+def record_fixtures(directory, set_limit=None):
+    """Captures live pages into a fixture directory, with links made host-relative.
+
+    Records the set index, the first set_limit set listings with all their
+    card pages, the deck table, and the deck and matchup pages of the top
+    MAX_DECKS decks.
+    """
+    import httpFetch
+    import cardDataScrapper as cards
+    import scrapeDeckData as decks
+    from httpFetch import By
+
+    set_limit = set_limit or CONFIG['RECORD_SETS']
+    hosts = {f"{urlparse(url).scheme}://{urlparse(url).hostname}"
+             for url in (cards.CONFIG['CARD_URL'], decks.CONFIG['DECKS_URL'])}
+
+    def save(url):
+        response = httpFetch.fetch(url)
+        html = response.text
+        for host in hosts:
+            html = html.replace(host, "")
+        _write(directory, url, html)
+        return httpFetch.parse_html(response.text, base_url=response.url)
+
+    index = save(cards.CONFIG['CARD_URL'])
+    set_links = [link.get_attribute("href") for link in index.find_elements(By.CSS_SELECTOR, "td:first-child a")]
+    set_links = [url for url in set_links if not url.rstrip('/').endswith('P-A')][:set_limit]
+    recorded_cards = 0
+    for set_url in set_links:
+        listing = save(set_url)
+        for card in listing.find_elements(By.CSS_SELECTOR, ".card-search-grid a"):
+            save(card.get_attribute("href"))
+            recorded_cards += 1
+
+    meta = save(decks.CONFIG['DECKS_URL'])
+    deck_links = [row.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
+                  for row in meta.find_elements(By.CSS_SELECTOR, "table.meta tbody tr")
+                  if row.find_elements(By.CSS_SELECTOR, "a")][:decks.CONFIG['MAX_DECKS']]
+    for deck_url in deck_links:
+        deck_page = save(deck_url)
+        matchup_link = deck_page.select_one("a[href*='matchups']")
+        if matchup_link is not None:
+            save(matchup_link.get_attribute("href"))
+
+    logger.warning(f"Recorded {len(set_links)} sets, {recorded_cards} cards and {len(deck_links)} decks into {directory}")
+
+
+class FixtureServer:
+    """Serves a fixture directory on localhost in a background thread."""
+
+    def __init__(self, directory, latency_ms=0):
+        self.directory = directory
+        self.latency = latency_ms / 1000
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the live hosts
+            disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                path = urlparse(self.path).path
+                if path.startswith('/icons/'):
+                    file_path = os.path.join(server.directory, *path.strip('/').split('/'))
+                    body = open(file_path, 'rb').read() if os.path.isfile(file_path) else STUB_PNG
+                    content_type = "image/png"
+                else:
+                    file_path = _fixture_path(server.directory, path)
+                    if not os.path.isfile(file_path):
+                        self.send_error(404)
+                        return
+                    with open(file_path, 'rb') as f:
+                        body = f.read()
+                    content_type = "text/html; charset=utf-8"
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of numbers."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where it cannot be read."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2 ** 20
+        except (ImportError, AttributeError):
+            return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+
+def _measure(func, items, workers=1, pages_per_call=1):
+    """Calls func on every item with a thread pool and records per-call latency.
+
+    Returns:
+        tuple: (list of results, stage metrics dict)
+    """
+    latencies = []
+    lock = threading.Lock()
+
+    def timed(item):
+        start = time.perf_counter()
+        try:
+            return func(*item)
+        finally:
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(timed, items))
+    wall = time.perf_counter() - start
+    pages = len(items) * pages_per_call
+    peak_rss = peak_rss_mb()
+    return results, {
+        "calls": len(items),
+        "pages": pages,
+        "seconds": round(wall, 4),
+        "pagesPerSec": round(pages / wall, 2) if wall else None,
+        "p50Ms": round(percentile(latencies, 0.50), 3) if latencies else None,
+        "p95Ms": round(percentile(latencies, 0.95), 3) if latencies else None,
+        "peakRssMb": round(peak_rss, 1) if peak_rss is not None else None,
+    }
+
+
+@contextlib.contextmanager
+def _overridden(config, **values):
+    saved = {key: config[key] for key in values}
+    config.update(values)
+    try:
+        yield
+    finally:
+        config.update(saved)
+
+
+def run_point(base_url, workers, engine='http', normalize_repeats=None):
+    """Runs every stage once with MAX_WORKERS = workers.
+
+    Returns:
+        dict: stage name -> metrics
+    """
+    import httpFetch
+    import cardDataScrapper as cards
+    import scrapeDeckData as decks
+
+    normalize_repeats = normalize_repeats or CONFIG['NORMALIZE_REPEATS']
+    host = urlparse(base_url).hostname
+    httpFetch.configure(pool_size=workers, cache_dir="", host_rates={host: 100000})
+    stages = {}
+
+    with tempfile.TemporaryDirectory(prefix="ptcgp-bench-") as work, \
+            _overridden(cards.CONFIG, CARD_URL=f"{base_url}/cards/", CARD_ICON_URL=f"{base_url}/icons/",
+                        MAX_WORKERS=workers,
+                        OUTPUT_FILE=os.path.join(work, "card_data.json"),
+                        MANIFEST_FILE=os.path.join(work, "set_manifest.json"),
+                        ICON_FOLDER=os.path.join(work, "icons"),
+                        ICON_MANIFEST_FILE=os.path.join(work, "icon_manifest.json"),
+                        CHECKPOINT_FILE=os.path.join(work, "cards.jsonl")), \
+            _overridden(decks.CONFIG, DECKS_URL=f"{base_url}/decks?game=POCKET", MAX_WORKERS=workers):
+        scraper = cards.CardScraper(cards.CardDatabase(reset=True), engine=engine)
+        try:
+            set_links, stages["scrape_set_info"] = _measure(scraper.scrape_set_info, [()])
+            set_links = set_links[0]
+            card_links, stages["scrape_card_links"] = _measure(
+                scraper.scrape_card_links, [(link,) for link in set_links], workers)
+            card_items = [(url, link['setCode'], link['setName'])
+                          for link, urls in zip(set_links, card_links) for url in urls]
+            _, stages["scrape_card_info"] = _measure(scraper.scrape_card_info, card_items, workers)
+        finally:
+            scraper.driver_pool.close()
+
+        deck_table, stages["scrape_meta_table"] = _measure(decks.scrape_meta_table_http, [()])
+        deck_table = deck_table[0][:decks.CONFIG['MAX_DECKS']]
+        if engine == 'selenium':
+            driver_pool = decks.create_driver_pool(workers)
+            try:
+                matchups, stages["scrape_deck_matchups_with_new_driver"] = _measure(
+                    decks.scrape_deck_matchups_with_new_driver,
+                    [(item['Deck Name'], item['URL'], driver_pool) for item in deck_table], workers, 2)
+            finally:
+                driver_pool.close()
+        else:
+            matchups, stages["scrape_deck_matchups_http"] = _measure(
+                decks.scrape_deck_matchups_http,
+                [(item['Deck Name'], item['URL']) for item in deck_table], workers)
+        for item, result in zip(deck_table, matchups):
+            item["Matchups"] = result
+
+        _, stages["check_and_normalize_matchups"] = _measure(
+            lambda: decks.check_and_normalize_matchups(json.loads(json.dumps(deck_table))),
+            [()] * normalize_repeats, pages_per_call=0)
+
+    stages["check_and_normalize_matchups"].pop("pagesPerSec")
+    stages["_http"] = dict(httpFetch.get_scheduler().stats)
+    return stages
+
+
+def run_benchmark(fixtures=None, workers=None, latency_ms=None, engine='http', scale=None):
+    """Serves the fixtures and runs every sweep point.
+
+    Returns:
+        dict: Benchmark results, keyed by MAX_WORKERS value
+    """
+    workers = workers or CONFIG['WORKERS']
+    latency_ms = CONFIG['LATENCY_MS'] if latency_ms is None else latency_ms
+    with contextlib.ExitStack() as stack:
+        if fixtures is None:
+            fixtures = stack.enter_context(tempfile.TemporaryDirectory(prefix="ptcgp-fixtures-"))
+            generated = generate_fixtures(fixtures, **(scale or {}))
+        else:
+            generated = None
+        server = stack.enter_context(FixtureServer(fixtures, latency_ms))
+        results = {
+            "generatedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "engine": engine,
+            "latencyMs": latency_ms,
+            "fixtures": generated or {"recorded": os.path.abspath(fixtures)},
+            "python": sys.version.split()[0],
+            "points": {}
+        }
+        for count in workers:
+            results["points"][str(count)] = run_point(server.base_url, count, engine)
+    return results
+
+
+def print_results(results):
+    print(f"Engine {results['engine']}, {results['latencyMs']} ms simulated latency, fixtures {results['fixtures']}")
+    print(f"{'Workers':>7}  {'Stage':<38}{'Pages':>7}{'Pages/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'Peak RSS MB':>13}")
+    for workers, stages in results["points"].items():
+        for stage, metrics in stages.items():
+            if stage.startswith('_'):
+                continue
+            pages_per_sec = metrics.get('pagesPerSec')
+            print(f"{workers:>7}  {stage:<38}{metrics['pages']:>7}"
+                  f"{pages_per_sec if pages_per_sec is not None else '-':>10}"
+                  f"{metrics['p50Ms']:>10}{metrics['p95Ms']:>10}"
+                  f"{metrics['peakRssMb'] if metrics['peakRssMb'] is not None else '-':>13}")
+
+
+def compare_with_baseline(results, baseline, tolerance=None):
+    """Lists stages whose throughput dropped or p95 latency grew by more than tolerance percent."""
+    tolerance = CONFIG['TOLERANCE'] if tolerance is None else tolerance
+    regressions = []
+    for workers, stages in results["points"].items():
+        for stage, metrics in stages.items():
+            before = baseline.get("points", {}).get(workers, {}).get(stage)
+            if stage.startswith('_') or not before:
+                continue
+            if metrics.get('pagesPerSec') and before.get('pagesPerSec'):
+                change = 100 * (metrics['pagesPerSec'] - before['pagesPerSec']) / before['pagesPerSec']
+                if change < -tolerance:
+                    regressions.append(f"{stage} @ {workers} workers: pages/s {before['pagesPerSec']} -> {metrics['pagesPerSec']} ({change:+.0f}%)")
+            if metrics.get('p95Ms') and before.get('p95Ms'):
+                change = 100 * (metrics['p95Ms'] - before['p95Ms']) / before['p95Ms']
+                if change > tolerance:
+                    regressions.append(f"{stage} @ {workers} workers: p95 {before['p95Ms']} -> {metrics['p95Ms']} ms ({change:+.0f}%)")
+    return regressions
+
+
+def add_cli_arguments(parser, command='bench'):
+    """Adds the options of the 'bench' command to parser."""
+    parser.add_argument("--workers", default=",".join(str(w) for w in CONFIG['WORKERS']),
+                        help="Comma-separated MAX_WORKERS values to sweep")
+    parser.add_argument("--latency-ms", type=float, default=CONFIG['LATENCY_MS'],
+                        help="Delay the stand-in server adds to every response")
+    parser.add_argument("--fixtures", default=None,
+                        help="Recorded fixture directory to serve (default: generate a synthetic site)")
+    parser.add_argument("--record", metavar="DIR", default=None,
+                        help="Record live pages into DIR instead of benchmarking")
+    parser.add_argument("--sets", type=int, default=CONFIG['SETS'], help="Generated sets")
+    parser.add_argument("--cards-per-set", type=int, default=CONFIG['CARDS_PER_SET'], help="Generated cards per set")
+    parser.add_argument("--decks", type=int, default=CONFIG['DECKS'], help="Generated decks")
+    parser.add_argument("--engine", choices=["http", "selenium"], default="http",
+                        help="Fetch pages over pooled HTTP (default) or with a headless browser")
+    parser.add_argument("--output", default=None, help="Write the results as JSON")
+    parser.add_argument("--baseline", default=None, help="Earlier --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=CONFIG['TOLERANCE'],
+                        help="Allowed change against the baseline, in percent")
+
+
+def run_cli(args, command='bench'):
+    """Runs the benchmark (or records fixtures) with parsed arguments."""
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if args.record:
+        record_fixtures(args.record)
+        return True
+
+    workers = [int(w) for w in args.workers.split(',') if w.strip()]
+    scale = {"sets": args.sets, "cards_per_set": args.cards_per_set, "decks": args.decks}
+    results = run_benchmark(args.fixtures, workers, args.latency_ms, args.engine, scale)
+    print_results(results)
+
+    if args.output:
+        from jsonWriter import write_json_atomic
+        write_json_atomic(args.output, results, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"Baseline comparison ({args.tolerance:g}% tolerance): {'FAILED' if regressions else 'OK'}")
+        return not regressions
+    return True
@@ -2,15 +2,18 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import os
 import sys
-import json
 import logging
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.edge.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pathlib
+from urllib.parse import urlencode, parse_qsl, urlsplit, urlunsplit
+import httpFetch
+from checkpointJournal import CheckpointJournal
+from httpFetch import By
+from jsonWriter import append_json_object_entry, write_json_object_stream, write_meta_shards, shard_path
+from metaStore import MetaSnapshotStore
+from requestScheduler import RetryQueue
+from scrapeMetrics import METRICS, increment, timer
+from scraperLogging import setup_logging
+from webDriverPool import WebDriverPool, wait_for_element
 
 # Get the script's directory
 SCRIPT_DIR = os.path.join(pathlib.Path(__file__).parent.resolve(), "log")
@@ -20,21 +23,38 @@ CONFIG = {
     'LOG_FILE': os.path.join(SCRIPT_DIR, 'scraper.log'),
     'MAX_WORKERS': 10, # Number of concurrent workers
     'MAX_DECKS': 20, # Max Decks to scrape
-    'TOURNAMENT_META_FILE': os.path.join(os.getcwd(), "src", "data", "deckTournamentMeta.json")
+    'DRIVER_MAX_PAGES': 50, # Pages a pooled browser serves before it is recycled
+    'ENGINE': 'http', # 'http' (pooled requests) or 'selenium' (headless Edge)
+    'DECKS_URL': "https://play.limitlesstcg.com/decks?game=POCKET",
+    'META_FORMAT': 'standard', # 'format' query parameter of backfilled meta lists
+    # Release date of each set; the deck list filtered with set=<code> covers the meta until the next release.
+    # Backfills past the last release plus the longest known period are refused until newer sets are added.
+    'SET_RELEASES': {
+        'A1': '2024-10-30', 'A1a': '2024-12-17', 'A2': '2025-01-29',
+        'A2a': '2025-02-28', 'A2b': '2025-03-27', 'A3': '2025-04-30',
+    },
+    'SET_MANIFEST_FILE': os.path.join(pathlib.Path(__file__).parent.resolve(), "set_manifest.json"), # Sets seen by the card scraper
+    'HTTP_CACHE_DIR': os.path.join(pathlib.Path(__file__).parent.resolve(), ".http_cache"),
+    'HTTP_CACHE_MAX_MB': 200,
+    'HOST_RATES': {'play.limitlesstcg.com': 8}, # Requests per second per host, halved while a host answers 429
+    'MAX_RETRIES': 3, # Passes over the retry queue at the end of a run
+    'RETRY_DELAY': 2, # Seconds before the first retry pass, doubled per pass
+    'CHECKPOINT_FILE': os.path.join(pathlib.Path(__file__).parent.resolve(), ".checkpoints", "decks.jsonl"),
+    'METRICS_FILE': os.path.join(pathlib.Path(__file__).parent.resolve(), "metrics", "{command}.json"), # Per-stage timers and counters
+    'TOURNAMENT_META_FILE': os.path.join(os.getcwd(), "src", "data", "deckTournamentMeta.json"),
+    'META_PARTITION_DIR': os.path.join(os.getcwd(), "src", "data", "metaPartitions"),
+    'SHARD_META': False, # Also write one file per date plus an index
+    'TOURNAMENT_META_SHARD_DIR': os.path.join(os.getcwd(), "src", "data", "tournamentMeta"),
+    'COLUMNAR_META': None, # Also export typed deck/matchup tables per date: 'parquet' or 'arrow' (needs pyarrow)
+    'META_COLUMNAR_DIR': os.path.join(os.getcwd(), "src", "data", "metaColumnar"),
+    'META_DELTA_DIR': os.path.join(os.getcwd(), "src", "data", "metaDeltas"),
+    'DELTA_BASE_EVERY': 7, # A full base snapshot at least every this many dates
+    'META_ANALYTICS_FILE': os.path.join(os.getcwd(), "src", "data", "metaAnalytics.json"),
+    'MATRIX_DIR': os.path.join(os.getcwd(), "src", "data", "matchupMatrix"), # Full matchup matrices from --full-matrix runs
+    'STORAGE': 'json', # 'json' (date partitions), 'sqlite' (SQLITE_FILE) or 'delta' (META_DELTA_DIR); deckTournamentMeta.json is exported in every case
+    'SQLITE_FILE': os.path.join(pathlib.Path(__file__).parent.resolve(), "ptcgp.sqlite3"),
 }
 
-# Ensure log directory exists
-os.makedirs(SCRIPT_DIR, exist_ok=True)
-
-# Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(CONFIG['LOG_FILE'], mode='w', encoding='utf-8')
-    ]
-)
 logger = logging.getLogger('DeckScraper')
 
 # Store original stderr
@@ -43,6 +63,10 @@ DEBUG = False  # Disable debugging
 
 def create_new_driver():
     """Creates a new WebDriver instance."""
+    from selenium import webdriver
+    from selenium.webdriver.edge.options import Options
+    from selenium.webdriver.edge.service import Service
+
     edge_options = Options()
     edge_options.add_argument("--headless")
     edge_options.add_argument("--log-level=OFF")
@@ -50,12 +74,14 @@ def create_new_driver():
     service = Service(log_path=os.devnull)
     return webdriver.Edge(service=service, options=edge_options)
 
+def create_driver_pool(size=None):
+    """Creates a pool of long-lived WebDriver instances sized by MAX_WORKERS."""
+    return WebDriverPool(create_new_driver, size or CONFIG['MAX_WORKERS'], CONFIG['DRIVER_MAX_PAGES'])
+
 def find_and_click_button(css_selector, driver):
     """Utility function to find and click a button."""
     try:
-        button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, css_selector))
-        )
+        button = wait_for_element(driver, By.CSS_SELECTOR, css_selector, clickable=True)
         driver.execute_script("arguments[0].scrollIntoView();", button)
         button.click()
         time.sleep(1)  # Small delay to let the page react
@@ -64,58 +90,197 @@ def find_and_click_button(css_selector, driver):
         logger.error(f"Button click failed for selector '{css_selector}': {e}")
         return False
 
-def scrape_deck_matchups_with_new_driver(deck_name, url):
-    """Worker function that creates its own WebDriver instance to scrape matchups."""
+def scrape_deck_matchups_with_new_driver(deck_name, url, driver_pool):
+    """Worker function that checks out a pooled WebDriver instance to scrape matchups."""
     if not url or url == "N/A":
         return {}
 
-    driver = None
+    with driver_pool.driver() as driver:
+        return scrape_deck_matchups(deck_name, url, driver)
+
+def scrape_deck_matchups(deck_name, url, driver):
+    """Scrapes the matchup table for a deck using the given WebDriver.
+
+    Raises:
+        TransientRequestError: When the browser could not load the deck page
+    """
     try:
-        driver = create_new_driver()
-        driver.get(url)
+        try:
+            with timer('page_load'):
+                driver.get(url)
+        except Exception as e:
+            raise httpFetch.TransientRequestError(url, "browser error") from e
 
         # Click the "Matchups" button if it exists
         try:
-            matchup_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href*='matchups']"))
-            )
+            matchup_link = wait_for_element(driver, By.CSS_SELECTOR, "a[href*='matchups']", clickable=True)
             matchup_link.click()
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table.striped tbody tr"))
-            )
+            wait_for_element(driver, By.CSS_SELECTOR, "table.striped tbody tr")
         except Exception as e:
             logger.error(f"Error accessing matchups for {deck_name}: {e}")
             return {}
 
         # Extract table rows
-        rows = driver.find_elements(By.CSS_SELECTOR, "table.striped tbody tr")
-        data = {}
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 5:
-                opponent_deck = cells[1].text.strip()
-                matches = cells[2].text.strip()
-                score = cells[3].text.strip()
-                win_rate = cells[4].text.strip()
-                data[opponent_deck] = {
-                    "Matches": matches,
-                    "Score": score,
-                    "Win Rate": win_rate
-                }
-        return data
+        with timer('parse'):
+            rows = driver.find_elements(By.CSS_SELECTOR, "table.striped tbody tr")
+            return parse_matchup_rows(rows)
+    except httpFetch.TransientRequestError:
+        raise
     except Exception as e:
         logger.error(f"Error scraping matchups for {deck_name}: {e}")
         return {}
-    finally:
-        if driver:
-            driver.quit()
 
-def save_data_to_json(data, filename="pocket_decks_data.json"):
-    """Save the scraped data to deckTournamentMeta.json with timestamp key."""
+def matchup_url(deck_url):
+    """Matchup page of a deck: /decks/<slug>/?query -> /decks/<slug>/matchups/?query."""
+    parts = urlsplit(deck_url)
+    return urlunsplit(parts._replace(path=parts.path.rstrip('/') + '/matchups/'))
+
+def meta_url(set_code, meta_format=None):
+    """Deck meta list of one set's meta period: DECKS_URL plus the format/set query parameters."""
+    parts = urlsplit(CONFIG['DECKS_URL'])
+    query = dict(parse_qsl(parts.query))
+    query.update({"format": meta_format or CONFIG['META_FORMAT'], "set": set_code})
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def scrape_deck_matchups_http(deck_name, url):
+    """Worker function that fetches a deck's matchup table over pooled HTTP."""
+    if not url or url == "N/A":
+        return {}
+
+    try:
+        try:
+            # The matchup page sits at a fixed path below the deck page, which saves a request
+            response, document = httpFetch.fetch_document(matchup_url(url))
+            rows = document.find_elements(By.CSS_SELECTOR, "table.striped tbody tr") if response.status_code == 200 else []
+            if not rows:
+                # Follow the "Matchups" link from the deck page
+                increment('matchup_link_fallbacks')
+                _, document = httpFetch.fetch_document(url)
+                matchup_link = document.find_element(By.CSS_SELECTOR, "a[href*='matchups']")
+                _, document = httpFetch.fetch_document(matchup_link.get_attribute("href"))
+                rows = document.find_elements(By.CSS_SELECTOR, "table.striped tbody tr")
+            if not rows:
+                raise ValueError("matchup table is empty")
+        except httpFetch.TransientRequestError:
+            raise
+        except Exception as e:
+            logger.error(f"Error accessing matchups for {deck_name}: {e}")
+            return {}
+
+        with timer('parse'):
+            return parse_matchup_rows(rows)
+    except httpFetch.TransientRequestError:
+        raise
+    except Exception as e:
+        logger.error(f"Error scraping matchups for {deck_name}: {e}")
+        return {}
+
+def retry_deck_matchups(item, engine='http', driver_pool=None, journal=None):
+    """Refetches the matchups of a deck whose first attempt failed transiently.
+
+    Uses the run's engine. A successful retry is recorded in the checkpoint
+    journal, when given, so --resume does not fetch the deck again.
+    """
+    if engine == 'selenium':
+        item["Matchups"] = scrape_deck_matchups_with_new_driver(item['Deck Name'], item['URL'], driver_pool)
+    else:
+        item["Matchups"] = scrape_deck_matchups_http(item['Deck Name'], item['URL'])
+    if journal is not None:
+        journal.record('matchups', deck=item['Deck Name'], matchups=item["Matchups"])
+    increment('decks_scraped' if item["Matchups"] else 'decks_without_matchups')
+
+def parse_matchup_rows(rows):
+    """Reads opponent, matches, score and win rate from matchup table rows."""
+    data = {}
+    for row in rows:
+        cells = row.find_elements(By.TAG_NAME, "td")
+        if len(cells) >= 5:
+            opponent_deck = cells[1].text.strip()
+            matches = cells[2].text.strip()
+            score = cells[3].text.strip()
+            win_rate = cells[4].text.strip()
+            data[opponent_deck] = {
+                "Matches": matches,
+                "Score": score,
+                "Win Rate": win_rate
+            }
+    return data
+
+def open_meta_store():
+    """Opens the snapshot store, migrating deckTournamentMeta.json into it on first use.
+
+    The SQLite and delta chain stores are seeded from the date partitions when they exist.
+    """
+    if CONFIG['STORAGE'] in ('sqlite', 'delta'):
+        if CONFIG['STORAGE'] == 'sqlite':
+            from sqliteStore import SqliteMetaStore
+            store = SqliteMetaStore(CONFIG['SQLITE_FILE'])
+        else:
+            from metaDelta import MetaDeltaStore
+            store = MetaDeltaStore(CONFIG['META_DELTA_DIR'], CONFIG['DELTA_BASE_EVERY'])
+        partitions = MetaSnapshotStore(CONFIG['META_PARTITION_DIR'])
+        if len(store) == 0 and len(partitions):
+            logger.info(f"Migrating date partitions into the {CONFIG['STORAGE']} store...")
+            store.import_snapshots(partitions.iter_snapshots())
+    else:
+        store = MetaSnapshotStore(CONFIG['META_PARTITION_DIR'])
+    if len(store) == 0 and os.path.exists(CONFIG['TOURNAMENT_META_FILE']):
+        logger.info("Migrating tournament meta file into date partitions...")
+        store.import_json(CONFIG['TOURNAMENT_META_FILE'])
+    return store
+
+def export_tournament_meta(store):
+    """Rebuilds deckTournamentMeta.json from the partitions, one snapshot at a time."""
+    count = write_json_object_stream(CONFIG['TOURNAMENT_META_FILE'], store.iter_snapshots(), indent=4)
+    logger.info(f"Exported {count} dates to {CONFIG['TOURNAMENT_META_FILE']}")
+
+def write_missing_shards(store, force_dates=()):
+    """Writes per-date shards for force_dates and for any stored date without a shard."""
+    shard_dir = CONFIG['TOURNAMENT_META_SHARD_DIR']
+    pending = [
+        date for date in store.dates()
+        if date in force_dates or not os.path.exists(shard_path(shard_dir, date))
+    ]
+    write_meta_shards(shard_dir, ((date, store.read(date)) for date in pending))
+    logger.info(f"Wrote {len(pending)} date shards to {shard_dir}")
+
+def write_columnar_meta(store, force_dates=()):
+    """Exports the typed Parquet/Arrow tables for force_dates and for any date not yet exported.
+
+    Returns:
+        bool: True if the export succeeded
+    """
+    from metaColumnar import export_meta_columnar
+
+    try:
+        with timer('json_save'):
+            export_meta_columnar(store, CONFIG['META_COLUMNAR_DIR'], CONFIG['COLUMNAR_META'], force_dates)
+        return True
+    except Exception as e:
+        logger.error(f"Error exporting columnar meta tables: {e}")
+        return False
+
+def update_meta_analytics(store=None):
+    """Rebuilds the precomputed analytics artifact (trends, expected win rates, tiers)."""
+    from metaAnalytics import write_meta_analytics
+
+    try:
+        store = store or open_meta_store()
+        return write_meta_analytics(store, CONFIG['META_ANALYTICS_FILE'])
+    except Exception as e:
+        logger.error(f"Error building meta analytics: {e}")
+        return None
+
+def save_data_to_json(data, filename="pocket_decks_data.json", date=None):
+    """Save the scraped data as today's snapshot (or date's) and add it to deckTournamentMeta.json.
+
+    Returns:
+        bool: True if the snapshot and every enabled export and the analytics were written
+    """
     from datetime import datetime
     
     # Get the current date in YYYY-MM-DD format
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date or datetime.now().strftime("%Y-%m-%d")
     
     # Path to the tournament meta file
     tournament_meta_path = CONFIG['TOURNAMENT_META_FILE']
@@ -123,144 +288,253 @@ def save_data_to_json(data, filename="pocket_decks_data.json"):
     # Create directories if they don't exist
     os.makedirs(os.path.dirname(tournament_meta_path), exist_ok=True)
     
-    # Check if the file exists and load existing data
-    existing_data = {}
-    if os.path.exists(tournament_meta_path):
-        try:
-            with open(tournament_meta_path, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-                logger.info(f"Loaded existing tournament meta data with {len(existing_data.keys())} date entries")
-                
-                # Check if today's key already exists and warn if it does
-                if today in existing_data:
-                    logger.warning(f"Warning: Data for today ({today}) already exists and will be overwritten")
-        except Exception as e:
-            logger.error(f"Error loading existing tournament meta data: {e}")
-    
-    # Update the data with the new timestamp while preserving all existing entries
-    existing_data[today] = data
-    
-    # Save the updated data
     try:
-        with open(tournament_meta_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=4, ensure_ascii=False)
+        store = open_meta_store()
+        dates = store.dates()
+        logger.info(f"Loaded tournament meta manifest with {len(dates)} date entries")
+
+        # Check if today's key already exists and warn if it does
+        if today in store:
+            logger.warning(f"Warning: Data for today ({today}) already exists and will be overwritten")
+        appends_latest = today not in store and (not dates or today > dates[-1])
+
+        # Only today's partition is written; earlier snapshots are never touched
+        with timer('db_upsert'):
+            store.append(today, data, replace=True)
+
+        with timer('json_save'):
+            if appends_latest and os.path.exists(tournament_meta_path):
+                append_json_object_entry(tournament_meta_path, today, data, indent=4)
+            else:
+                export_tournament_meta(store)
         logger.info(f"Data saved to {tournament_meta_path} with timestamp key {today}")
-        logger.info(f"File now contains data for {len(existing_data.keys())} dates")
+        logger.info(f"File now contains data for {len(store)} dates")
+
+        if CONFIG['SHARD_META']:
+            with timer('json_save'):
+                write_missing_shards(store, force_dates=(today,))
+        saved = True
+        if CONFIG['COLUMNAR_META']:
+            saved = write_columnar_meta(store, force_dates=(today,))
+
+        with timer('analytics'):
+            return update_meta_analytics(store) is not None and saved
     except Exception as e:
         logger.error(f"Error saving data to JSON: {e}")
+        return False
+
+def correct_historical_data(processes=None):
+    """Corrects historical data by applying the 'Other' category to previous days.
+
+    Dates are normalized in parallel worker processes and written back as they finish.
+    """
+    from metaCorrection import correct_store, format_timing_report
 
-def correct_historical_data():
-    """Corrects historical data by applying the 'Other' category to previous days."""
     logger.info("Starting correction of historical matchup data...")
+    start_time = time.time()
     
     # Path to the tournament meta file
     tournament_meta_path = CONFIG['TOURNAMENT_META_FILE']
     
-    if not os.path.exists(tournament_meta_path):
+    if not os.path.exists(tournament_meta_path) and not os.path.exists(CONFIG['META_PARTITION_DIR']):
         logger.error(f"Tournament meta file not found at {tournament_meta_path}")
         return False
     
     try:
-        # Load existing data
-        with open(tournament_meta_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-            logger.info(f"Loaded data for {len(existing_data.keys())} dates for correction")
+        store = open_meta_store()
+        logger.info(f"Loaded data for {len(store)} dates for correction")
         
-        # Process each date's data
-        for date, decks in existing_data.items():
-            logger.info(f"Correcting data for {date}...")
-            existing_data[date] = check_and_normalize_matchups(decks, correct_existing=True)
+        # Process each date's partition in a worker process
+        timings = correct_store(store, processes=processes)
         
         # Save corrected data
-        with open(tournament_meta_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=4, ensure_ascii=False)
+        export_start = time.time()
+        export_tournament_meta(store)
+        if CONFIG['SHARD_META']:
+            write_missing_shards(store, force_dates=store.dates())
+        if CONFIG['COLUMNAR_META']:
+            write_columnar_meta(store, force_dates=store.dates())
+        update_meta_analytics(store)
         
+        logger.info("Per-date correction timings:\n" + format_timing_report(timings))
+        logger.info(f"Export time: {time.time() - export_start:.2f} seconds")
+        logger.info(f"Script execution time: {(time.time() - start_time):.2f} seconds")
+        if len(timings) < len(store):
+            logger.error(f"Corrected {len(timings)} of {len(store)} dates")
+            return False
         logger.info("Historical data correction completed successfully")
         return True
     except Exception as e:
         logger.error(f"Error during historical data correction: {e}")
         return False
 
-def scrape_pocket_decks(max_workers=5):
-    """Main function to scrape Pocket TCG deck data with parallel matchup processing."""
-    sys.stderr = original_stderr
-    start_time = time.time()
-    main_driver = None
+def scrape_meta_table(main_driver):
+    """Reads the deck meta table (rank, name, link, count, share, win rate)."""
+    with timer('page_load'):
+        main_driver.get(CONFIG['DECKS_URL'])
+
+    logger.info("Waiting for page to load...")
+    wait_for_element(main_driver, By.CSS_SELECTOR, "table.meta tbody tr", timeout=30)
 
     try:
-        logger.info("Initializing scraper...")
-        main_driver = create_new_driver()
-        main_driver.get("https://play.limitlesstcg.com/decks?game=POCKET")
+        logger.info("Attempting to show all decks...")
+        find_and_click_button("div.show-all", main_driver)
+    except Exception as e:
+        logger.warning(f"Note: Could not show all decks: {e}")
 
-        logger.info("Waiting for page to load...")
-        WebDriverWait(main_driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table.meta tbody tr"))
-        )
+    logger.info("Gathering deck information...")
+    with timer('parse'):
+        rows = main_driver.find_elements(By.CSS_SELECTOR, "table.meta tbody tr")
+        return parse_meta_rows(rows)
+
+def scrape_meta_table_http(url=None):
+    """Reads the deck meta table over pooled HTTP. All rows are present in the static page."""
+    logger.info("Fetching deck meta table...")
+    _, document = httpFetch.fetch_document(url or CONFIG['DECKS_URL'])
+    with timer('parse'):
+        rows = document.find_elements(By.CSS_SELECTOR, "table.meta tbody tr")
+        return parse_meta_rows(rows)
+
+def parse_meta_rows(rows):
+    """Builds deck entries from meta table rows."""
+    decks = []
+    for row in rows:
+        if not row.text.strip():
+            continue
+
+        cells = row.find_elements(By.TAG_NAME, "td")
+        if len(cells) >= 6:
+            rank = cells[0].text.strip()
+            try:
+                link_element = cells[2].find_element(By.TAG_NAME, "a")
+                deck_name = link_element.text.strip()
+                deck_url = link_element.get_attribute("href")
+            except:
+                deck_name = cells[2].text.strip()
+                deck_url = "N/A"
+
+            count = cells[3].text.strip() if len(cells) > 3 else "N/A"
+            share = cells[4].text.strip() if len(cells) > 4 else "N/A"
+            win_percent = cells[6].text.strip() if len(cells) > 6 else "N/A"
+
+            decks.append({
+                "Rank": rank,
+                "Deck Name": deck_name,
+                "URL": deck_url,
+                "Count": count,
+                "Share": share,
+                "Win %": win_percent,
+            })
+
+    logger.info(f"Found {len(decks)} decks")
+    return decks
 
-        try:
-            logger.info("Attempting to show all decks...")
-            find_and_click_button("div.show-all", main_driver)
-        except Exception as e:
-            logger.warning(f"Note: Could not show all decks: {e}")
+def start_checkpoint(journal, resume):
+    """Restores the deck list and finished matchups of an interrupted run.
 
-        logger.info("Gathering deck information...")
-        rows = main_driver.find_elements(By.CSS_SELECTOR, "table.meta tbody tr")
-        decks = []
-        for row in rows:
-            if not row.text.strip():
-                continue
-
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 6:
-                rank = cells[0].text.strip()
-                try:
-                    link_element = cells[2].find_element(By.TAG_NAME, "a")
-                    deck_name = link_element.text.strip()
-                    deck_url = link_element.get_attribute("href")
-                except:
-                    deck_name = cells[2].text.strip()
-                    deck_url = "N/A"
-
-                count = cells[3].text.strip() if len(cells) > 3 else "N/A"
-                share = cells[4].text.strip() if len(cells) > 4 else "N/A"
-                win_percent = cells[6].text.strip() if len(cells) > 6 else "N/A"
-
-                decks.append({
-                    "Rank": rank,
-                    "Deck Name": deck_name,
-                    "URL": deck_url,
-                    "Count": count,
-                    "Share": share,
-                    "Win %": win_percent,
-                })
-
-        logger.info(f"Found {len(decks)} decks")
-        main_driver.quit()
-        main_driver = None
+    Returns:
+        tuple: (snapshot date, decks, full matrix flag) from the journal,
+            or (None, None, None) when there is nothing to resume
+    """
+    header, records = journal.read() if resume else (None, [])
+    if header is None:
+        if resume:
+            logger.info("No checkpoint to resume, starting a full run")
+        return None, None, None
+
+    decks = header['decks']
+    finished = {record['deck']: record['matchups'] for record in records if record['type'] == 'matchups'}
+    for item in decks:
+        if item['Deck Name'] in finished:
+            item["Matchups"] = finished[item['Deck Name']]
+    journal.reopen()
+    increment('decks_resumed', len(finished))
+    logger.info(f"Resumed run started {header['started']} for {header['date']}: "
+                f"{len(finished)}/{len(decks)} decks already have matchups")
+    return header['date'], decks, header.get('fullMatrix', False)
+
+def scrape_pocket_decks(max_workers=5, engine=None, resume=False, full_matrix=False):
+    """Main function to scrape Pocket TCG deck data with parallel matchup processing.
+
+    With full_matrix, matchups are collected for every deck in the meta list
+    (over HTTP), stored as a sparse matrix, and the usual top MAX_DECKS
+    snapshot is cut from that.
+    """
+    from datetime import datetime
 
+    sys.stderr = original_stderr
+    start_time = time.time()
+    engine = engine or CONFIG['ENGINE']
+    driver_pool = create_driver_pool(max_workers)
+    journal = CheckpointJournal(CONFIG['CHECKPOINT_FILE'], flush_every=1)
+
+    try:
+        logger.info("Initializing scraper...")
+        snapshot_date, decks, resumed_full_matrix = start_checkpoint(journal, resume)
+        if decks is None:
+            if engine == 'selenium' and not full_matrix:
+                with driver_pool.driver() as main_driver:
+                    decks = scrape_meta_table(main_driver)
+            else:
+                decks = scrape_meta_table_http()
+
+            if not full_matrix:
+                decks = decks[:CONFIG['MAX_DECKS']]
+            snapshot_date = datetime.now().strftime("%Y-%m-%d")
+            journal.start(command='decks', date=snapshot_date, decks=decks, fullMatrix=full_matrix)
+        else:
+            full_matrix = resumed_full_matrix
+        if full_matrix:
+            # Hundreds of matchup pages are only practical without browsers
+            engine = 'http'
 
         logger.info("Starting matchup collection...")
-        logger.info(f"Sraping top {CONFIG['MAX_DECKS']} decks")
+        logger.info(f"Sraping top {len(decks)} decks")
 
-        decks = decks[:CONFIG['MAX_DECKS']]
+        pending = [item for item in decks if "Matchups" not in item]
+        retry_queue = RetryQueue()
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_deck = {
-                executor.submit(scrape_deck_matchups_with_new_driver, item['Deck Name'], item['URL']): item
-                for item in decks
-            }
-            completed = 0
+            if engine == 'selenium':
+                future_to_deck = {
+                    executor.submit(scrape_deck_matchups_with_new_driver, item['Deck Name'], item['URL'], driver_pool): item
+                    for item in pending
+                }
+            else:
+                future_to_deck = {
+                    executor.submit(scrape_deck_matchups_http, item['Deck Name'], item['URL']): item
+                    for item in pending
+                }
+            completed = len(decks) - len(pending)
             for future in as_completed(future_to_deck):
                 logger.info(f"Scraping deck {future_to_deck[future]['Deck Name']}")
                 item = future_to_deck[future]
                 try:
                     item["Matchups"] = future.result()
+                    journal.record('matchups', deck=item['Deck Name'], matchups=item["Matchups"])
+                    increment('decks_scraped' if item["Matchups"] else 'decks_without_matchups')
                     completed += 1
                     logger.info(f"Progress: {completed}/{len(decks)} decks processed")
+                except httpFetch.TransientRequestError as e:
+                    logger.warning(f"Deferring matchups of {item['Deck Name']}: {e}")
+                    item["Matchups"] = {}
+                    retry_queue.defer(item['Deck Name'], retry_deck_matchups, item, engine, driver_pool, journal)
                 except Exception as e:
                     logger.error(f"Error processing {item['Deck Name']}: {e}")
+                    increment('decks_failed')
                     item["Matchups"] = {}
 
+        if len(retry_queue):
+            logger.info(f"Retrying matchups of {len(retry_queue)} decks...")
+            retry_queue.drain(CONFIG['MAX_RETRIES'], CONFIG['RETRY_DELAY'])
+
+        if full_matrix:
+            from matrixStore import MatchupMatrixStore
+
+            with timer('db_upsert'):
+                MatchupMatrixStore(CONFIG['MATRIX_DIR']).append(snapshot_date, decks, replace=True)
+            decks = decks[:CONFIG['MAX_DECKS']]
+
         # Final check: ensure all deck names exist in all matchups
         logger.info("Performing final check on matchup data...")
         decks = check_and_normalize_matchups(decks)
@@ -268,14 +542,18 @@ def scrape_pocket_decks(max_workers=5):
         end_time = time.time()
         elapsed_time = end_time - start_time
         logger.info(f"Script execution time: {elapsed_time/60:.2f} minutes")
-        save_data_to_json(decks)
+        if not save_data_to_json(decks, date=snapshot_date):
+            # The journal still holds every scraped deck; --resume saves them again
+            logger.error(f"Saving the {snapshot_date} snapshot failed; keeping the checkpoint journal")
+            return None
+        journal.close(completed=True)
         return decks
     except Exception as e:
         logger.error(f"An error occurred during main scraping: {e}")
         return None
     finally:
-        if main_driver:
-            main_driver.quit()
+        journal.close()
+        driver_pool.close()
 
 def print_final_results(data):
     """Parses and prints the final results."""
@@ -290,6 +568,174 @@ def print_final_results(data):
         matchups_count = len(item.get("Matchups", {}))
         logger.info(f"- {deck_name}: {matchups_count} matchups")
 
+def rebuild_from_matrix(date, top_n=None):
+    """Re-cuts a stored full matrix at top_n decks and saves it as that date's snapshot."""
+    from matrixStore import MatchupMatrixStore
+
+    try:
+        store = MatchupMatrixStore(CONFIG['MATRIX_DIR'])
+        if date not in store:
+            logger.error(f"No matchup matrix stored for {date}; available: {', '.join(store.dates()) or 'none'}")
+            return None
+        top_n = top_n or CONFIG['MAX_DECKS']
+        decks = check_and_normalize_matchups(store.snapshot(date, top_n))
+        logger.info(f"Rebuilt the {date} snapshot from its matrix with the top {len(decks)} decks")
+        if not save_data_to_json(decks, date=date):
+            return None
+        return decks
+    except Exception as e:
+        logger.error(f"Error rebuilding snapshot from matrix: {e}")
+        return None
+
+def backfill_plan(start, end, set_codes=None):
+    """Maps a date range to the meta periods (sets) it covers.
+
+    Limitless filters the deck list by set, not by day, so each set's list is
+    the meta from its release until the next set. It is keyed by the last
+    day of that period inside the range: a daily run stores the period's
+    meta so far, so the backfilled list equals what a daily run on that day
+    would have stored. Unlike daily runs, a backfilled period therefore
+    adds one snapshot, not one per day, and the current period's key is
+    end (today at the latest), the same key as today's daily run.
+
+    Dates after the last release in SET_RELEASES plus its longest period
+    cannot be attributed to a set and raise ValueError. Sets the card
+    scraper has seen (SET_MANIFEST_FILE) without a release date are warned
+    about, since the latest period may already have ended.
+
+    Args:
+        start (str): First date (YYYY-MM-DD)
+        end (str): Last date (YYYY-MM-DD), capped at today
+        set_codes (list): Only backfill these sets (default: every set in the range)
+
+    Returns:
+        list: (date key, set code) pairs in date order
+
+    Raises:
+        ValueError: When end is past the dates SET_RELEASES can attribute to a set
+    """
+    from datetime import date, timedelta
+    from setManifest import SetManifest
+
+    releases = sorted(CONFIG['SET_RELEASES'].items(), key=lambda item: item[1])
+    unknown = sorted(set(set_codes or ()) - set(CONFIG['SET_RELEASES']))
+    if unknown:
+        logger.error(f"No release date configured for sets {', '.join(unknown)}; add them to SET_RELEASES")
+
+    end = min(end, date.today().isoformat())
+    release_days = [date.fromisoformat(released) for _, released in releases]
+    longest_period = max((later - earlier for earlier, later in zip(release_days, release_days[1:])), default=timedelta(0))
+    covered_until = (release_days[-1] + longest_period).isoformat()
+    if end > covered_until:
+        raise ValueError(f"{end} is past the last known set release ({releases[-1][0]} on {releases[-1][1]}) plus one "
+                         f"period ({covered_until}); add the newer sets to SET_RELEASES")
+    if end > releases[-1][1]:
+        manifest = SetManifest(CONFIG['SET_MANIFEST_FILE'])
+        manifest.load()
+        undated = sorted(set(manifest.sets) - set(CONFIG['SET_RELEASES']))
+        if undated:
+            logger.warning(f"Sets {', '.join(undated)} have no release date in SET_RELEASES; dates after "
+                           f"{releases[-1][1]} are attributed to {releases[-1][0]} and may belong to a newer set")
+    plan = []
+    for i, (set_code, released) in enumerate(releases):
+        if set_codes and set_code not in set_codes:
+            continue
+        if i + 1 < len(releases):
+            last_day = (date.fromisoformat(releases[i + 1][1]) - timedelta(days=1)).isoformat()
+        else:
+            last_day = end
+        if released <= end and last_day >= start:
+            plan.append((min(last_day, end), set_code))
+    return plan
+
+def backfill_pocket_decks(start, end, set_codes=None, max_workers=5, overwrite=False):
+    """Fills in historical snapshots for a date range in one parallel job.
+
+    The meta lists of all periods are fetched concurrently, then the
+    matchup pages of every snapshot share one worker pool. Dates that
+    already have a snapshot are skipped unless overwrite is set, so a rerun
+    only fetches what is still missing.
+
+    Returns:
+        dict: Saved snapshots by date key, or None on error
+    """
+    sys.stderr = original_stderr
+    start_time = time.time()
+
+    try:
+        plan = backfill_plan(start, end, set_codes)
+        store = open_meta_store()
+        skipped = [date for date, _ in plan if date in store and not overwrite]
+        if skipped:
+            logger.info(f"Skipping dates that already have a snapshot: {', '.join(skipped)}")
+        plan = [(date, set_code) for date, set_code in plan if date not in skipped]
+        if not plan:
+            logger.info(f"Nothing to backfill between {start} and {end}")
+            return {}
+        logger.info(f"Backfilling {len(plan)} snapshots: " + ", ".join(f"{date} ({set_code})" for date, set_code in plan))
+
+        snapshots = {}
+        retry_queue = RetryQueue()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_period = {executor.submit(scrape_meta_table_http, meta_url(set_code)): (date, set_code)
+                                for date, set_code in plan}
+            for future in as_completed(future_to_period):
+                date, set_code = future_to_period[future]
+                try:
+                    decks = future.result()[:CONFIG['MAX_DECKS']]
+                except Exception as e:
+                    logger.error(f"Error fetching the {set_code} meta list for {date}: {e}")
+                    increment('backfill_failed')
+                    continue
+                if not decks:
+                    logger.warning(f"No decks listed for {set_code}, skipping {date}")
+                    continue
+                snapshots[date] = decks
+
+            future_to_deck = {
+                executor.submit(scrape_deck_matchups_http, item['Deck Name'], item['URL']): (date, item)
+                for date, decks in snapshots.items() for item in decks
+            }
+            completed = 0
+            for future in as_completed(future_to_deck):
+                date, item = future_to_deck[future]
+                try:
+                    item["Matchups"] = future.result()
+                    increment('decks_scraped' if item["Matchups"] else 'decks_without_matchups')
+                except httpFetch.TransientRequestError as e:
+                    logger.warning(f"Deferring matchups of {item['Deck Name']} ({date}): {e}")
+                    item["Matchups"] = {}
+                    retry_queue.defer(f"{date} {item['Deck Name']}", retry_deck_matchups, item)
+                except Exception as e:
+                    logger.error(f"Error processing {item['Deck Name']} ({date}): {e}")
+                    increment('decks_failed')
+                    item["Matchups"] = {}
+                completed += 1
+                if completed % 20 == 0 or completed == len(future_to_deck):
+                    logger.info(f"Progress: {completed}/{len(future_to_deck)} matchup pages processed")
+
+        if len(retry_queue):
+            logger.info(f"Retrying matchups of {len(retry_queue)} decks...")
+            retry_queue.drain(CONFIG['MAX_RETRIES'], CONFIG['RETRY_DELAY'])
+
+        # Snapshots are saved one at a time; each only writes its own partition
+        failed = []
+        for date in sorted(snapshots):
+            snapshots[date] = check_and_normalize_matchups(snapshots[date])
+            if save_data_to_json(snapshots[date], date=date):
+                increment('backfill_snapshots')
+            else:
+                failed.append(date)
+
+        logger.info(f"Backfilled {len(snapshots) - len(failed)}/{len(plan)} snapshots in {(time.time() - start_time)/60:.2f} minutes")
+        if failed:
+            logger.error(f"Saving failed for {', '.join(failed)}; rerun the backfill for those dates")
+            return None
+        return snapshots
+    except Exception as e:
+        logger.error(f"An error occurred during backfill: {e}")
+        return None
+
 def check_and_normalize_matchups(decks, correct_existing=False):
     """
     Ensure all deck names exist in the matchup data for each deck.
@@ -300,99 +746,111 @@ def check_and_normalize_matchups(decks, correct_existing=False):
         decks (list): List of deck dictionaries with matchup data
         correct_existing (bool): If True, apply the correction to existing data loaded from file
     """
+    from matchupMatrix import normalize_snapshot
+
     logger.info("Normalizing matchup data to ensure consistency...")
     
-    # Extract all unique deck names from our top decks
-    top_deck_names = {deck["Deck Name"] for deck in decks}
-    
-    # Process each deck's matchups
-    for deck in decks:
-        current_deck_name = deck["Deck Name"]
-        current_matchups = deck.get("Matchups", {})
-        
-        # Create a copy to iterate over while we modify the original
-        matchup_keys = list(current_matchups.keys())
-        
-        # Initialize 'Other' category
-        other_matches = 0
-        other_wins = 0
-        other_losses = 0
-        
-        # Process each matchup
-        for opponent_name in matchup_keys:
-            # If the opponent is not in our top decks, add to 'Other'
-            if opponent_name not in top_deck_names:
-                matchup_data = current_matchups[opponent_name]
-                
-                # Extract scores
-                matches = int(matchup_data.get("Matches", "0").replace(',', '')) if "Matches" in matchup_data else 0
-                
-                # Handle different formats in the data
-                if "Score" in matchup_data:
-                    score_parts = matchup_data.get("Score", "0-0").split('-')
-                    wins = int(score_parts[0].replace(',', '')) if len(score_parts) > 0 else 0
-                    losses = int(score_parts[1].replace(',', '')) if len(score_parts) > 1 else 0
-                else:
-                    # Try to calculate from win rate if no score available
-                    win_rate_str = matchup_data.get("Win Rate", "0%").replace('%', '')
-                    win_rate = float(win_rate_str) / 100 if win_rate_str and win_rate_str != "0" else 0
-                    wins = int(matches * win_rate) if matches > 0 else 0
-                    losses = matches - wins if matches > 0 else 0
-                
-                # Add to 'Other' totals
-                other_matches += matches
-                other_wins += wins
-                other_losses += losses
-                
-                # Remove this matchup as we're grouping it
-                del current_matchups[opponent_name]
-        
-        # Add the 'Other' category if there were any matches
+    # Parse the snapshot once into a decks x opponents x {W, L, T, matches} array
+    for current_deck_name, other_matches, missing_names in normalize_snapshot(decks):
         if other_matches > 0:
-            other_win_rate = f"{(other_wins / other_matches) * 100:.1f}%" if other_matches > 0 else "0%"
-            current_matchups["Other"] = {
-                "Matches": str(other_matches),
-                "Score": f"{other_wins}-{other_losses}",
-                "Win Rate": other_win_rate
-            }
             logger.info(f"Created 'Other' category for {current_deck_name} with {other_matches} matches")
-        
-        # Add missing matchups for all top decks not in the current matchups
-        for top_deck_name in top_deck_names:
-            if top_deck_name not in current_matchups:
-                # Add empty matchup data
-                current_matchups[top_deck_name] = {
-                    "Matches": "0",
-                    "Score": "0-0",
-                    "Win Rate": "0%"
-                }
-                logger.info(f"Added missing matchup: {current_deck_name} vs {top_deck_name}")
-        
-        # Update the matchups in the deck data
-        deck["Matchups"] = current_matchups
+        if missing_names:
+            logger.info(f"Added {len(missing_names)} missing matchups for {current_deck_name}: {', '.join(missing_names)}")
     
     logger.info(f"Matchup normalization complete. All decks now have matchup data for all top {len(decks)} opponents plus 'Other' category.")
     return decks
 
+def _iso_date(value):
+    """argparse type for YYYY-MM-DD dates."""
+    import argparse
+    from datetime import date
+
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+def add_cli_arguments(parser, command='decks'):
+    """Adds the options of the 'decks' or 'correct' command to parser."""
+    if command == 'decks':
+        parser.add_argument("--max-workers", type=int, default=CONFIG['MAX_WORKERS'], help="Maximum number of concurrent workers")
+        parser.add_argument("--max-decks", type=int, default=CONFIG['MAX_DECKS'], help="Maximum number of decks to scrape")
+        parser.add_argument("--engine", choices=["http", "selenium"], default=CONFIG['ENGINE'], help="Fetch pages over pooled HTTP (default) or with a headless browser")
+        parser.add_argument("--no-cache", action="store_true", help="Bypass the conditional-GET HTTP cache")
+        parser.add_argument("--resume", action="store_true", help="Continue an interrupted run from its checkpoint journal")
+        # Run modes; run_cli picks one branch, so combining them is rejected
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument("--analytics-only", action="store_true", help="Only rebuild the meta analytics file from stored snapshots")
+        mode.add_argument("--full-matrix", action="store_true", help="Collect matchups for every deck in the meta list and store the full matrix")
+        mode.add_argument("--from-matrix", metavar="DATE", type=_iso_date, default=None, help="Rebuild DATE's snapshot (YYYY-MM-DD) from its stored matrix, cut at --max-decks")
+        mode.add_argument("--backfill", nargs=2, metavar=("START", "END"), type=_iso_date, default=None,
+                          help="Fill in snapshots for the set meta periods between two dates (YYYY-MM-DD)")
+        parser.add_argument("--sets", default=None, help="Comma-separated set codes to limit --backfill to (e.g. A2b,A3)")
+        parser.add_argument("--overwrite", action="store_true", help="Let --backfill replace snapshots that already exist")
+    else:
+        parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--storage", choices=["json", "sqlite", "delta"], default=CONFIG['STORAGE'],
+                        help="Keep snapshots in date partitions (default), an SQLite database or periodic bases plus per-day deltas")
+    parser.add_argument("--shard-meta", action="store_true", help="Also write one tournament meta file per date plus an index")
+    parser.add_argument("--columnar", choices=["parquet", "arrow"], default=CONFIG['COLUMNAR_META'],
+                        help="Also export typed deck and matchup tables per date as Parquet or Arrow IPC (needs pyarrow)")
+    parser.add_argument("--metrics-file", default=None, help="Where to write per-stage timers and counters as JSON (default: scraper/metrics/<command>.json)")
+    parser.add_argument("--prometheus-file", default=None, help="Also write the metrics in Prometheus text format (e.g. for a textfile collector)")
+
+def run_cli(args, command='decks'):
+    """Runs the 'decks' scrape or the 'correct' pass with parsed arguments."""
+    setup_logging(CONFIG['LOG_FILE'])
+    METRICS.reset(command)
+
+    # Update config based on command line arguments
+    CONFIG['MAX_WORKERS'] = getattr(args, 'max_workers', CONFIG['MAX_WORKERS'])
+    CONFIG['MAX_DECKS'] = getattr(args, 'max_decks', CONFIG['MAX_DECKS'])
+    CONFIG['ENGINE'] = getattr(args, 'engine', CONFIG['ENGINE'])
+    CONFIG['SHARD_META'] = args.shard_meta
+    CONFIG['COLUMNAR_META'] = getattr(args, 'columnar', CONFIG['COLUMNAR_META'])
+    CONFIG['STORAGE'] = getattr(args, 'storage', CONFIG['STORAGE'])
+    httpFetch.configure(
+        pool_size=CONFIG['MAX_WORKERS'],
+        cache_dir="" if getattr(args, 'no_cache', False) else CONFIG['HTTP_CACHE_DIR'],
+        cache_max_bytes=CONFIG['HTTP_CACHE_MAX_MB'] * 1024 * 1024,
+        host_rates=CONFIG['HOST_RATES']
+    )
+    
+    try:
+        if command == 'correct':
+            logger.info("Running in historical data correction mode...")
+            return correct_historical_data(processes=getattr(args, 'processes', None))
+        if getattr(args, 'from_matrix', None):
+            scraped_data = rebuild_from_matrix(args.from_matrix)
+            return scraped_data is not None
+        if getattr(args, 'backfill', None):
+            start, end = sorted(args.backfill)
+            set_codes = [code.strip() for code in args.sets.split(',') if code.strip()] if args.sets else None
+            scraped_data = backfill_pocket_decks(start, end, set_codes, max_workers=CONFIG['MAX_WORKERS'],
+                                                 overwrite=args.overwrite)
+            return scraped_data is not None
+        if getattr(args, 'analytics_only', False):
+            logger.info("Rebuilding meta analytics from stored snapshots...")
+            with timer('analytics'):
+                return update_meta_analytics() is not None
+
+        logger.info(f"Starting scraper with {CONFIG['MAX_WORKERS']} concurrent workers...")
+        scraped_data = scrape_pocket_decks(max_workers=CONFIG['MAX_WORKERS'], resume=getattr(args, 'resume', False),
+                                           full_matrix=getattr(args, 'full_matrix', False))
+        print_final_results(scraped_data)
+        return scraped_data is not None
+    finally:
+        METRICS.export(getattr(args, 'metrics_file', None) or CONFIG['METRICS_FILE'].format(command=command),
+                       getattr(args, 'prometheus_file', None))
+
 if __name__ == "__main__":
     import argparse
     
     # Set up command line arguments
     parser = argparse.ArgumentParser(description="Scrape PTCG Pocket deck data and matchups")
     parser.add_argument("--correct-historical", action="store_true", help="Only correct historical data without scraping new data")
-    parser.add_argument("--max-workers", type=int, default=CONFIG['MAX_WORKERS'], help="Maximum number of concurrent workers")
-    parser.add_argument("--max-decks", type=int, default=CONFIG['MAX_DECKS'], help="Maximum number of decks to scrape")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes for --correct-historical (default: CPU count)")
+    add_cli_arguments(parser, 'decks')
     
     args = parser.parse_args()
-    
-    # Update config based on command line arguments
-    CONFIG['MAX_WORKERS'] = args.max_workers
-    CONFIG['MAX_DECKS'] = args.max_decks
-    
-    if args.correct_historical:
-        logger.info("Running in historical data correction mode...")
-        correct_historical_data()
-    else:
-        logger.info(f"Starting scraper with {CONFIG['MAX_WORKERS']} concurrent workers...")
-        scraped_data = scrape_pocket_decks(max_workers=CONFIG['MAX_WORKERS'])
-        print_final_results(scraped_data)
\ No newline at end of file
+    run_cli(args, 'correct' if args.correct_historical else 'decks')
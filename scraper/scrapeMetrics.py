@@ -0,0 +1,180 @@
+"""
+Per-stage timers and event counters for the scrapers.
+Code under measurement wraps a stage in `with timer('page_load'):` and
+counts events with `increment('http_cache_hits')`; both go to a process
+wide registry that the CLI exports after a run as a JSON metrics file and,
+optionally, in the Prometheus text exposition format.
+
+Stages overlap when work runs concurrently, so stage totals are busy time
+summed over threads and can add up to more than the run's wall time.
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from jsonWriter import write_json_atomic, write_text_atomic
+
+logger = logging.getLogger('ScrapeMetrics')
+
+# Stages timed by the scrapers, in pipeline order
+STAGES = ('driver_startup', 'page_load', 'element_wait', 'parse', 'icon_io', 'db_upsert', 'json_save')
+
+# Upper bounds (seconds) of the Prometheus histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Durations kept per stage for percentiles (reservoir sampled beyond this)
+SAMPLE_LIMIT = 5000
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self, scraper=None):
+        """Clears all timers and counters and marks the start of a run."""
+        with self._lock:
+            self.scraper = scraper
+            self.started = time.time()
+            self.stages = {}  # stage -> {"count", "total", "max", "buckets", "samples"}
+            self.counters = {}
+
+    def observe(self, stage, seconds):
+        """Records one duration for a stage."""
+        with self._lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                entry = self.stages[stage] = {"count": 0, "total": 0.0, "max": 0.0,
+                                              "buckets": [0] * len(BUCKETS), "samples": []}
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    entry["buckets"][i] += 1
+                    break
+            if len(entry["samples"]) < SAMPLE_LIMIT:
+                entry["samples"].append(seconds)
+            else:
+                slot = random.randrange(entry["count"])
+                if slot < SAMPLE_LIMIT:
+                    entry["samples"][slot] = seconds
+
+    @contextmanager
+    def timer(self, stage):
+        """Times the with-block as one occurrence of stage, including when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def increment(self, counter, amount=1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def snapshot(self):
+        """Returns the metrics as a JSON-serializable dict."""
+        with self._lock:
+            wall = time.time() - self.started
+            stages = {}
+            ordered = sorted(self.stages, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s))
+            for stage in ordered:
+                entry = self.stages[stage]
+                samples = sorted(entry["samples"])
+                stages[stage] = {
+                    "count": entry["count"],
+                    "totalSeconds": round(entry["total"], 4),
+                    "meanMs": round(1000 * entry["total"] / entry["count"], 3),
+                    "p50Ms": round(1000 * _percentile(samples, 0.50), 3),
+                    "p95Ms": round(1000 * _percentile(samples, 0.95), 3),
+                    "maxMs": round(1000 * entry["max"], 3),
+                }
+            return {
+                "scraper": self.scraper,
+                "startedAt": datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+                "wallSeconds": round(wall, 3),
+                "stages": stages,
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def to_prometheus(self):
+        """Renders the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            scraper = self.scraper or "unknown"
+            stages = {stage: dict(entry, buckets=list(entry["buckets"])) for stage, entry in sorted(self.stages.items())}
+            counters = dict(sorted(self.counters.items()))
+            wall = time.time() - self.started
+            started = self.started
+
+        lines = [
+            "# HELP ptcgp_stage_seconds Time spent in a scraper stage.",
+            "# TYPE ptcgp_stage_seconds histogram",
+        ]
+        for stage, entry in stages.items():
+            labels = f'scraper="{scraper}",stage="{stage}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, entry["buckets"]):
+                cumulative += count
+                lines.append(f'ptcgp_stage_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            lines.append(f'ptcgp_stage_seconds_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+            lines.append(f'ptcgp_stage_seconds_sum{{{labels}}} {entry["total"]:.6f}')
+            lines.append(f'ptcgp_stage_seconds_count{{{labels}}} {entry["count"]}')
+        lines += [
+            "# HELP ptcgp_events_total Scraper events such as cache hits, retries and skips.",
+            "# TYPE ptcgp_events_total counter",
+        ]
+        lines += [f'ptcgp_events_total{{scraper="{scraper}",event="{name}"}} {value}' for name, value in counters.items()]
+        lines += [
+            "# HELP ptcgp_run_duration_seconds Wall time of the last run.",
+            "# TYPE ptcgp_run_duration_seconds gauge",
+            f'ptcgp_run_duration_seconds{{scraper="{scraper}"}} {wall:.3f}',
+            "# HELP ptcgp_run_start_timestamp_seconds Start time of the last run.",
+            "# TYPE ptcgp_run_start_timestamp_seconds gauge",
+            f'ptcgp_run_start_timestamp_seconds{{scraper="{scraper}"}} {started:.0f}',
+        ]
+        return "\n".join(lines) + "\n"
+
+    def export(self, json_path=None, prometheus_path=None):
+        """Writes the metrics files and logs where the time went."""
+        snapshot = self.snapshot()
+        try:
+            if json_path:
+                write_json_atomic(json_path, snapshot, indent=2)
+                logger.info(f"Metrics written to {json_path}")
+            if prometheus_path:
+                write_text_atomic(prometheus_path, self.to_prometheus())
+                logger.info(f"Prometheus metrics written to {prometheus_path}")
+        except Exception as e:
+            logger.error(f"Error writing metrics: {e}")
+
+        logger.info(f"Run took {snapshot['wallSeconds']:.1f}s; busy time per stage:")
+        for stage, entry in sorted(snapshot["stages"].items(), key=lambda item: -item[1]["totalSeconds"]):
+            logger.info(f"  {stage:<16}{entry['totalSeconds']:>10.2f}s over {entry['count']} calls "
+                        f"(p50 {entry['p50Ms']:.1f} ms, p95 {entry['p95Ms']:.1f} ms)")
+        if snapshot["counters"]:
+            logger.info("  " + ", ".join(f"{name}={value}" for name, value in snapshot["counters"].items()))
+        return snapshot
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))]
+
+
+METRICS = MetricsRegistry()
+
+
+def timer(stage):
+    """Times a with-block as one occurrence of stage in the shared registry."""
+    return METRICS.timer(stage)
+
+
+def increment(counter, amount=1):
+    """Adds to a counter in the shared registry."""
+    METRICS.increment(counter, amount)
@@ -0,0 +1,27 @@
+"""
+Logging setup shared by the scraper entry points.
+Configuring handlers is an explicit call made when a command actually runs,
+so importing a scraper module (for --help, or in a worker process) neither
+opens nor truncates its log file.
+"""
+
+import logging
+import os
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(log_file, level=logging.INFO):
+    """Logs to the console and to log_file (truncated per run). Later calls are no-ops."""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(log_file, mode='w', encoding='utf-8')
+        ]
+    )
@@ -0,0 +1,108 @@
+"""
+Persisted manifest of the cards seen on each set's listing page.
+A set whose listing hash is unchanged and whose cards have all been
+resolved (scraped, or permanently skipped as non-diamond / non-Pokémon)
+needs no card requests at all.
+
+The hash covers the listing's card URLs only, and a resolved card is never
+requested again. A card whose page content changes under the same URL is
+therefore not picked up (as before the manifest, cards already in
+card_data.json were never re-scraped); run with --reset to refresh them.
+The manifest is committed with card_data.json, so a fresh checkout skips
+the same cards.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+from jsonWriter import write_json_atomic
+
+logger = logging.getLogger('SetManifest')
+
+
+class SetManifest:
+    def __init__(self, path):
+        self.path = path
+        self.sets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def card_number(url):
+        return url.rstrip('/').split('/')[-1]
+
+    @staticmethod
+    def listing_hash(card_links):
+        """Order-independent hash of a set listing's card URLs (not of the card pages)."""
+        digest = hashlib.sha1()
+        for url in sorted(card_links):
+            digest.update(url.encode('utf-8'))
+            digest.update(b'\n')
+        return digest.hexdigest()
+
+    def load(self):
+        """Loads the manifest from disk if it exists."""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.sets = json.load(f).get('sets', {})
+                logger.info(f"Loaded set manifest with {len(self.sets)} sets")
+        except Exception as e:
+            logger.error(f"Error loading set manifest: {e}")
+            self.sets = {}
+
+    def reset(self):
+        with self._lock:
+            self.sets = {}
+
+    def save(self):
+        """Writes the manifest to disk."""
+        try:
+            with self._lock:
+                data = {"sets": {
+                    code: dict(entry, resolved=sorted(entry['resolved'], key=_card_sort_key))
+                    for code, entry in sorted(self.sets.items())
+                }}
+            write_json_atomic(self.path, data, indent=2)
+            logger.info(f"Set manifest saved to {self.path}")
+        except Exception as e:
+            logger.error(f"Error saving set manifest: {e}")
+
+    def diff(self, set_link, card_links):
+        """Records a set listing and returns the card links that still need scraping."""
+        set_code = set_link['setCode']
+        listing_hash = self.listing_hash(card_links)
+        with self._lock:
+            entry = self.sets.get(set_code)
+            if entry is None:
+                entry = {"setName": set_link['setName'], "resolved": []}
+                self.sets[set_code] = entry
+            unchanged = entry.get('hash') == listing_hash
+            resolved = set(entry['resolved'])
+            entry['resolved'] = resolved
+            entry['setName'] = set_link['setName']
+            entry['cardCount'] = len(card_links)
+            entry['hash'] = listing_hash
+            entry['checked'] = datetime.now().strftime("%Y-%m-%d")
+
+        pending = [url for url in card_links if self.card_number(url) not in resolved]
+        if unchanged and not pending:
+            logger.info(f"Set {set_code} unchanged ({len(card_links)} cards), skipping")
+        else:
+            logger.info(f"Set {set_code}: {len(pending)} of {len(card_links)} cards to scrape")
+        return pending
+
+    def mark_resolved(self, set_code, card_number):
+        """Marks a card as needing no further requests."""
+        with self._lock:
+            entry = self.sets.setdefault(set_code, {"setName": "", "resolved": set()})
+            if not isinstance(entry['resolved'], set):
+                entry['resolved'] = set(entry['resolved'])
+            entry['resolved'].add(card_number)
+
+
+def _card_sort_key(card_number):
+    return (0, int(card_number), '') if card_number.isdigit() else (1, 0, card_number)
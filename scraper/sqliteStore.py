@@ -0,0 +1,290 @@
+"""
+Optional embedded SQLite backend for cards and meta snapshots.
+One database file in WAL mode holds everything the scrapers keep between
+runs. Cards and decks are upserted in batches, one transaction each,
+instead of rewriting whole JSON files, and the JSON files the
+front end reads become an export step. The stores mirror the interfaces of
+CardStore and MetaSnapshotStore so they can be swapped in by configuration.
+
+A store holds one connection behind a lock: writes from worker threads are
+serialized in-process, which is cheaper than letting SQLite arbitrate
+between connections, and each batch commits in microseconds under
+synchronous=NORMAL. match_history.json stays a plain file: it is written
+by the front end's save endpoint, not by the scrapers.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from cardStore import CARD_FIELDS, INDEXED_FIELDS, card_sort_key
+
+logger = logging.getLogger('SqliteStore')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS cards (
+    id TEXT PRIMARY KEY,
+    setNumber TEXT, setName TEXT, cardNumber TEXT,
+    cardName TEXT, cardElement TEXT, cardType TEXT, cardSubtype TEXT,
+    evolvesFrom TEXT, webLink TEXT, iconPath TEXT, finalEvolution INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_cards_set ON cards (setNumber);
+CREATE INDEX IF NOT EXISTS idx_cards_name ON cards (cardName);
+CREATE INDEX IF NOT EXISTS idx_cards_evolves_from ON cards (evolvesFrom);
+
+CREATE TABLE IF NOT EXISTS meta_snapshots (
+    date TEXT PRIMARY KEY,
+    decks INTEGER NOT NULL
+);
+-- The primary key doubles as the index on date
+CREATE TABLE IF NOT EXISTS meta_decks (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    deck_name TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (date, position)
+);
+CREATE INDEX IF NOT EXISTS idx_meta_decks_name ON meta_decks (deck_name, date);
+"""
+
+
+def connect(path):
+    """Opens (and if needed creates) the database in WAL mode with the schema in place."""
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class _SqliteBase:
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self):
+        with self._lock:
+            if self._connection is None:
+                self._connection = connect(self.path)
+            return self._connection
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_value(self, key, default=None):
+        """Reads a JSON value from the settings table (e.g. the icon atlas map)."""
+        with self._lock:
+            row = self.connection.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else default
+
+    def set_value(self, key, value):
+        with self._lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                                    (key, json.dumps(value, ensure_ascii=False)))
+
+    def __getstate__(self):
+        # Connections cannot cross processes; a worker reconnects on first use
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+
+class SqliteCardStore(_SqliteBase):
+    """CardStore interface over the cards table."""
+
+    COLUMNS = ('id',) + CARD_FIELDS
+
+    @staticmethod
+    def _row(card_id, data):
+        row = [card_id] + [data.get(field) for field in CARD_FIELDS]
+        final = data.get('finalEvolution')
+        row[-1] = None if final is None else int(bool(final))
+        return row
+
+    @staticmethod
+    def _card(row):
+        data = dict(zip(CARD_FIELDS, row[1:]))
+        if data['finalEvolution'] is not None:
+            data['finalEvolution'] = bool(data['finalEvolution'])
+        return data
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+
+    def __contains__(self, card_id):
+        with self._lock:
+            return self.connection.execute("SELECT 1 FROM cards WHERE id = ?", (card_id,)).fetchone() is not None
+
+    def upsert(self, card_id, data):
+        """Inserts or replaces a card."""
+        self.upsert_many([(card_id, data)])
+
+    def upsert_many(self, items):
+        """Inserts or replaces (card_id, data) pairs in a single transaction."""
+        placeholders = ', '.join('?' * len(self.COLUMNS))
+        rows = [self._row(card_id, data) for card_id, data in items]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO cards ({', '.join(self.COLUMNS)}) VALUES ({placeholders})", rows)
+
+    def get(self, card_id):
+        """Returns a card as a dict, or None."""
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM cards WHERE id = ?", (card_id,)).fetchone()
+        return self._card(row) if row is not None else None
+
+    def set_field(self, card_id, field, value):
+        """Updates one field of a stored card."""
+        if field not in CARD_FIELDS:
+            raise KeyError(field)
+        if field == 'finalEvolution' and value is not None:
+            value = int(bool(value))
+        with self._lock, self.connection:
+            cursor = self.connection.execute(f"UPDATE cards SET {field} = ? WHERE id = ?", (value, card_id))
+            if cursor.rowcount == 0:
+                raise KeyError(card_id)
+
+    def ids_by(self, field, value):
+        """Returns the ids of cards whose indexed field equals value."""
+        if field not in INDEXED_FIELDS:
+            raise KeyError(field)
+        with self._lock:
+            return {row[0] for row in self.connection.execute(f"SELECT id FROM cards WHERE {field} IS ?", (value,))}
+
+    def values_of(self, field):
+        """Returns the distinct values of an indexed field."""
+        if field not in INDEXED_FIELDS:
+            raise KeyError(field)
+        with self._lock:
+            return {row[0] for row in self.connection.execute(f"SELECT DISTINCT {field} FROM cards")}
+
+    def ids(self):
+        with self._lock:
+            return [row[0] for row in self.connection.execute("SELECT id FROM cards")]
+
+    def clear(self):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM cards")
+
+    def iter_export(self):
+        """Yields (card_id, dict) pairs sorted by set and card number."""
+        with self._lock:
+            rows = self.connection.execute(f"SELECT {', '.join(self.COLUMNS)} FROM cards").fetchall()
+        rows.sort(key=lambda row: card_sort_key(row[0]))
+        for row in rows:
+            yield row[0], self._card(row)
+
+    def export(self):
+        """Returns all cards as {card_id: dict}, sorted by set and card number."""
+        return dict(self.iter_export())
+
+
+class SqliteMetaStore(_SqliteBase):
+    """MetaSnapshotStore interface over the meta_snapshots and meta_decks tables."""
+
+    def dates(self):
+        """Returns the stored dates in ascending order."""
+        with self._lock:
+            return [row[0] for row in self.connection.execute("SELECT date FROM meta_snapshots ORDER BY date")]
+
+    def __contains__(self, date):
+        with self._lock:
+            return self.connection.execute("SELECT 1 FROM meta_snapshots WHERE date = ?", (date,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM meta_snapshots").fetchone()[0]
+
+    def append(self, date, decks, replace=False, flush=True):
+        """Writes a snapshot in one transaction; an existing date is only replaced when replace is True.
+
+        flush is accepted for MetaSnapshotStore compatibility; every append commits on its own.
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        rows = [
+            (date, position, deck.get('Deck Name'), json.dumps(deck, ensure_ascii=False, separators=(',', ':')))
+            for position, deck in enumerate(decks)
+        ]
+        with self._lock, self.connection:
+            if not replace and date in self:
+                logger.warning(f"Snapshot for {date} already exists; not overwriting")
+                return False
+            self.connection.execute("DELETE FROM meta_decks WHERE date = ?", (date,))
+            self.connection.executemany(
+                "INSERT INTO meta_decks (date, position, deck_name, data) VALUES (?, ?, ?, ?)", rows)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta_snapshots (date, decks) VALUES (?, ?)", (date, len(decks)))
+        logger.info(f"Stored snapshot {date} with {len(decks)} decks")
+        return True
+
+    def flush(self):
+        """Nothing to write: appends are committed as they happen."""
+
+    def iter_decks(self, date):
+        """Yields the decks of one snapshot in their stored order."""
+        if date not in self:
+            raise KeyError(date)
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT data FROM meta_decks WHERE date = ? ORDER BY position", (date,)).fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+
+    def read(self, date):
+        """Returns one snapshot as a list of decks."""
+        return list(self.iter_decks(date))
+
+    def read_range(self, start=None, end=None):
+        """Returns {date: decks} for dates within [start, end] (inclusive, ISO strings)."""
+        return {
+            date: self.read(date)
+            for date in self.dates()
+            if (start is None or date >= start) and (end is None or date <= end)
+        }
+
+    def iter_snapshots(self):
+        """Yields (date, decks) in date order, one snapshot at a time."""
+        for date in self.dates():
+            yield date, self.read(date)
+
+    def deck_history(self, deck_name):
+        """Returns [(date, deck)] for one archetype across every snapshot, via the deck name index."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT date, data FROM meta_decks WHERE deck_name = ? ORDER BY date", (deck_name,)).fetchall()
+        return [(date, json.loads(data)) for date, data in rows]
+
+    def import_snapshots(self, snapshots):
+        """Bulk-loads (date, decks) pairs, e.g. from the partitioned JSON store. Returns the count."""
+        count = 0
+        for date, decks in snapshots:
+            self.append(date, decks, replace=True)
+            count += 1
+        return count
+
+    def import_json(self, path):
+        """One-time migration of a monolithic {date: decks} file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        count = self.import_snapshots(data.items())
+        logger.info(f"Imported {count} snapshots from {path}")
+        return count
@@ -0,0 +1,128 @@
+"""
+Bounded pool of long-lived WebDriver instances shared by scrape workers.
+Drivers are created lazily, health-checked on checkout and return, and
+recycled after a fixed number of pages or after a crash.
+"""
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from scrapeMetrics import increment, timer
+
+logger = logging.getLogger('WebDriverPool')
+
+
+class WebDriverPool:
+    def __init__(self, factory, size, max_pages=50):
+        """
+        Args:
+            factory (callable): Creates a new WebDriver instance
+            size (int): Maximum number of drivers alive at once
+            max_pages (int): Checkouts served by a driver before it is recycled
+        """
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def is_healthy(driver):
+        """Checks that the browser session still responds."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled browser: {e}")
+
+    def _acquire_driver(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self.is_healthy(driver):
+                return driver
+            logger.warning("Discarding unresponsive pooled browser")
+            self._quit(driver)
+
+        with timer('driver_startup'):
+            driver = self.factory()
+        increment('drivers_started')
+        with self._lock:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def _release_driver(self, driver, crashed):
+        with self._lock:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+
+        if crashed or self._closed or not self.is_healthy(driver):
+            if crashed:
+                logger.warning("Recycling pooled browser after a crash")
+            self._quit(driver)
+        elif pages >= self.max_pages:
+            logger.info(f"Recycling pooled browser after {pages} pages")
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        """Checks out a driver for the duration of the with-block.
+
+        Blocks while all drivers are in use. If the block raises, the driver
+        is assumed to be broken and is replaced on the next checkout.
+        """
+        if self._closed:
+            raise RuntimeError("WebDriverPool is closed")
+        self._slots.acquire()
+        driver = None
+        crashed = False
+        try:
+            driver = self._acquire_driver()
+            yield driver
+        except BaseException:
+            crashed = True
+            raise
+        finally:
+            if driver is not None:
+                self._release_driver(driver, crashed)
+            self._slots.release()
+
+    def close(self):
+        """Quits all idle drivers. Drivers still checked out are quit on return."""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+
+def wait_for_element(driver, by, value, timeout=10, clickable=False):
+    """Waits until an element is present (or clickable) and returns it.
+
+    Selenium's wait helpers are imported here so the HTTP engine never loads them.
+    """
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+    with timer('element_wait'):
+        return WebDriverWait(driver, timeout).until(condition((by, value)))
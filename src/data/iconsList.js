@@ -2,84 +2,110 @@
 // Used when directory listing is not available
 
 const iconsList = [
-  'abomasnow.png', 'abra.png', 'aerodactyl.png', 'aipom.png', 'alakazam.png',
-  'ambipom.png', 'arbok.png', 'arcanine.png', 'arceus.png', 'articuno.png',
-  'azelf.png', 'azumarill.png', 'barboach.png', 'bastiodon.png', 'beedrill.png',
-  'beheeyem.png', 'bellossom.png', 'bellsprout.png', 'bibarel.png', 'bidoof.png',
-  'bisharp.png', 'blastoise.png', 'blitzle.png', 'bronzong.png', 'bronzor.png',
+  'abomasnow.png', 'abra.png', 'absol.png', 'aerodactyl.png', 'aggron.png',
+  'aipom.png', 'alakazam.png', 'ambipom.png', 'araquanid.png', 'arbok.png',
+  'arcanine.png', 'arceus.png', 'aron.png', 'articuno.png', 'azelf.png',
+  'azumarill.png', 'baltoy.png', 'banette.png', 'barboach.png', 'bastiodon.png',
+  'beedrill.png', 'beheeyem.png', 'bellossom.png', 'bellsprout.png', 'bewear.png',
+  'bibarel.png', 'bidoof.png', 'bisharp.png', 'blacephalon.png', 'blastoise.png',
+  'blitzle.png', 'bounsweet.png', 'brionne.png', 'bronzong.png', 'bronzor.png',
   'bruxish.png', 'buizel.png', 'bulbasaur.png', 'buneary.png', 'burmy.png',
-  'butterfree.png', 'carnivine.png', 'caterpie.png', 'celebi.png', 'centiskorch.png',
-  'chansey.png', 'charizard.png', 'charmander.png', 'charmeleon.png', 'chatot.png',
-  'cherrim.png', 'cherubi.png', 'chewtle.png', 'chimchar.png', 'cinccino.png',
+  'butterfree.png', 'buzzwole.png', 'carnivine.png', 'carvanha.png', 'caterpie.png',
+  'celebi.png', 'celesteela.png', 'centiskorch.png', 'chansey.png', 'charizard.png',
+  'charjabug.png', 'charmander.png', 'charmeleon.png', 'chatot.png', 'cherrim.png',
+  'cherubi.png', 'chewtle.png', 'chimchar.png', 'cinccino.png', 'claydol.png',
   'clefable.png', 'clefairy.png', 'clobbopus.png', 'clodsire.png', 'cloyster.png',
-  'combee.png', 'cottonee.png', 'cramorant.png', 'cranidos.png', 'cresselia.png',
-  'croagunk.png', 'crobat.png', 'cubone.png', 'cyclizar.png', 'darkrai.png',
-  'dedenne.png', 'dewgong.png', 'dhelmise.png', 'dialga.png', 'diglett.png',
-  'ditto.png', 'dodrio.png', 'doduo.png', 'dondozo.png', 'donphan.png',
-  'dragonair.png', 'dragonite.png', 'drapion.png', 'dratini.png', 'drednaw.png',
-  'drifblim.png', 'drifloon.png', 'drowzee.png', 'druddigon.png', 'dubwool.png',
-  'ducklett.png', 'dugtrio.png', 'dusclops.png', 'dusknoir.png', 'duskull.png',
-  'eelektrik.png', 'eelektross.png', 'eevee.png', 'ekans.png', 'electabuzz.png',
-  'electivire.png', 'electrike.png', 'electrode.png', 'elgyem.png', 'empoleon.png',
-  'exeggcute.png', 'exeggutor.png', 'fearow.png', 'finneon.png', 'flamigo.png',
-  'flareon.png', 'floatzel.png', 'floette.png', 'floragato.png', 'florges.png',
-  'froakie.png', 'frogadier.png', 'froslass.png', 'frosmoth.png', 'gabite.png',
-  'gallade.png', 'galvantula.png', 'garchomp.png', 'gardevoir.png', 'gastly.png',
-  'gastrodon.png', 'gengar.png', 'geodude.png', 'gholdengo.png', 'gible.png',
-  'gimmighoul.png', 'giratina.png', 'glaceon.png', 'glameow.png', 'gligar.png',
-  'gliscor.png', 'gloom.png', 'golem.png', 'golurk.png', 'gorebyss.png',
-  'gothita.png', 'gothorita.png', 'gourgeist.png', 'grafaiai.png', 'graveler.png',
-  'greninja.png', 'grimer.png', 'grookey.png', 'grotle.png', 'groudon.png',
-  'growlithe.png', 'gyarados.png', 'happiny.png', 'hariyama.png', 'haunter.png',
-  'hawlucha.png', 'heatran.png', 'heracross.png', 'hippopotas.png', 'hippowdon.png',
-  'hitmonchan.png', 'hitmonlee.png', 'hoopa.png', 'hoothoot.png', 'hoppip.png',
-  'horsea.png', 'houndoom.png', 'houndour.png', 'huntail.png', 'hypno.png',
-  'infernape.png', 'ivysaur.png', 'jigglypuff.png', 'jolteon.png', 'jumpluff.png',
-  'jynx.png', 'kabuto.png', 'kabutops.png', 'kadabra.png', 'kakuna.png',
-  'kangaskhan.png', 'kecleon.png', 'kingdra.png', 'kingler.png', 'kirlia.png',
-  'kleavor.png', 'koffing.png', 'krabby.png', 'lapras.png', 'leafeon.png',
-  'lickilicky.png', 'lickitung.png', 'litleo.png', 'lopunny.png', 'lotad.png',
-  'lucario.png', 'lumineon.png', 'lunatone.png', 'luxio.png', 'luxray.png',
-  'machamp.png', 'machoke.png', 'machop.png', 'magby.png', 'magikarp.png',
-  'magmar.png', 'magmortar.png', 'makuhita.png', 'manaphy.png', 'mankey.png',
-  'mantine.png', 'mantyke.png', 'marill.png', 'meganium.png', 'melmetal.png',
-  'meowth.png', 'mesprit.png', 'mewtwo.png', 'mightyena.png', 'miltank.png',
-  'mime-jr.png', 'minun.png', 'misdreavus.png', 'mismagius.png', 'moltres.png',
-  'monferno.png', 'mothim.png', 'mr-mime.png', 'muk.png', 'munchlax.png',
-  'murkrow.png', 'nidoking.png', 'nidoqueen.png', 'nidoran-f.png', 'nidoran-m.png',
-  'nidorina.png', 'nidorino.png', 'ninetales.png', 'noctowl.png', 'nosepass.png',
-  'numel.png', 'nuzleaf.png', 'oddish.png', 'omanyte.png', 'omastar.png',
-  'onix.png', 'oshawott.png', 'pachirisu.png', 'palkia.png', 'pansage.png',
-  'pansear.png', 'paras.png', 'parasect.png', 'pelipper.png', 'persian.png',
-  'petilil.png', 'phanpy.png', 'pichu.png', 'pidgeot.png', 'pidgeotto.png',
-  'pidgey.png', 'pikachu.png', 'piloswine.png', 'piplup.png', 'plusle.png',
-  'politoed.png', 'poliwag.png', 'poliwhirl.png', 'poliwrath.png', 'ponyta.png',
-  'porygon-z.png', 'porygon.png', 'porygon2.png', 'primeape.png', 'prinplup.png',
-  'probopass.png', 'psyduck.png', 'pumpkaboo.png', 'pupitar.png', 'purugly.png',
-  'quagsire.png', 'quilava.png', 'qwilfish.png', 'raichu.png', 'ralts.png',
-  'rapidash.png', 'raticate.png', 'rattata.png', 'relicanth.png', 'remoraid.png',
-  'rhyhorn.png', 'riolu.png', 'roserade.png', 'rotom.png', 'sableye.png',
-  'salamence.png', 'sandshrew.png', 'sandslash.png', 'scyther.png', 'seadra.png',
-  'seaking.png', 'seel.png', 'servine.png', 'seviper.png', 'shaymin.png',
-  'shedinja.png', 'shelgon.png', 'shellder.png', 'shinx.png', 'shroomish.png',
-  'shuppet.png', 'skitty.png', 'skorupi.png', 'skuntank.png', 'slowbro.png',
-  'slowking.png', 'slowpoke.png', 'slugma.png', 'smeargle.png', 'snorlax.png',
-  'snover.png', 'snubbull.png', 'spearow.png', 'spiritomb.png', 'sprigatito.png',
-  'squirtle.png', 'stantler.png', 'staraptor.png', 'staravia.png', 'starly.png',
-  'starmie.png', 'staryu.png', 'steelix.png', 'stunky.png', 'sudowoodo.png',
-  'suicune.png', 'sunflora.png', 'sunkern.png', 'surskit.png', 'swablu.png',
-  'swinub.png', 'sylveon.png', 'tangela.png', 'tangrowth.png', 'tauros.png',
-  'tentacool.png', 'tentacruel.png', 'thundurus.png', 'togepi.png', 'togetic.png',
-  'torterra.png', 'totodile.png', 'toxicroak.png', 'trapinch.png', 'tropius.png',
-  'turtwig.png', 'typhlosion.png', 'tyranitar.png', 'umbreon.png', 'ursaring.png',
-  'uxie.png', 'vaporeon.png', 'venomoth.png', 'venonat.png', 'venusaur.png',
-  'vespiquen.png', 'vibrava.png', 'victini.png', 'victreebel.png', 'vileplume.png',
-  'virizion.png', 'voltorb.png', 'vulpix.png', 'wailmer.png', 'wailord.png',
-  'walrein.png', 'wartortle.png', 'weavile.png', 'weedle.png', 'weepinbell.png',
-  'weezing.png', 'whimsicott.png', 'whirlipede.png', 'whiscash.png', 'wigglytuff.png',
-  'wiglett.png', 'woobat.png', 'wooloo.png', 'wooper.png', 'wormadam.png',
-  'wugtrio.png', 'yanma.png', 'yanmega.png', 'zapdos.png', 'zebstrika.png',
-  'zubat.png'
+  'combee.png', 'comfey.png', 'conkeldurr.png', 'cosmoem.png', 'cosmog.png',
+  'cottonee.png', 'crabominable.png', 'crabrawler.png', 'cramorant.png', 'cranidos.png',
+  'cresselia.png', 'croagunk.png', 'crobat.png', 'cubone.png', 'cutiefly.png',
+  'cyclizar.png', 'darkrai.png', 'dartrix.png', 'decidueye.png', 'dedenne.png',
+  'delcatty.png', 'dewgong.png', 'dewpider.png', 'dhelmise.png', 'dialga.png',
+  'diglett.png', 'ditto.png', 'dodrio.png', 'doduo.png', 'dondozo.png',
+  'donphan.png', 'dragonair.png', 'dragonite.png', 'drampa.png', 'drapion.png',
+  'dratini.png', 'drednaw.png', 'drifblim.png', 'drifloon.png', 'drilbur.png',
+  'drowzee.png', 'druddigon.png', 'dubwool.png', 'ducklett.png', 'dugtrio.png',
+  'dusclops.png', 'dusknoir.png', 'duskull.png', 'eelektrik.png', 'eelektross.png',
+  'eevee.png', 'ekans.png', 'electabuzz.png', 'electivire.png', 'electrike.png',
+  'electrode.png', 'elgyem.png', 'emolga.png', 'empoleon.png', 'escavalier.png',
+  'excadrill.png', 'exeggcute.png', 'exeggutor.png', 'fearow.png', 'ferroseed.png',
+  'ferrothorn.png', 'finneon.png', 'flamigo.png', 'flareon.png', 'fletchinder.png',
+  'fletchling.png', 'floatzel.png', 'floette.png', 'floragato.png', 'florges.png',
+  'fomantis.png', 'froakie.png', 'frogadier.png', 'froslass.png', 'frosmoth.png',
+  'gabite.png', 'gallade.png', 'galvantula.png', 'garbodor.png', 'garchomp.png',
+  'gardevoir.png', 'gastly.png', 'gastrodon.png', 'gengar.png', 'geodude.png',
+  'gholdengo.png', 'gible.png', 'gimmighoul.png', 'giratina.png', 'glaceon.png',
+  'glameow.png', 'gligar.png', 'gliscor.png', 'gloom.png', 'gogoat.png',
+  'golbat.png', 'goldeen.png', 'golduck.png', 'golem.png', 'golett.png',
+  'golisopod.png', 'golurk.png', 'grafaiai.png', 'grapploct.png', 'graveler.png',
+  'greninja.png', 'grimer.png', 'grotle.png', 'growlithe.png', 'grubbin.png',
+  'grumpig.png', 'gumshoos.png', 'gurdurr.png', 'guzzlord.png', 'gyarados.png',
+  'hakamo-o.png', 'hariyama.png', 'haunter.png', 'hawlucha.png', 'heatmor.png',
+  'heatran.png', 'heliolisk.png', 'helioptile.png', 'heracross.png', 'herdier.png',
+  'hippopotas.png', 'hippowdon.png', 'hitmonchan.png', 'hitmonlee.png', 'hitmontop.png',
+  'honchkrow.png', 'hoothoot.png', 'horsea.png', 'houndoom.png', 'houndour.png',
+  'hypno.png', 'incineroar.png', 'infernape.png', 'ivysaur.png', 'jangmo-o.png',
+  'jigglypuff.png', 'jolteon.png', 'joltik.png', 'jynx.png', 'kabuto.png',
+  'kabutops.png', 'kadabra.png', 'kakuna.png', 'kangaskhan.png', 'karrablast.png',
+  'kartana.png', 'kingler.png', 'kirlia.png', 'klefki.png', 'koffing.png',
+  'komala.png', 'kommo-o.png', 'krabby.png', 'kricketot.png', 'kricketune.png',
+  'krokorok.png', 'krookodile.png', 'lairon.png', 'lapras.png', 'larvesta.png',
+  'larvitar.png', 'leafeon.png', 'lickilicky.png', 'lickitung.png', 'liepard.png',
+  'lilligant.png', 'lillipup.png', 'litten.png', 'lopunny.png', 'lucario.png',
+  'lumineon.png', 'lunala.png', 'lunatone.png', 'lurantis.png', 'luxio.png',
+  'luxray.png', 'lycanroc.png', 'machamp.png', 'machoke.png', 'machop.png',
+  'magcargo.png', 'magearna.png', 'magikarp.png', 'magmar.png', 'magmortar.png',
+  'magnemite.png', 'magneton.png', 'magnezone.png', 'makuhita.png', 'mamoswine.png',
+  'manaphy.png', 'manectric.png', 'mankey.png', 'mantine.png', 'maractus.png',
+  'mareanie.png', 'marill.png', 'marowak.png', 'marshadow.png', 'masquerain.png',
+  'mawile.png', 'medicham.png', 'meditite.png', 'melmetal.png', 'meltan.png',
+  'meowscarada.png', 'meowth.png', 'mesprit.png', 'metapod.png', 'mew.png',
+  'mewtwo.png', 'mienfoo.png', 'mienshao.png', 'mightyena.png', 'mimikyu.png',
+  'minccino.png', 'minior.png', 'misdreavus.png', 'mismagius.png', 'moltres.png',
+  'monferno.png', 'morelull.png', 'mothim.png', 'mr-mime.png', 'mudbray.png',
+  'mudsdale.png', 'muk.png', 'murkrow.png', 'naganadel.png', 'necrozma.png',
+  'nidoking.png', 'nidoqueen.png', 'nidorina.png', 'nidorino.png', 'nihilego.png',
+  'ninetales.png', 'noctowl.png', 'nosepass.png', 'oddish.png', 'omanyte.png',
+  'omastar.png', 'onix.png', 'oranguru.png', 'oricorio-pom-pom.png', 'oricorio.png',
+  'pachirisu.png', 'palkia.png', 'palossand.png', 'paras.png', 'parasect.png',
+  'passimian.png', 'pawmi.png', 'pawmo.png', 'pawmot.png', 'pawniard.png',
+  'persian.png', 'petilil.png', 'phanpy.png', 'phantump.png', 'pheromosa.png',
+  'phione.png', 'pidgeot.png', 'pidgeotto.png', 'pidgey.png', 'pikachu.png',
+  'pikipek.png', 'piloswine.png', 'pincurchin.png', 'pinsir.png', 'piplup.png',
+  'poipole.png', 'poliwag.png', 'poliwhirl.png', 'poliwrath.png', 'ponyta.png',
+  'poochyena.png', 'popplio.png', 'porygon-z.png', 'porygon.png', 'porygon2.png',
+  'primarina.png', 'primeape.png', 'prinplup.png', 'probopass.png', 'psyduck.png',
+  'pupitar.png', 'purrloin.png', 'purugly.png', 'pyukumuku.png', 'raichu.png',
+  'ralts.png', 'rampardos.png', 'rapidash.png', 'raticate.png', 'rattata.png',
+  'regice.png', 'regigigas.png', 'regirock.png', 'registeel.png', 'revavroom.png',
+  'rhydon.png', 'rhyhorn.png', 'rhyperior.png', 'ribombee.png', 'riolu.png',
+  'rockruff.png', 'roselia.png', 'roserade.png', 'rotom.png', 'rowlet.png',
+  'sableye.png', 'salandit.png', 'salazzle.png', 'sandile.png', 'sandshrew.png',
+  'sandslash.png', 'sandygast.png', 'scolipede.png', 'scyther.png', 'seadra.png',
+  'seaking.png', 'seel.png', 'serperior.png', 'servine.png', 'sharpedo.png',
+  'shaymin.png', 'shellder.png', 'shellos.png', 'shieldon.png', 'shiinotic.png',
+  'shinx.png', 'shroodle.png', 'shuppet.png', 'sigilyph.png', 'silvally.png',
+  'sizzlipede.png', 'skarmory.png', 'skiddo.png', 'skitty.png', 'skorupi.png',
+  'skuntank.png', 'slowbro.png', 'slowpoke.png', 'slugma.png', 'slurpuff.png',
+  'sneasel.png', 'snivy.png', 'snom.png', 'snorlax.png', 'snorunt.png',
+  'snover.png', 'solgaleo.png', 'solrock.png', 'spearow.png', 'spiritomb.png',
+  'spoink.png', 'sprigatito.png', 'squirtle.png', 'stakataka.png', 'staraptor.png',
+  'staravia.png', 'starly.png', 'starmie.png', 'staryu.png', 'steenee.png',
+  'stonjourner.png', 'stoutland.png', 'stufful.png', 'stunky.png', 'sudowoodo.png',
+  'surskit.png', 'swanna.png', 'swinub.png', 'swirlix.png', 'swoobat.png',
+  'talonflame.png', 'tangela.png', 'tangrowth.png', 'tapu-lele.png', 'tatsugiri.png',
+  'tauros.png', 'tentacool.png', 'tentacruel.png', 'timburr.png', 'tinkatink.png',
+  'tinkaton.png', 'tinkatuff.png', 'togedemaru.png', 'togekiss.png', 'togepi.png',
+  'togetic.png', 'torracat.png', 'torterra.png', 'toucannon.png', 'toxapex.png',
+  'toxicroak.png', 'trevenant.png', 'trubbish.png', 'trumbeak.png', 'tsareena.png',
+  'turtonator.png', 'turtwig.png', 'tynamo.png', 'tyranitar.png', 'unown.png',
+  'uxie.png', 'vaporeon.png', 'varoom.png', 'venipede.png', 'venomoth.png',
+  'venonat.png', 'venusaur.png', 'vespiquen.png', 'victreebel.png', 'vikavolt.png',
+  'vileplume.png', 'volcarona.png', 'voltorb.png', 'vulpix.png', 'wartortle.png',
+  'weavile.png', 'weedle.png', 'weepinbell.png', 'weezing.png', 'whimsicott.png',
+  'whirlipede.png', 'whiscash.png', 'wigglytuff.png', 'wiglett.png', 'wimpod.png',
+  'wishiwashi.png', 'woobat.png', 'wooloo.png', 'wooper.png', 'wormadam.png',
+  'wugtrio.png', 'xurkitree.png', 'yanma.png', 'yanmega.png', 'yungoos.png',
+  'zapdos.png', 'zebstrika.png', 'zeraora.png', 'zubat.png'
 ];
 
 export default iconsList;
\ No newline at end of file
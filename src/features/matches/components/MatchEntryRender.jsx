@@ -1,5 +1,31 @@
 import React, { useState, useRef, useEffect } from 'react';
-import { AVAILABLE_CARDS, CARDS_BY_ELEMENT, getCardInfo } from '../../../shared/utils/cardDataProcessor';
+import { AVAILABLE_CARDS, CARDS_BY_ELEMENT, getCardInfo, getIconSprite } from '../../../shared/utils/cardDataProcessor';
+
+// Card icon drawn from the sprite atlas when available, otherwise from its own PNG
+const CardIcon = ({ iconPath, alt, size = 24, className = '' }) => {
+  const basePath = import.meta.env.BASE_URL || '/';
+  const sprite = getIconSprite(iconPath);
+  if (!sprite) {
+    return <img src={`${basePath}icons/${iconPath.split('/').pop()}`} alt={alt} className={className} />;
+  }
+
+  // Scale the icon to fit the box, like the stretched <img> but keeping its aspect ratio
+  const scale = size / Math.max(sprite.width, sprite.height);
+  return (
+    <span role="img" aria-label={alt} className={`inline-flex items-center justify-center ${className}`}>
+      <span
+        style={{
+          width: sprite.width * scale,
+          height: sprite.height * scale,
+          backgroundImage: `url(${basePath}${sprite.sheet.replace(/^\.\//, '')})`,
+          backgroundSize: `${sprite.sheetSize[0] * scale}px ${sprite.sheetSize[1] * scale}px`,
+          backgroundPosition: `-${sprite.x * scale}px -${sprite.y * scale}px`,
+          backgroundRepeat: 'no-repeat',
+        }}
+      />
+    </span>
+  );
+};
 
 // Updated SearchableDropdown component
 const SearchableDropdown = ({ 
@@ -172,9 +198,10 @@ const SearchableDropdown = ({
                       }}
                     >
                       {option.iconPath && (
-                        <img 
-                          src={`${import.meta.env.BASE_URL || '/'}icons/${option.iconPath.split('/').pop()}`}
-                          alt={option.displayName} 
+                        <CardIcon
+                          iconPath={option.iconPath}
+                          alt={option.displayName}
+                          size={20}
                           className="w-5 h-5 mr-2"
                         />
                       )}
@@ -236,7 +263,6 @@ const MatchEntry = ({
   matchHistory = [],
   previousEntryPoints
 }) => {  const isLocked = entry.isLocked && !isEditing;
-  const basePath = import.meta.env.BASE_URL || '/';
   // State for delete confirmation
   const [showInlineConfirm, setShowInlineConfirm] = useState(false);
 
@@ -378,25 +404,25 @@ const MatchEntry = ({
           <div className="flex items-center mb-1 h-6">
             <label className="text-xs font-medium text-gray-700">Your Deck</label>            <div className="flex ml-2">
               {entry.yourDeck.primary && getCardInfo(entry.yourDeck.primary)?.iconPath && (
-                <img 
-                  src={`${basePath}icons/${getCardInfo(entry.yourDeck.primary).iconPath.split('/').pop()}`}
-                  alt="Primary Pokemon" 
+                <CardIcon
+                  iconPath={getCardInfo(entry.yourDeck.primary).iconPath}
+                  alt="Primary Pokemon"
                   className="w-6 h-6"
                 />
               )}
               {entry.yourDeck.secondary && getCardInfo(entry.yourDeck.secondary)?.iconPath && (
-                <img 
-                  src={`${basePath}icons/${getCardInfo(entry.yourDeck.secondary).iconPath.split('/').pop()}`}
-                  alt="Secondary Pokemon" 
+                <CardIcon
+                  iconPath={getCardInfo(entry.yourDeck.secondary).iconPath}
+                  alt="Secondary Pokemon"
                   className="w-6 h-6 ml-1"
                 />
               )}
               {entry.yourDeck.variant && getCardInfo(entry.yourDeck.variant)?.iconPath && (
                 <>
                   {entry.yourDeck.secondary && <div className="h-6 mx-1 border-l border-gray-300"></div>}
-                  <img 
-                    src={`${basePath}icons/${getCardInfo(entry.yourDeck.variant).iconPath.split('/').pop()}`}
-                    alt="Variant Pokemon" 
+                  <CardIcon
+                    iconPath={getCardInfo(entry.yourDeck.variant).iconPath}
+                    alt="Variant Pokemon"
                     className="w-6 h-6"
                   />
                 </>
@@ -507,25 +533,25 @@ const MatchEntry = ({
         <div className="md:col-span-9">          <div className="flex items-center mb-1 h-6">
             <label className="text-xs font-medium text-gray-700">Opponent's Deck</label>            <div className="flex ml-2">
               {entry.opponentDeck.primary && getCardInfo(entry.opponentDeck.primary)?.iconPath && (
-                <img 
-                  src={`${basePath}icons/${getCardInfo(entry.opponentDeck.primary).iconPath.split('/').pop()}`}
-                  alt="Primary Pokemon" 
+                <CardIcon
+                  iconPath={getCardInfo(entry.opponentDeck.primary).iconPath}
+                  alt="Primary Pokemon"
                   className="w-6 h-6"
                 />
               )}
               {entry.opponentDeck.secondary && getCardInfo(entry.opponentDeck.secondary)?.iconPath && (
-                <img 
-                  src={`${basePath}icons/${getCardInfo(entry.opponentDeck.secondary).iconPath.split('/').pop()}`}
-                  alt="Secondary Pokemon" 
+                <CardIcon
+                  iconPath={getCardInfo(entry.opponentDeck.secondary).iconPath}
+                  alt="Secondary Pokemon"
                   className="w-6 h-6 ml-1"
                 />
               )}
               {entry.opponentDeck.variant && getCardInfo(entry.opponentDeck.variant)?.iconPath && (
                 <>
                   {entry.opponentDeck.secondary && <div className="h-6 mx-1 border-l border-gray-300"></div>}
-                  <img 
-                    src={`${basePath}icons/${getCardInfo(entry.opponentDeck.variant).iconPath.split('/').pop()}`}
-                    alt="Variant Pokemon" 
+                  <CardIcon
+                    iconPath={getCardInfo(entry.opponentDeck.variant).iconPath}
+                    alt="Variant Pokemon"
                     className="w-6 h-6"
                   />
                 </>
@@ -1,8 +1,26 @@
 import React, { useState, useEffect } from 'react';
-import tournamentMetaData from '../../data/deckTournamentMeta.json';
+import metaAnalytics from '../../data/metaAnalytics.json';
 import dayjs from 'dayjs';
 import TournamentMetaAnalysis from './TournamentMetaAnalysis';
 
+// Decks listed on a date, in listing order, read from the precomputed analytics artifact
+const decksForDate = (date) => {
+  const index = metaAnalytics.dates.indexOf(date);
+  return (metaAnalytics.rankings[date] || []).map(name => {
+    const deck = metaAnalytics.decks[name];
+    return {
+      name,
+      count: deck.count[index],
+      share: deck.share[index],
+      winRate: deck.winRate[index],
+      rank: deck.rank[index],
+      record: deck.record[index],
+      url: deck.url,
+      matchups: deck.matchups[date] || []
+    };
+  });
+};
+
 const MetaDataTab = () => {
   // State for selected date
   const [selectedDate, setSelectedDate] = useState('');
@@ -10,11 +28,9 @@ const MetaDataTab = () => {
   const [currentTournamentData, setCurrentTournamentData] = useState([]);
   const [selectedDeck, setSelectedDeck] = useState(null);
 
-  // When component mounts, extract available dates from the meta data
+  // When component mounts, list the available dates, newest first
   useEffect(() => {
-    const dates = Object.keys(tournamentMetaData).sort((a, b) => 
-      dayjs(b).diff(dayjs(a))
-    );
+    const dates = [...metaAnalytics.dates].reverse();
     setAvailableDates(dates);
     
     if (dates.length > 0) {
@@ -24,8 +40,8 @@ const MetaDataTab = () => {
 
   // When date changes, update the tournament data
   useEffect(() => {
-    if (selectedDate && tournamentMetaData[selectedDate]) {
-      setCurrentTournamentData(tournamentMetaData[selectedDate]);
+    if (selectedDate && metaAnalytics.rankings[selectedDate]) {
+      setCurrentTournamentData(decksForDate(selectedDate));
       setSelectedDeck(null);
     }
   }, [selectedDate]);
@@ -70,7 +86,6 @@ const MetaDataTab = () => {
       {/* Tournament Meta Analysis Component */}
       <TournamentMetaAnalysis 
         tournamentData={currentTournamentData}
-        selectedDate={selectedDate}
         onDeckSelect={handleDeckSelect}
         selectedDeck={selectedDeck}
       />
@@ -4,12 +4,17 @@ import { COLORS, OTHER_COLOR } from '../stats/components/charts/PieCharts';
 
 const TournamentMetaAnalysis = ({ 
   tournamentData, 
-  selectedDate,
   onDeckSelect,
   selectedDeck
 }) => {
   const [matchups, setMatchups] = useState([]);
 
+  // Top 20 decks of the selected date
+  const topDecks = (tournamentData || []).slice(0, 20).map(deck => ({
+    ...deck,
+    deckId: deck.name.replace(/\s+/g, '-').toLowerCase()
+  }));
+
   // Calculate dynamic height based on number of decks
   const calculateChartHeight = (items) => {
     // Allow ~30px per item, with a minimum height
@@ -20,62 +25,26 @@ const TournamentMetaAnalysis = ({
   const handleDeckSelect = (deck) => {
     onDeckSelect(deck);
     
-    if (selectedDate && tournamentData) {
-      const deckData = tournamentData.find(d => d["Deck Name"] === deck.name);
+    const deckData = tournamentData?.find(d => d.name === deck.name);
+    if (deckData) {
+      // Matchup rows are precomputed with games played, most played first
+      const matchupData = deckData.matchups.map(([opponent, winRate, matches, record]) => ({
+        opponent: opponent.toLowerCase() === "other" ? "OTHER" : opponent,
+        winRate,
+        record: record || null,
+        matches,
+        isMirrorMatch: opponent === deck.name // Add flag for mirror matches
+      }));
       
-      if (deckData && deckData.Matchups) {
-        // Transform matchup data into a format suitable for charts
-        const matchupData = Object.entries(deckData.Matchups)
-          .filter(([opponent, data]) => {
-            // Filter out matchups with 0 games
-            return data.Matches && parseInt(data.Matches) > 0;
-          })
-          .map(([opponent, data]) => ({
-            opponent: opponent.toLowerCase() === "other" ? "OTHER" : opponent,
-            winRate: parseFloat(data["Win Rate"]),
-            record: data.Score || null,
-            matches: parseInt(data.Matches) || 0,
-            isMirrorMatch: opponent === deck.name // Add flag for mirror matches
-          }))
-          .sort((a, b) => b.matches - a.matches); // Sort by number of games in descending order
-        
-        setMatchups(matchupData);
-      }
+      setMatchups(matchupData);
     }
   };
 
-  // Helper function to calculate overall record
+  // Helper function to format the overall record
   const getOverallRecord = (deckData) => {
-    if (!deckData || !deckData.Matchups) return 'N/A';
-    
-    let totalWins = 0;
-    let totalLosses = 0;
-    let totalTies = 0;
-    
-    // Sum up all matchup records
-    Object.values(deckData.Matchups).forEach(matchup => {
-      if (matchup.Score) {
-        // Parse the score format which is usually "W - L - T" or "W-L"
-        const scoreParts = matchup.Score.split('-').map(s => s.trim());
-        
-        if (scoreParts.length >= 2) {
-          // Extract numbers from the score parts (handling formats like "1820 - 1820 - 84")
-          const wins = parseInt(scoreParts[0].match(/\d+/)?.[0] || 0);
-          const losses = parseInt(scoreParts[1].match(/\d+/)?.[0] || 0);
-          
-          totalWins += wins;
-          totalLosses += losses;
-          
-          // If there's a tie component
-          if (scoreParts.length > 2) {
-            const ties = parseInt(scoreParts[2].match(/\d+/)?.[0] || 0);
-            totalTies += ties;
-          }
-        }
-      }
-    });
+    if (!deckData || !deckData.record) return 'N/A';
     
-    // Format the overall record
+    const [totalWins, totalLosses, totalTies] = deckData.record;
     return totalTies > 0 
       ? `${totalWins} - ${totalLosses} - ${totalTies}`
       : `${totalWins} - ${totalLosses}`;
@@ -85,8 +54,8 @@ const TournamentMetaAnalysis = ({
   const DeckShareTooltip = ({ active, payload }) => {
     if (active && payload && payload.length) {
       const data = payload[0].payload;
-      // Find the full deck data from tournament meta
-      const deckData = tournamentData?.find(d => d["Deck Name"] === data.name);
+      // Find the full deck data for the selected date
+      const deckData = tournamentData?.find(d => d.name === data.name);
       
       return (
         <div className="bg-white p-3 border border-gray-200 rounded-lg shadow-lg">
@@ -141,26 +110,10 @@ const TournamentMetaAnalysis = ({
           <p className="text-sm text-white mt-1">Click on a deck to see its matchups</p>
         </div>
 
-        <div className="p-4" style={{ height: calculateChartHeight(tournamentData?.slice(0, 20).map(deck => ({
-          name: deck["Deck Name"],
-          count: parseInt(deck.Count),
-          share: parseFloat(deck.Share),
-          winRate: parseFloat(deck["Win %"]),
-          rank: parseInt(deck.Rank),
-          url: deck.URL,
-          deckId: deck["Deck Name"].replace(/\s+/g, '-').toLowerCase()
-        })) || []) }}>
+        <div className="p-4" style={{ height: calculateChartHeight(topDecks) }}>
           <ResponsiveContainer width="100%" height="100%">
             <BarChart
-              data={tournamentData?.slice(0, 20).map(deck => ({
-                name: deck["Deck Name"],
-                count: parseInt(deck.Count),
-                share: parseFloat(deck.Share),
-                winRate: parseFloat(deck["Win %"]),
-                rank: parseInt(deck.Rank),
-                url: deck.URL,
-                deckId: deck["Deck Name"].replace(/\s+/g, '-').toLowerCase()
-              }))}
+              data={topDecks}
               layout="vertical"
               margin={{ top: 5, right: 30, left: 150, bottom: 5 }}
               onClick={(data) => {
@@ -177,12 +130,8 @@ const TournamentMetaAnalysis = ({
                 width={140}
                 tick={{ fontSize: 12 }}
                 tickFormatter={(value, index) => {
-                  const decks = tournamentData?.slice(0, 20).map(deck => ({
-                    name: deck["Deck Name"],
-                    share: parseFloat(deck.Share)
-                  })) || [];
-                  if (index < decks.length) {
-                    const deck = decks[index];
+                  if (index < topDecks.length) {
+                    const deck = topDecks[index];
                     const displayName = value.length > 15 ? `${value.substring(0, 12)}...` : value;
                     return `${displayName} (${deck.share}%)`;
                   }
@@ -192,10 +141,7 @@ const TournamentMetaAnalysis = ({
               />
               <Tooltip content={<DeckShareTooltip />} />
               <Bar dataKey="share" name="Play Rate" radius={[0, 4, 4, 0]}>
-                {(tournamentData?.slice(0, 20).map(deck => ({
-                  name: deck["Deck Name"],
-                  share: parseFloat(deck.Share)
-                })) || []).map((entry, index) => (
+                {topDecks.map((entry, index) => (
                   <Cell
                     key={`cell-${index}`}
                     cursor="pointer"
@@ -54,4 +54,14 @@ const cardLookup = AVAILABLE_CARDS.reduce((acc, card) => {
 }, {});
 
 // Function to get card info by key
-export const getCardInfo = (key) => cardLookup[key] || null;
\ No newline at end of file
+export const getCardInfo = (key) => cardLookup[key] || null;
+// Sprite atlas written by the card scraper: iconPath -> [sheet, x, y, width, height]
+const iconAtlas = cardData.iconAtlas || null;
+
+// Function to get an icon's position in the sprite atlas, or null to use the individual PNG
+export const getIconSprite = (iconPath) => {
+  const entry = iconAtlas && iconPath ? iconAtlas.icons[iconPath] : null;
+  if (!entry) return null;
+  const [sheet, x, y, width, height] = entry;
+  return { sheet: iconAtlas.sheets[sheet], sheetSize: iconAtlas.sheetSize, x, y, width, height };
+};
@@ -0,0 +1,74 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# The scraper modules import each other as top-level modules, as when run from scraper/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scraper'))
+
+
+class FixtureSite:
+    """Serves in-memory pages on localhost, answering If-None-Match with 304."""
+
+    def __init__(self):
+        self.pages = {}  # path -> (body bytes, headers dict)
+        self.requests = []  # (path, request headers)
+        handler = self._handler()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def add(self, path, body, content_type='text/html; charset=utf-8', etag=None):
+        headers = {'Content-Type': content_type}
+        if etag:
+            headers['ETag'] = etag
+        self.pages[path] = (body.encode('utf-8') if isinstance(body, str) else body, headers)
+        return self.base_url + path
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                site.requests.append((self.path, dict(self.headers)))
+                if self.path not in site.pages:
+                    self.send_error(404)
+                    return
+                body, headers = site.pages[self.path]
+                if headers.get('ETag') and self.headers.get('If-None-Match') == headers['ETag']:
+                    self.send_response(304)
+                    self.send_header('ETag', headers['ETag'])
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def site():
+    site = FixtureSite()
+    site.thread.start()
+    yield site
+    site.server.shutdown()
+    site.server.server_close()
+
+
+@pytest.fixture
+def http_fetch(tmp_path):
+    """httpFetch configured for a test: no retries and, by default, no cache."""
+    import httpFetch
+
+    httpFetch.configure(cache_dir="", host_rates={}, retries=0, retry_delay=0.01)
+    yield httpFetch
+    httpFetch.configure(cache_dir="")
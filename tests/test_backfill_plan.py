@@ -0,0 +1,52 @@
+import json
+import logging
+
+import pytest
+
+import scrapeDeckData
+from scrapeDeckData import backfill_plan
+
+RELEASES = {'A1': '2024-10-30', 'A1a': '2024-12-17', 'A2': '2025-01-29', 'A2a': '2025-02-28'}
+
+
+@pytest.fixture(autouse=True)
+def releases(monkeypatch, tmp_path):
+    monkeypatch.setitem(scrapeDeckData.CONFIG, 'SET_RELEASES', dict(RELEASES))
+    monkeypatch.setitem(scrapeDeckData.CONFIG, 'SET_MANIFEST_FILE', str(tmp_path / 'set_manifest.json'))
+    return tmp_path
+
+
+def test_periods_are_keyed_by_their_last_day_in_range():
+    assert backfill_plan('2024-11-01', '2025-02-10') == [
+        ('2024-12-16', 'A1'), ('2025-01-28', 'A1a'), ('2025-02-10', 'A2'),
+    ]
+
+
+def test_range_inside_one_period():
+    assert backfill_plan('2025-01-01', '2025-01-05') == [('2025-01-05', 'A1a')]
+
+
+def test_set_filter():
+    assert backfill_plan('2024-10-30', '2025-02-27', set_codes={'A1a', 'A2'}) == [
+        ('2025-01-28', 'A1a'), ('2025-02-27', 'A2'),
+    ]
+
+
+def test_range_before_the_first_release_is_empty():
+    assert backfill_plan('2024-01-01', '2024-10-29') == []
+
+
+def test_last_period_is_bounded_by_the_longest_known_period():
+    # Longest gap is A1 -> A1a (48 days), so A2a covers 2025-02-28 .. 2025-04-17
+    assert backfill_plan('2025-04-01', '2025-04-17') == [('2025-04-17', 'A2a')]
+    with pytest.raises(ValueError, match='SET_RELEASES'):
+        backfill_plan('2025-04-01', '2025-04-18')
+
+
+def test_undated_sets_from_the_card_manifest_are_warned_about(releases, caplog):
+    (releases / 'set_manifest.json').write_text(json.dumps({"sets": {"A2a": {}, "A2b": {}}}), encoding='utf-8')
+
+    with caplog.at_level(logging.WARNING, logger='DeckScraper'):
+        assert backfill_plan('2025-03-01', '2025-03-10') == [('2025-03-10', 'A2a')]
+
+    assert 'A2b' in caplog.text
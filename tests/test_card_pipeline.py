@@ -0,0 +1,104 @@
+import asyncio
+
+from cardPipeline import CardPipeline
+from requestScheduler import RetryQueue, TransientRequestError
+
+CARD_URL = 'https://cards.test/cards'
+ICON_URL = 'https://icons.test/'
+
+
+class FakeScraper:
+    """Serves two sets of cards; URLs listed in transient raise TransientRequestError."""
+
+    def __init__(self, sets, transient=()):
+        self.sets = sets
+        self.transient = set(transient)
+        self.retry_queue = RetryQueue()
+        self.batches = []
+
+    def _request(self, url):
+        if url in self.transient:
+            raise TransientRequestError(url, '503')
+
+    def scrape_set_info(self):
+        self._request(CARD_URL)
+        return [{'setCode': code, 'setName': f"Set {code}", 'url': f"{CARD_URL}/{code}"} for code in self.sets]
+
+    def scrape_all_sets(self):
+        pass
+
+    def scrape_card_links(self, set_link):
+        self._request(set_link['url'])
+        return [f"{set_link['url']}/{number}" for number in range(1, self.sets[set_link['setCode']] + 1)]
+
+    def scrape_set_cards(self, set_link):
+        pass
+
+    def parse_card_url(self, url):
+        set_code, number = url.rsplit('/', 2)[1:]
+        return set_code, number
+
+    def fetch_card_page(self, url):
+        self._request(url)
+        return url
+
+    def scrape_card_info(self, url, set_code, set_name):
+        pass
+
+    def build_card_info(self, url, page, set_code, number, set_name):
+        return {'id': f"{set_code}-{number}", 'cardName': f"Card {number}", 'set': set_name}
+
+    def download_card_icon(self, card_name):
+        return f"icons/{card_name}.png"
+
+    def save_card_infos(self, card_infos):
+        self.batches.append(list(card_infos))
+        return card_infos
+
+
+def run_pipeline(scraper, batch_size=50):
+    pipeline = CardPipeline(scraper, CARD_URL, ICON_URL, {'cards.test': 2, 'icons.test': 2}, batch_size=batch_size)
+    asyncio.run(pipeline.run())
+    return pipeline
+
+
+def test_every_card_flows_through_to_the_upsert_stage():
+    scraper = FakeScraper({'A1': 3, 'A2': 2})
+
+    pipeline = run_pipeline(scraper)
+
+    saved = [card for batch in scraper.batches for card in batch]
+    assert sorted(card['id'] for card in saved) == ['A1-1', 'A1-2', 'A1-3', 'A2-1', 'A2-2']
+    assert all(card['iconPath'] == f"icons/{card['cardName']}.png" for card in saved)
+    assert pipeline.completed == 5
+    assert pipeline.saved == 5
+    assert len(scraper.retry_queue) == 0
+
+
+def test_upserts_are_batched_up_to_batch_size():
+    scraper = FakeScraper({'A1': 7})
+
+    run_pipeline(scraper, batch_size=3)
+
+    assert sum(len(batch) for batch in scraper.batches) == 7
+    assert max(len(batch) for batch in scraper.batches) <= 3
+
+
+def test_transient_failures_are_deferred_instead_of_dropped():
+    scraper = FakeScraper({'A1': 2, 'A2': 2}, transient={f"{CARD_URL}/A2", f"{CARD_URL}/A1/2"})
+
+    pipeline = run_pipeline(scraper)
+
+    assert [card['id'] for batch in scraper.batches for card in batch] == ['A1-1']
+    assert pipeline.saved == 1
+    assert len(scraper.retry_queue) == 2
+
+
+def test_transient_set_discovery_is_deferred():
+    scraper = FakeScraper({'A1': 2}, transient={CARD_URL})
+
+    pipeline = run_pipeline(scraper)
+
+    assert scraper.batches == []
+    assert pipeline.completed == 0
+    assert len(scraper.retry_queue) == 1
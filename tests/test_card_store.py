@@ -0,0 +1,47 @@
+from cardStore import CardStore, card_sort_key
+
+
+def card(name, set_number='A1', evolves_from=None, **fields):
+    return dict(cardName=name, setNumber=set_number, evolvesFrom=evolves_from, **fields)
+
+
+def test_indexes_follow_upserts_and_replacements():
+    store = CardStore()
+    store.upsert_many([
+        ('A1-1', card('Bulbasaur')),
+        ('A1-2', card('Ivysaur', evolves_from='Bulbasaur')),
+        ('A2-1', card('Bulbasaur', set_number='A2')),
+    ])
+
+    assert store.ids_by('cardName', 'Bulbasaur') == {'A1-1', 'A2-1'}
+    assert store.ids_by('evolvesFrom', 'Bulbasaur') == {'A1-2'}
+    assert store.values_of('setNumber') == {'A1', 'A2'}
+
+    store.upsert('A2-1', card('Charmander', set_number='A1'))
+
+    assert store.ids_by('cardName', 'Bulbasaur') == {'A1-1'}
+    assert store.ids_by('cardName', 'Charmander') == {'A2-1'}
+    # Emptied buckets are dropped rather than left as stale values
+    assert store.values_of('setNumber') == {'A1'}
+
+
+def test_set_field_keeps_indexes_in_sync():
+    store = CardStore()
+    store.upsert('A1-2', card('Ivysaur', evolves_from='Bulbasaur'))
+
+    store.set_field('A1-2', 'evolvesFrom', 'Oddish')
+    store.set_field('A1-2', 'finalEvolution', False)
+
+    assert store.ids_by('evolvesFrom', 'Bulbasaur') == set()
+    assert store.ids_by('evolvesFrom', 'Oddish') == {'A1-2'}
+    assert store.get('A1-2')['finalEvolution'] is False
+
+
+def test_export_is_sorted_by_set_then_card_number():
+    store = CardStore()
+    for card_id in ('A1-10', 'A1a-1', 'A1-2', 'A1-1'):
+        store.upsert(card_id, card(card_id))
+
+    assert list(store.export()) == ['A1-1', 'A1-2', 'A1-10', 'A1a-1']
+    assert [card_id for card_id, _ in store.iter_export()] == list(store.export())
+    assert card_sort_key('P-A-x') == ('P-A', float('inf'))
@@ -0,0 +1,58 @@
+import json
+
+from checkpointJournal import FORMAT, CheckpointJournal
+
+
+def test_records_survive_an_interrupted_run(tmp_path):
+    path = tmp_path / 'checkpoints' / 'cards.jsonl'
+    journal = CheckpointJournal(str(path), flush_every=2)
+    journal.start(mode='cards')
+    journal.record('card', id='A1-1')
+    journal.record('card', id='A1-2')
+    # Buffered but not yet flushed when the run dies
+    journal.record('card', id='A1-3')
+
+    header, records = CheckpointJournal(str(path)).read()
+
+    assert header['mode'] == 'cards'
+    assert header['format'] == FORMAT
+    assert records == [{'type': 'card', 'id': 'A1-1'}, {'type': 'card', 'id': 'A1-2'}]
+
+
+def test_resume_appends_after_a_torn_line(tmp_path):
+    path = tmp_path / 'cards.jsonl'
+    journal = CheckpointJournal(str(path))
+    journal.start(mode='cards')
+    journal.record('card', id='A1-1')
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "card", "id": "A1')
+
+    resumed = CheckpointJournal(str(path))
+    resumed.reopen()
+    resumed.record('card', id='A1-2')
+    resumed.close()
+
+    header, records = resumed.read()
+    assert header['mode'] == 'cards'
+    assert [record['id'] for record in records] == ['A1-1', 'A1-2']
+
+
+def test_completed_run_removes_the_journal(tmp_path):
+    path = tmp_path / 'decks.jsonl'
+    journal = CheckpointJournal(str(path))
+    journal.start(mode='decks', date='2025-01-02')
+    journal.record('deck', name='A')
+
+    journal.close(completed=True)
+
+    assert not path.exists()
+    assert journal.read() == (None, [])
+
+
+def test_journal_without_a_usable_header_is_ignored(tmp_path):
+    path = tmp_path / 'cards.jsonl'
+    path.write_text(json.dumps({'type': 'start', 'format': FORMAT + 1}) + '\n'
+                    + json.dumps({'type': 'card', 'id': 'A1-1'}) + '\n')
+
+    assert CheckpointJournal(str(path)).read() == (None, [])
@@ -0,0 +1,64 @@
+import json
+
+from deckResolver import DeckResolver, archetype_names, deck_key, normalize_name
+
+CARDS = [
+    ('A2b-35', {'cardName': 'Giratina ex'}),
+    ('A2-110', {'cardName': 'Darkrai ex'}),
+    ('A2-196', {'cardName': 'Darkrai ex'}),
+    ('A1-10', {'cardName': 'Mr. Mime'}),
+    ('A1a-10', {'cardName': 'Flabébé'}),
+    ('A1-2', {'cardName': 'Mr. Mime'}),
+]
+
+
+def test_names_are_normalized():
+    assert normalize_name('Flabébé  EX ') == 'flabebe ex'
+    assert deck_key(['A2b-35', 'A2-110', None]) == 'A2-110|A2b-35'
+
+
+def test_every_printing_maps_to_the_earliest_one():
+    resolver = DeckResolver.build(CARDS)
+
+    assert resolver.canonical('A2-196') == 'A2-110'
+    assert resolver.canonical('A1-10') == 'A1-2'
+    assert resolver.canonical('B9-1') == 'B9-1'
+    assert resolver.card_for_name('Mr. Mime') == 'A1-2'
+    # A base name is an alias of its ex card, and either spelling finds it
+    assert resolver.card_for_name('Giratina') == resolver.card_for_name('giratina EX') == 'A2b-35'
+
+
+def test_archetypes_resolve_by_longest_match():
+    resolver = DeckResolver.build(CARDS, ['Giratina ex Darkrai ex', 'Mr. Mime Flabebe Rogue'])
+
+    assert resolver.archetypes['Giratina ex Darkrai ex'] == {
+        'cards': ['A2b-35', 'A2-110'], 'deckKey': 'A2-110|A2b-35', 'unresolved': []
+    }
+    assert resolver.resolve('Darkrai Giratina')['deckKey'] == 'A2-110|A2b-35'
+    assert resolver.resolve('Mr. Mime Flabebe Rogue') == {
+        'cards': ['A1-2', 'A1a-10'], 'deckKey': 'A1-2|A1a-10', 'unresolved': ['rogue']
+    }
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'deck_resolver.json'
+    resolver = DeckResolver.build(CARDS, ['Giratina ex Darkrai ex'])
+    resolver.save(str(path))
+
+    loaded = DeckResolver.load(str(path))
+
+    assert loaded.to_dict() == resolver.to_dict()
+    assert DeckResolver.load(str(tmp_path / 'missing.json')).names == {}
+    path.write_text(json.dumps({'format': 99}))
+    assert DeckResolver.load(str(path)).archetypes == {}
+
+
+def test_archetype_names_are_read_from_the_tournament_meta(tmp_path):
+    path = tmp_path / 'tournament_meta.json'
+    path.write_text(json.dumps({
+        '2025-01-01': [{'Deck Name': 'Giratina ex Darkrai ex'}, {'Deck Name': 'Mr. Mime'}],
+        '2025-01-02': [{'Deck Name': 'Giratina ex Darkrai ex'}, {}],
+    }))
+
+    assert archetype_names(str(path)) == ['Giratina ex Darkrai ex', 'Mr. Mime']
+    assert archetype_names(str(tmp_path / 'missing.json')) == []
@@ -0,0 +1,72 @@
+import json
+
+from evolutionGraph import EvolutionGraph
+
+
+def card(name, evolves_from='', subtype=None):
+    return {'cardName': name, 'evolvesFrom': evolves_from, 'cardSubtype': subtype}
+
+
+def test_final_flags_change_as_evolutions_arrive():
+    graph = EvolutionGraph()
+
+    assert graph.add('A1-1', card('Bulbasaur', subtype='Basic')) == {'Bulbasaur': True}
+    assert graph.add('A1-2', card('Ivysaur', 'Bulbasaur')) == {'Ivysaur': True, 'Bulbasaur': False}
+    assert graph.add('A1-3', card('Venusaur', 'Ivysaur')) == {'Venusaur': True, 'Ivysaur': False}
+
+    assert not graph.is_final('Bulbasaur')
+    assert graph.is_final('Venusaur')
+    assert graph.ancestors('Venusaur') == ['Bulbasaur', 'Ivysaur', 'Venusaur']
+
+
+def test_reprints_keep_a_name_non_final_until_the_last_edge_goes():
+    graph = EvolutionGraph()
+    graph.add_many([
+        ('A1-1', card('Bulbasaur')),
+        ('A1-2', card('Ivysaur', 'Bulbasaur')),
+        ('A1-230', card('Ivysaur', 'Bulbasaur')),
+    ])
+
+    # Correcting one printing's evolvesFrom leaves the other edge in place
+    assert graph.add('A1-2', card('Ivysaur', 'Oddish')) == {'Ivysaur': True}
+    assert not graph.is_final('Bulbasaur')
+
+    assert graph.add('A1-230', card('Ivysaur', 'Oddish')) == {'Ivysaur': True, 'Bulbasaur': True}
+    assert graph.is_final('Bulbasaur')
+    assert graph.printings('Ivysaur') == ['A1-2', 'A1-230']
+
+
+def test_branching_families_have_one_chain_per_final_evolution():
+    graph = EvolutionGraph()
+    graph.add_many([
+        ('A1-1', card('Eevee')),
+        ('A1-2', card('Vaporeon', 'Eevee')),
+        ('A1-3', card('Jolteon', 'Eevee')),
+    ])
+
+    assert graph.chains('Eevee') == [['Eevee', 'Jolteon'], ['Eevee', 'Vaporeon']]
+    assert graph.chains('Vaporeon') == [['Eevee', 'Vaporeon']]
+
+
+def test_cycles_in_bad_data_terminate():
+    graph = EvolutionGraph()
+    graph.add_many([('X-1', card('A', 'B')), ('X-2', card('B', 'A'))])
+
+    assert graph.ancestors('A') == ['B', 'A']
+    assert graph.chains('A') == [['B', 'A']]
+
+
+def test_saved_graph_is_keyed_by_card_name(tmp_path):
+    graph = EvolutionGraph()
+    graph.add_many([('A1-1', card('Bulbasaur', subtype='Basic')), ('A1-2', card('Ivysaur', 'Bulbasaur'))])
+    path = tmp_path / 'evolution_graph.json'
+
+    assert graph.save(str(path)) is True
+
+    saved = json.loads(path.read_text())['cards']
+    assert saved['Bulbasaur'] == {'stage': 'Basic', 'evolvesFrom': '', 'evolvesTo': ['Ivysaur'],
+                                  'finalEvolution': False, 'chains': [['Bulbasaur', 'Ivysaur']],
+                                  'printings': ['A1-1']}
+
+    # A file where the folder should be makes the write fail
+    assert graph.save(str(path / 'evolution_graph.json')) is False
@@ -0,0 +1,78 @@
+import os
+
+from httpCache import HttpCache
+
+
+class Response:
+    def __init__(self, url, content, etag='"v1"', status_code=200):
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self.encoding = 'utf-8'
+        self.headers = {'ETag': etag} if etag else {}
+
+
+def test_second_fetch_revalidates_and_is_answered_from_disk(site, http_fetch, tmp_path):
+    url = site.add('/cards/A1', '<p>Bulbasaur</p>', etag='"abc"')
+    http_fetch.configure(cache_dir=str(tmp_path / 'cache'))
+
+    first = http_fetch.fetch_cached(url)
+    second = http_fetch.fetch_cached(url)
+
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.text == '<p>Bulbasaur</p>'
+    assert 'If-None-Match' not in site.requests[0][1]
+    assert site.requests[1][1]['If-None-Match'] == '"abc"'
+
+
+def test_changed_page_replaces_the_cached_body(site, http_fetch, tmp_path):
+    url = site.add('/cards/A1', 'old', etag='"v1"')
+    http_fetch.configure(cache_dir=str(tmp_path / 'cache'))
+    http_fetch.fetch_cached(url)
+
+    site.add('/cards/A1', 'new', etag='"v2"')
+    changed = http_fetch.fetch_cached(url)
+    again = http_fetch.fetch_cached(url)
+
+    assert changed.from_cache is False
+    assert again.from_cache is True
+    assert again.text == 'new'
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache = HttpCache(str(tmp_path))
+
+    assert cache.store('https://x.test/a', Response('https://x.test/a', b'body', etag=None)) is False
+    assert cache.store('https://x.test/b', Response('https://x.test/b', b'body', status_code=404)) is False
+    assert cache.lookup('https://x.test/a') is None
+    assert cache.size == 0
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = HttpCache(str(tmp_path), max_bytes=20)
+    for name in ('a', 'b'):
+        url = f"https://x.test/{name}"
+        cache.store(url, Response(url, b'x' * 8))
+    # Age b so reading a leaves it least recently used even on a coarse clock
+    cache._entries[cache.key_for('https://x.test/b')][1] -= 10
+    cache.read_body('https://x.test/a')
+
+    cache.store('https://x.test/c', Response('https://x.test/c', b'x' * 8))
+
+    assert cache.lookup('https://x.test/b') is None
+    assert cache.lookup('https://x.test/a') is not None
+    assert cache.lookup('https://x.test/c') is not None
+    assert cache.size == 16
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store('https://x.test/a', Response('https://x.test/a', b'body'))
+
+    reopened = HttpCache(str(tmp_path))
+
+    assert reopened.lookup('https://x.test/a')['etag'] == '"v1"'
+    assert reopened.read_body('https://x.test/a') == b'body'
+    assert reopened.size == 4
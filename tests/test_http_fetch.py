@@ -0,0 +1,73 @@
+import pytest
+
+from httpFetch import By, NoSuchElementError, page_title, parse_html
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>Genetic Apex | Card</title><style>.x { color: red }</style></head>
+<body>
+  <div class="card-text">
+    <p class="card-text-title"><span class="card-text-name"><a href="/cards/A1/4">Venusaur ex</a></span> - Grass - 190 HP</p>
+    <p class="card-text-type">Pokémon - Stage 2 - Evolves from Ivysaur</p>
+    <!-- not rendered -->
+    <script>var hidden = 1;</script>
+  </div>
+  <table class="data-table">
+    <tr><th>Deck</th><th>Matches</th></tr>
+    <tr><td><a href="../decks/giratina">Giratina ex</a></td><td>3,724</td></tr>
+  </table>
+  <img class="card shadow" src="images/a1-4.webp">
+</body></html>"""
+
+
+@pytest.fixture
+def document():
+    return parse_html(PAGE, base_url="https://pocket.limitlesstcg.com/cards/A1/4")
+
+
+def test_locators_match_selenium_strategies(document):
+    assert [node.tag for node in document.find_elements(By.TAG_NAME, 'tr')] == ['tr', 'tr']
+    assert document.find_element(By.CLASS_NAME, 'card-text-name').text == 'Venusaur ex'
+    assert len(document.find_elements(By.CSS_SELECTOR, 'table.data-table td')) == 2
+    with pytest.raises(NoSuchElementError):
+        document.find_element(By.CSS_SELECTOR, '.missing')
+    with pytest.raises(ValueError):
+        document.find_elements('xpath', '//p')
+
+
+def test_links_are_resolved_and_class_lists_joined(document):
+    assert document.select_one('.card-text-name a').get_attribute('href') == 'https://pocket.limitlesstcg.com/cards/A1/4'
+    assert document.select_one('td a').get_attribute('href') == 'https://pocket.limitlesstcg.com/cards/decks/giratina'
+    image = document.find('img')
+    assert image.get_attribute('src') == 'https://pocket.limitlesstcg.com/cards/A1/images/a1-4.webp'
+    assert image.get_attribute('class') == 'card shadow'
+    assert image.get_attribute('alt') is None
+
+
+def test_text_renders_blocks_and_skips_scripts_and_comments(document):
+    assert document.find('div', 'card-text').text == (
+        "Venusaur ex - Grass - 190 HP\nPokémon - Stage 2 - Evolves from Ivysaur"
+    )
+    assert document.select('tr')[1].text == "Giratina ex 3,724"
+    assert page_title(document) == "Genetic Apex | Card"
+
+
+def test_fetch_cached_without_cache_marks_responses_as_fresh(site, http_fetch):
+    url = site.add('/cards/A1/4', PAGE)
+
+    response, document = http_fetch.fetch_document(url)
+
+    assert response.status_code == 200
+    assert response.from_cache is False
+    assert document.find_element(By.CLASS_NAME, 'card-text-name').text == 'Venusaur ex'
+
+
+def test_exhausted_retries_raise_a_transient_error(site, http_fetch):
+    def fail(self):
+        self.send_error(503)
+
+    url = site.add('/down', '')
+    site.pages.pop('/down')
+    site.server.RequestHandlerClass.do_GET = fail
+
+    with pytest.raises(http_fetch.TransientRequestError):
+        http_fetch.fetch_cached(url)
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+import iconAtlas
+from iconAtlas import IconAtlas
+
+Image = pytest.importorskip('PIL.Image')
+
+
+@pytest.fixture
+def atlas(tmp_path, monkeypatch):
+    # Two slots per sheet so a handful of icons spans several sheets
+    monkeypatch.setitem(iconAtlas.CONFIG, 'CELL', 8)
+    monkeypatch.setitem(iconAtlas.CONFIG, 'COLUMNS', 2)
+    monkeypatch.setitem(iconAtlas.CONFIG, 'ROWS', 1)
+    (tmp_path / 'icons').mkdir()
+    return make_atlas(tmp_path)
+
+
+def make_atlas(tmp_path):
+    return IconAtlas(str(tmp_path / 'atlas'), 'assets/atlas', 'assets/icons', str(tmp_path / 'atlas.json'))
+
+
+def add_icon(tmp_path, name, colour, size=8):
+    Image.new('RGBA', (size, size), colour).save(tmp_path / 'icons' / name)
+    return {name: f"{name}-{colour}"}
+
+
+def sheet_versions(coordinate_map):
+    return [path.split('?v=')[1] for path in coordinate_map['sheets']]
+
+
+def test_icons_are_packed_into_slots_and_downsized(atlas, tmp_path):
+    files = {}
+    files.update(add_icon(tmp_path, 'a.png', 'red'))
+    files.update(add_icon(tmp_path, 'b.png', 'green', size=32))
+    files.update(add_icon(tmp_path, 'c.png', 'blue'))
+
+    coordinates = atlas.build(files, str(tmp_path / 'icons'))
+
+    assert coordinates['icons'] == {
+        'assets/icons/a.png': [0, 0, 0, 8, 8],
+        'assets/icons/b.png': [0, 8, 0, 8, 8],
+        'assets/icons/c.png': [1, 0, 0, 8, 8],
+    }
+    assert sorted(os.listdir(tmp_path / 'atlas')) == ['icons-0.webp', 'icons-1.webp']
+    with Image.open(tmp_path / 'atlas' / 'icons-0.webp') as sheet:
+        assert sheet.size == (16, 8)
+        assert sheet.convert('RGBA').getpixel((12, 4)) == (0, 128, 0, 255)
+
+
+def test_only_changed_sheets_are_re_encoded(atlas, tmp_path):
+    files = {}
+    for name, colour in (('a.png', 'red'), ('b.png', 'green'), ('c.png', 'blue')):
+        files.update(add_icon(tmp_path, name, colour))
+    first = sheet_versions(atlas.build(files, str(tmp_path / 'icons')))
+
+    unchanged = sheet_versions(make_atlas(tmp_path).build(files, str(tmp_path / 'icons')))
+    files.update(add_icon(tmp_path, 'c.png', 'yellow'))
+    changed = sheet_versions(make_atlas(tmp_path).build(files, str(tmp_path / 'icons')))
+
+    assert unchanged == first
+    assert changed[0] == first[0]
+    assert changed[1] != first[1]
+
+
+def test_removed_icons_free_their_slot_and_empty_sheets(atlas, tmp_path):
+    files = {}
+    for name, colour in (('a.png', 'red'), ('b.png', 'green'), ('c.png', 'blue')):
+        files.update(add_icon(tmp_path, name, colour))
+    atlas.build(files, str(tmp_path / 'icons'))
+
+    del files['a.png'], files['c.png']
+    coordinates = make_atlas(tmp_path).build(files, str(tmp_path / 'icons'))
+    assert coordinates['icons'] == {'assets/icons/b.png': [0, 8, 0, 8, 8]}
+    assert os.listdir(tmp_path / 'atlas') == ['icons-0.webp']
+
+    files.update(add_icon(tmp_path, 'd.png', 'blue'))
+    coordinates = make_atlas(tmp_path).build(files, str(tmp_path / 'icons'))
+    assert coordinates['icons']['assets/icons/d.png'] == [0, 0, 0, 8, 8]
@@ -0,0 +1,68 @@
+import json
+
+from iconStore import IconStore, normalize_icon_name
+
+PNG_A = b'\x89PNG image a'
+PNG_B = b'\x89PNG image b'
+
+
+def make_store(tmp_path):
+    return IconStore(str(tmp_path / 'icons'), 'assets/icons', str(tmp_path / 'icon_manifest.json'))
+
+
+def test_card_names_normalize_to_shared_aliases():
+    assert normalize_icon_name('Mewtwo ex') == normalize_icon_name('Mewtwo') == 'mewtwo'
+    assert normalize_icon_name('Mr. Mime') == 'mr-mime'
+    assert normalize_icon_name('Paldean Tauros') == 'tauros'
+
+
+def test_identical_images_share_one_file(tmp_path):
+    store = make_store(tmp_path)
+
+    assert store.add('pikachu', PNG_A) == 'assets/icons/pikachu.png'
+    assert store.add('pikachu-2', PNG_A) == 'assets/icons/pikachu.png'
+    assert store.add('raichu', PNG_B) == 'assets/icons/raichu.png'
+
+    assert store.file_names() == ['pikachu.png', 'raichu.png']
+    assert store.web_path_for('pikachu-2') == 'assets/icons/pikachu.png'
+    assert sorted(p.name for p in (tmp_path / 'icons').iterdir()) == ['pikachu.png', 'raichu.png']
+
+
+def test_each_alias_is_downloaded_once(site, http_fetch, tmp_path):
+    site.add('/icons/mewtwo.png', PNG_A, content_type='image/png')
+    site.add('/icons/mew.png', PNG_A, content_type='image/png')
+    store = make_store(tmp_path)
+    icon_url = site.base_url + '/icons/'
+
+    paths = store.fetch_many(['mewtwo', 'mew', 'mewtwo', 'missingno'], icon_url, max_workers=4)
+    store.fetch_many(['mewtwo', 'mew'], icon_url)
+
+    assert paths['mewtwo'] == paths['mew']
+    assert paths['missingno'] is None
+    assert sorted(path for path, _ in site.requests) == ['/icons/mew.png', '/icons/mewtwo.png', '/icons/missingno.png']
+    assert len(store.file_names()) == 1
+
+
+def test_manifest_round_trip_and_indexing_of_unknown_files(tmp_path):
+    store = make_store(tmp_path)
+    store.add('pikachu', PNG_A)
+    store.save()
+    (tmp_path / 'icons' / 'eevee.png').write_bytes(PNG_B)
+
+    reloaded = make_store(tmp_path)
+    reloaded.load()
+
+    assert reloaded.web_path_for('pikachu') == 'assets/icons/pikachu.png'
+    assert reloaded.web_path_for('eevee') == 'assets/icons/eevee.png'
+    assert json.loads((tmp_path / 'icon_manifest.json').read_text())['format'] == 1
+
+
+def test_icons_list_names_every_stored_file(tmp_path):
+    store = make_store(tmp_path)
+    store.add('pikachu', PNG_A)
+    store.add('raichu', PNG_B)
+    path = tmp_path / 'iconsList.js'
+
+    store.write_icons_list(str(path))
+
+    assert "  'pikachu.png', 'raichu.png'\n" in path.read_text()
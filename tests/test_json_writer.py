@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+from jsonWriter import append_json_object_entry, write_json_object_stream
+
+
+def dump(data, indent=4):
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("existing", [
+    {},
+    {"2025-05-01": [{"Deck Name": "Giratina ex Darkrai ex", "Share": "20.22%"}]},
+    {"2025-05-01": [], "2025-05-02": {"nested": {"Flabébé": [1, 2, 3]}}},
+])
+def test_append_matches_a_full_dump(tmp_path, existing):
+    path = tmp_path / "meta.json"
+    path.write_text(dump(existing), encoding="utf-8")
+    value = [{"Deck Name": "Pikachu ex", "Matchups": {"Other": {"Matches": "3,724"}}}]
+
+    append_json_object_entry(str(path), "2025-05-03", value, indent=4)
+
+    assert path.read_text(encoding="utf-8") == dump({**existing, "2025-05-03": value})
+
+
+def test_append_to_a_streamed_file(tmp_path):
+    path = tmp_path / "meta.json"
+    items = [("2025-05-01", [1]), ("2025-05-02", [2])]
+    write_json_object_stream(str(path), items, indent=4)
+
+    append_json_object_entry(str(path), "2025-05-03", [3], indent=4)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"2025-05-01": [1], "2025-05-02": [2], "2025-05-03": [3]}
+
+
+def test_failed_append_leaves_the_file_untouched(tmp_path):
+    path = tmp_path / "meta.json"
+    original = dump({"2025-05-01": [1]})
+    path.write_text(original, encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        append_json_object_entry(str(path), "2025-05-02", object(), indent=4)
+
+    assert path.read_text(encoding="utf-8") == original
+    assert os.listdir(tmp_path) == ["meta.json"]
+
+
+def test_append_rejects_a_non_object(tmp_path):
+    path = tmp_path / "meta.json"
+    path.write_text("[1, 2]", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        append_json_object_entry(str(path), "2025-05-02", [3])
@@ -0,0 +1,69 @@
+from matchupMatrix import EMPTY_MATCHUP, OTHER, normalize_snapshot, parse_matchup
+
+
+def deck(name, matchups):
+    return {"Deck Name": name, "Matchups": matchups}
+
+
+def matchup(wins, losses, ties, rate):
+    return {"Matches": str(wins + losses + ties), "Score": f"{wins} - {losses} - {ties}", "Win Rate": rate}
+
+
+def test_parse_matchup_reads_score_and_counts():
+    assert parse_matchup({"Matches": "1,820", "Score": "900 - 880 - 40", "Win Rate": "49.45%"}) == (900, 880, 40, 1820)
+
+
+def test_parse_matchup_estimates_from_win_rate_without_score():
+    assert parse_matchup({"Matches": "10", "Win Rate": "60%"}) == (6, 4, 0, 10)
+
+
+def test_normalize_folds_non_top_opponents_into_other():
+    a_vs_b = matchup(5, 5, 0, "50.00%")
+    decks = [
+        deck("A", {"A": matchup(1, 1, 0, "50.00%"), "B": a_vs_b,
+                   "Rogue": matchup(6, 4, 0, "60.00%"), "Rogue 2": matchup(2, 3, 0, "40.00%")}),
+        deck("B", {"A": matchup(5, 5, 0, "50.00%"), "B": matchup(1, 1, 0, "50.00%")}),
+    ]
+
+    report = normalize_snapshot(decks)
+
+    assert list(decks[0]["Matchups"]) == ["A", "B", OTHER]
+    assert decks[0]["Matchups"]["B"] is a_vs_b
+    assert decks[0]["Matchups"][OTHER] == {"Matches": "15", "Score": "8-7", "Win Rate": "53.3%"}
+    assert OTHER not in decks[1]["Matchups"]
+    assert report == [("A", 15, []), ("B", 0, [])]
+
+
+def test_normalize_fills_missing_top_matchups():
+    decks = [
+        deck("A", {"A": matchup(1, 1, 0, "50.00%")}),
+        deck("B", {}),
+    ]
+
+    report = normalize_snapshot(decks)
+
+    assert decks[0]["Matchups"]["B"] == EMPTY_MATCHUP
+    assert decks[1]["Matchups"] == {"A": EMPTY_MATCHUP, "B": EMPTY_MATCHUP}
+    assert report == [("A", 0, ["B"]), ("B", 0, ["A", "B"])]
+
+
+def test_normalize_with_explicit_top_names():
+    decks = [deck("A", {"A": matchup(1, 1, 0, "50.00%"), "B": matchup(3, 1, 0, "75.00%")})]
+
+    report = normalize_snapshot(decks, top_names=["A"])
+
+    assert decks[0]["Matchups"] == {"A": matchup(1, 1, 0, "50.00%"), OTHER: {"Matches": "4", "Score": "3-1", "Win Rate": "75.0%"}}
+    assert report == [("A", 4, [])]
+
+
+def test_normalize_is_idempotent():
+    decks = [
+        deck("A", {"B": matchup(5, 5, 0, "50.00%"), "Rogue": matchup(6, 4, 0, "60.00%")}),
+        deck("B", {"A": matchup(5, 5, 0, "50.00%")}),
+    ]
+    normalize_snapshot(decks)
+    first = [dict(d["Matchups"]) for d in decks]
+
+    normalize_snapshot(decks)
+
+    assert [d["Matchups"] for d in decks] == first
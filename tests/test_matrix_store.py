@@ -0,0 +1,60 @@
+import json
+
+from matchupMatrix import EMPTY_MATCHUP, OTHER, normalize_snapshot
+from matrixStore import MatchupMatrixStore
+
+
+def matchup(wins, losses, ties=0):
+    matches = wins + losses + ties
+    return {"Matches": str(matches), "Score": f"{wins} - {losses} - {ties}",
+            "Win Rate": f"{100 * wins / matches:.2f}%"}
+
+
+def deck(rank, name, matchups):
+    return {"Rank": str(rank), "Deck Name": name, "URL": f"https://pocket.limitlesstcg.com/decks/{name}",
+            "Count": "100", "Share": "10.00%", "Win %": "50.00%", "Matchups": matchups}
+
+
+DECKS = [
+    deck(1, "A", {"B": matchup(6, 4), "C": matchup(3, 1, 1), "Rogue": matchup(2, 2)}),
+    deck(2, "B", {"A": matchup(4, 6)}),
+    deck(3, "C", {"A": matchup(1, 3, 1), "B": matchup(5, 5)}),
+]
+
+
+def test_full_matrix_is_stored_sparsely(tmp_path):
+    store = MatchupMatrixStore(str(tmp_path))
+
+    assert store.append("2025-01-02", DECKS) is True
+    assert store.append("2025-01-02", DECKS) is False
+
+    partition = store.read("2025-01-02")
+    assert partition["extraOpponents"] == ["Rogue"]
+    assert len(partition["cells"]) == 6
+    assert "Matchups" not in partition["decks"][0]
+    assert MatchupMatrixStore(str(tmp_path)).dates() == ["2025-01-02"]
+    assert json.loads((tmp_path / "manifest.json").read_text())["partitions"]["2025-01-02"]["cells"] == 6
+
+
+def test_full_snapshot_round_trips_the_scraped_matchups(tmp_path):
+    store = MatchupMatrixStore(str(tmp_path))
+    store.append("2025-01-02", DECKS)
+
+    snapshot = store.snapshot("2025-01-02")
+
+    assert [d["Deck Name"] for d in snapshot] == ["A", "B", "C"]
+    assert snapshot[0]["Matchups"] == {"B": matchup(6, 4), "C": matchup(3, 1, 1), "Rogue": matchup(2, 2)}
+    assert snapshot[2]["Matchups"]["A"] == matchup(1, 3, 1)
+
+
+def test_top_n_cut_folds_the_rest_into_other(tmp_path):
+    store = MatchupMatrixStore(str(tmp_path))
+    store.append("2025-01-02", DECKS)
+
+    snapshot = store.snapshot("2025-01-02", top_n=2)
+    normalize_snapshot(snapshot)
+
+    assert [d["Deck Name"] for d in snapshot] == ["A", "B"]
+    assert sorted(snapshot[0]["Matchups"]) == ["A", "B", OTHER]
+    assert snapshot[0]["Matchups"][OTHER]["Matches"] == "9"
+    assert snapshot[0]["Matchups"]["A"] == EMPTY_MATCHUP
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from metaAnalytics import build_meta_analytics, tier_for, wilson_interval, write_meta_analytics
+
+
+def deck(name, share, win_rate, rank, matchups=None):
+    return {"Deck Name": name, "Share": share, "Win %": win_rate, "Count": "1,000", "Rank": str(rank),
+            "URL": f"https://pocket.limitlesstcg.com/decks/{name.lower()}", "Matchups": matchups or {}}
+
+
+def matchup(wins, losses, ties=0):
+    matches = wins + losses + ties
+    return {"Matches": str(matches), "Score": f"{wins} - {losses} - {ties}",
+            "Win Rate": f"{wins / matches * 100:.2f}%"}
+
+
+SNAPSHOTS = [
+    ("2025-01-01", [deck("A", "50.00%", "51.00%", 1), deck("B", "30.00%", "49.00%", 2)]),
+    ("2025-01-02", [
+        deck("C", "40.00%", "40.00%", 1, {"A": matchup(40, 60)}),
+        deck("A", "60.00%", "60.00%", 2, {"C": matchup(60, 40)}),
+    ]),
+]
+
+
+class Store:
+    def iter_snapshots(self):
+        return iter(SNAPSHOTS)
+
+
+def test_wilson_interval_is_symmetric_at_one_half_and_bounded():
+    low, high = wilson_interval(50, 100)
+    assert low + high == pytest.approx(100)
+    assert low < 50 < high
+    assert wilson_interval(10, 10)[1] <= 100
+    assert wilson_interval(0, 0) == (None, None)
+
+
+def test_tiers_follow_the_thresholds():
+    assert [tier_for(score) for score in (60, 52, 50, 46, 10, None)] == ['S', 'A', 'B', 'C', 'D', None]
+
+
+def test_series_deltas_and_field_win_rates():
+    analytics = build_meta_analytics(SNAPSHOTS)
+
+    assert analytics["dates"] == ["2025-01-01", "2025-01-02"]
+    assert analytics["newDecks"] == ["C"]
+    assert analytics["droppedDecks"] == ["B"]
+    assert analytics["rankings"]["2025-01-02"] == ["C", "A"]
+
+    a = analytics["decks"]["A"]
+    assert a["share"] == [50.0, 60.0]
+    assert a["rank"] == [1, 2]
+    assert a["delta"] == {"share": 10.0, "winRate": 9.0, "rank": -1}
+    assert a["record"] == [[0, 0, 0], [60, 40, 0]]
+    assert a["matchups"]["2025-01-02"] == [["C", 60.0, 100, "60 - 40 - 0"]]
+    # C is A's only played opponent, so the expected rate is the matchup rate
+    assert a["field"]["expectedWinRate"] == 60.0
+    assert a["field"]["observedWinRateCI"] == list(wilson_interval(60, 100))
+    assert analytics["decks"]["B"]["share"] == [30.0, None]
+    assert "field" not in analytics["decks"]["B"]
+
+
+def test_written_artifact_is_stable(tmp_path):
+    path = tmp_path / "meta_analytics.json"
+    write_meta_analytics(Store(), str(path))
+    first = path.read_bytes()
+
+    write_meta_analytics(Store(), str(path))
+
+    assert path.read_bytes() == first
+    assert json.loads(first)["latestDate"] == "2025-01-02"
@@ -0,0 +1,66 @@
+from datetime import date as Date
+
+import pytest
+
+from metaColumnar import export_meta_columnar, flatten_snapshot, read_meta_table
+
+DECKS = [
+    {"Rank": "1", "Deck Name": "A", "URL": "https://pocket.limitlesstcg.com/decks/a", "Count": "1,200",
+     "Share": "20.50%", "Win %": "52.10%",
+     "Matchups": {"B": {"Matches": "10", "Score": "6 - 3 - 1", "Win Rate": "60.00%"},
+                  "Rogue": {"Matches": "0", "Score": "0 - 0 - 0", "Win Rate": "0.00%"}}},
+    {"Rank": "", "Deck Name": "B", "URL": None, "Count": "", "Share": "N/A", "Win %": "",
+     "Matchups": {"A": {"Matches": "10", "Score": "3 - 6 - 1", "Win Rate": "30.00%"}}},
+]
+
+
+class Store:
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+
+    def dates(self):
+        return sorted(self.snapshots)
+
+    def read(self, date):
+        return self.snapshots[date]
+
+
+def test_flatten_types_deck_rows_and_keeps_blanks_null():
+    decks, _ = flatten_snapshot("2025-05-13", DECKS)
+
+    assert decks == {
+        'date': [Date(2025, 5, 13)] * 2,
+        'rank': [1, None],
+        'deck_name': ['A', 'B'],
+        'url': ['https://pocket.limitlesstcg.com/decks/a', None],
+        'count': [1200, 0],
+        'share': [20.5, None],
+        'win_rate': [52.1, None],
+    }
+
+
+def test_flatten_emits_one_row_per_listed_matchup():
+    _, matchups = flatten_snapshot("2025-05-13", DECKS)
+
+    rows = sorted(zip(matchups['deck_name'], matchups['opponent'], matchups['wins'].tolist(),
+                      matchups['losses'].tolist(), matchups['ties'].tolist(), matchups['matches'].tolist(),
+                      matchups['win_rate']))
+    assert rows == [('A', 'B', 6, 3, 1, 10, 60.0), ('A', 'Rogue', 0, 0, 0, 0, 0.0), ('B', 'A', 3, 6, 1, 10, 30.0)]
+    assert matchups['date'] == [Date(2025, 5, 13)] * 3
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_export_writes_missing_dates_and_reads_a_range(tmp_path, fmt):
+    pytest.importorskip('pyarrow')
+    store = Store({"2025-05-12": DECKS[:1], "2025-05-13": DECKS})
+
+    assert export_meta_columnar(store, str(tmp_path), fmt=fmt) == 2
+    assert export_meta_columnar(store, str(tmp_path), fmt=fmt) == 0
+    assert export_meta_columnar(store, str(tmp_path), fmt=fmt, force_dates=["2025-05-13"]) == 1
+
+    decks = read_meta_table(str(tmp_path), 'decks', start="2025-05-13", fmt=fmt)
+    assert decks.column('deck_name').to_pylist() == ['A', 'B']
+    assert decks.schema.field('rank').type == 'int16'
+    matchups = read_meta_table(str(tmp_path), 'matchups', fmt=fmt)
+    assert matchups.num_rows == 5
+    assert read_meta_table(str(tmp_path), 'decks', start="2026-01-01", fmt=fmt).num_rows == 0
@@ -0,0 +1,49 @@
+import copy
+
+import pytest
+
+from matchupMatrix import normalize_snapshot
+from metaCorrection import correct_store
+from metaDelta import MetaDeltaStore
+from metaStore import MetaSnapshotStore
+
+
+def matchup(wins, losses):
+    return {"Matches": str(wins + losses), "Score": f"{wins} - {losses} - 0", "Win Rate": f"{100 * wins / (wins + losses):.2f}%"}
+
+
+def history():
+    snapshots = {}
+    for day in range(1, 6):
+        decks = [
+            {"Deck Name": "A", "Share": f"{20 + day}%", "Matchups": {"B": matchup(5 + day, 5), "Rogue": matchup(3, day)}},
+            {"Deck Name": "B", "Share": "15%", "Matchups": {"A": matchup(5, 5 + day), f"Rogue {day}": matchup(day, 2)}},
+            {"Deck Name": "C", "Share": "10%", "Matchups": {}},
+        ]
+        snapshots[f"2025-05-0{day}"] = decks
+    return snapshots
+
+
+def serial_correction(snapshots):
+    corrected = {}
+    for date, decks in snapshots.items():
+        decks = copy.deepcopy(decks)
+        normalize_snapshot(decks)
+        corrected[date] = decks
+    return corrected
+
+
+@pytest.mark.parametrize("store_class", [MetaSnapshotStore, MetaDeltaStore])
+def test_parallel_correction_matches_serial(tmp_path, store_class):
+    snapshots = history()
+    store = store_class(str(tmp_path))
+    for date, decks in snapshots.items():
+        store.append(date, decks)
+
+    timings = correct_store(store, processes=2)
+
+    assert sorted(timings) == sorted(snapshots)
+    expected = serial_correction(snapshots)
+    assert dict(store_class(str(tmp_path)).iter_snapshots()) == expected
+    assert timings["2025-05-01"]["otherFolds"] == 2
+    assert timings["2025-05-01"]["filledMatchups"] == 7
@@ -0,0 +1,100 @@
+import copy
+import os
+
+import pytest
+
+from metaDelta import MetaDeltaStore, apply_delta, diff_snapshots, format_matchup
+
+
+def matchup(wins, losses, ties):
+    return format_matchup(wins, losses, ties)
+
+
+def snapshots():
+    day1 = [
+        {"Rank": "1", "Deck Name": "A", "Share": "20.00%", "Matchups": {"B": matchup(5, 5, 0), "C": matchup(3, 1, 0)}},
+        {"Rank": "2", "Deck Name": "B", "Share": "15.00%", "Matchups": {"A": matchup(5, 5, 0)}},
+        {"Rank": "3", "Deck Name": "C", "Share": "10.00%", "Matchups": {}},
+    ]
+    day2 = copy.deepcopy(day1)
+    day2[0]["Share"] = "21.50%"
+    day2[0]["Matchups"] = {"C": matchup(4, 1, 1), "B": matchup(6, 5, 0)}  # counts up, order changed
+    day2[1]["Matchups"]["Other"] = {"Matches": "7", "Score": "4-3", "Win Rate": "57.1%"}
+    day2[1]["Rank"], day2[0]["Rank"] = "1", "2"
+    day2 = [day2[1], day2[0], {"Rank": "3", "Deck Name": "D", "Share": "9.00%", "Matchups": {}}]  # C dropped, D added
+    day3 = copy.deepcopy(day2) + [{"Rank": "4", "Deck Name": "A", "Share": "1.00%", "Matchups": {}}]  # a repeated name
+    return {"2025-05-01": day1, "2025-05-02": day2, "2025-05-03": day3}
+
+
+def test_format_matchup_rounds_half_up():
+    assert format_matchup(1, 7, 0) == {"Matches": "8", "Score": "1 - 7 - 0", "Win Rate": "12.50%"}
+    assert format_matchup(2, 1, 0)["Win Rate"] == "66.67%"
+
+
+def test_delta_replays_exactly_and_summarizes():
+    data = snapshots()
+    day1, day2 = data["2025-05-01"], data["2025-05-02"]
+
+    delta = diff_snapshots(day1, day2)
+
+    assert apply_delta(day1, delta) == day2
+    assert day1 == snapshots()["2025-05-01"]
+    assert delta["summary"]["added"] == ["D"]
+    assert delta["summary"]["dropped"] == ["C"]
+    assert delta["summary"]["rankMoves"] == {"B": [2, 1], "A": [1, 2]}
+    assert delta["summary"]["matchesAdded"] == {"B": 7, "A": 3}
+
+
+def test_store_round_trip_with_bases_and_deltas(tmp_path):
+    data = snapshots()
+    store = MetaDeltaStore(str(tmp_path), base_every=2)
+
+    assert store.import_snapshots(data.items()) == 3
+
+    reopened = MetaDeltaStore(str(tmp_path), base_every=2)
+    assert reopened.dates() == sorted(data)
+    assert [reopened.entries[date]["type"] for date in reopened.dates()] == ["base", "delta", "base"]
+    assert all(reopened.snapshot(date) == decks for date, decks in data.items())
+    assert dict(reopened.iter_snapshots()) == data
+    assert reopened.summary("2025-05-02")["added"] == ["D"]
+    assert reopened.summary("2025-05-01") is None
+    with pytest.raises(KeyError):
+        reopened.snapshot("2025-05-04")
+
+
+def test_replacing_an_early_date_re_encodes_the_rest(tmp_path):
+    data = snapshots()
+    store = MetaDeltaStore(str(tmp_path), base_every=7)
+    store.import_snapshots(data.items())
+    replacement = copy.deepcopy(data["2025-05-03"])
+
+    assert not store.append("2025-05-01", replacement)
+    store.append("2025-05-01", replacement, replace=True, flush=False)
+    assert store.read("2025-05-01") == replacement
+    assert dict(store.iter_snapshots()) == {**data, "2025-05-01": replacement}
+    store.flush()
+
+    reopened = MetaDeltaStore(str(tmp_path))
+    assert dict(reopened.iter_snapshots()) == {**data, "2025-05-01": replacement}
+    referenced = {entry["file"] for entry in reopened.entries.values()}
+    assert set(os.listdir(tmp_path)) == referenced | {"manifest.json"}
+
+
+def test_interrupted_flush_keeps_the_previous_chain(tmp_path, monkeypatch):
+    data = snapshots()
+    MetaDeltaStore(str(tmp_path)).import_snapshots(data.items())
+    store = MetaDeltaStore(str(tmp_path))
+    encode = store._encode
+    calls = []
+
+    def failing_encode(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("interrupted")
+        return encode(*args)
+
+    monkeypatch.setattr(store, "_encode", failing_encode)
+    with pytest.raises(RuntimeError):
+        store.append("2025-05-01", [], replace=True)
+
+    assert dict(MetaDeltaStore(str(tmp_path)).iter_snapshots()) == data
@@ -0,0 +1,39 @@
+from metaStore import MetaSnapshotStore
+
+DECKS = [{"Deck Name": "Giratina ex Darkrai ex", "Share": "20.22%", "Matchups": {}},
+         {"Deck Name": "Flabébé", "Share": "1.5%", "Matchups": {"Other": {"Matches": "3"}}}]
+
+
+def test_append_round_trips_and_survives_reopening(tmp_path):
+    store = MetaSnapshotStore(str(tmp_path))
+    assert store.append("2025-05-02", DECKS)
+    assert store.append("2025-05-01", DECKS[:1])
+
+    reopened = MetaSnapshotStore(str(tmp_path))
+    assert reopened.dates() == ["2025-05-01", "2025-05-02"]
+    assert reopened.read("2025-05-02") == DECKS
+    assert list(reopened.iter_snapshots()) == [("2025-05-01", DECKS[:1]), ("2025-05-02", DECKS)]
+    assert reopened.read_range("2025-05-02") == {"2025-05-02": DECKS}
+
+
+def test_existing_dates_are_only_replaced_on_request(tmp_path):
+    store = MetaSnapshotStore(str(tmp_path))
+    store.append("2025-05-01", DECKS)
+
+    assert not store.append("2025-05-01", [])
+    assert store.read("2025-05-01") == DECKS
+    assert store.append("2025-05-01", [], replace=True)
+    assert store.read("2025-05-01") == []
+
+
+def test_unflushed_appends_reach_the_manifest_on_flush(tmp_path):
+    store = MetaSnapshotStore(str(tmp_path))
+    store.append("2025-05-01", DECKS)
+    store.append("2025-05-02", DECKS, flush=False)
+    store.append("2025-05-01", DECKS[:1], replace=True, flush=False)
+
+    assert MetaSnapshotStore(str(tmp_path)).dates() == ["2025-05-01"]
+    store.flush()
+    reopened = MetaSnapshotStore(str(tmp_path))
+    assert reopened.dates() == ["2025-05-01", "2025-05-02"]
+    assert reopened.partitions["2025-05-01"]["decks"] == 1
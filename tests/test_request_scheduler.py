@@ -0,0 +1,114 @@
+import pytest
+
+import requestScheduler
+from requestScheduler import RequestScheduler, RetryQueue, TokenBucket, TransientRequestError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(requestScheduler.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(requestScheduler.time, 'time', clock.time)
+    monkeypatch.setattr(requestScheduler.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_bucket_allows_a_burst_then_paces_at_its_rate(clock):
+    bucket = TokenBucket(rate=2)
+    for _ in range(2):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_throttle_halves_the_rate_down_to_a_floor_and_recover_restores_it(clock):
+    bucket = TokenBucket(rate=10)
+    bucket.throttle()
+    assert bucket.rate == 5
+    assert bucket.tokens <= 0
+    for _ in range(10):
+        bucket.throttle()
+    assert bucket.rate == pytest.approx(10 * TokenBucket.MIN_RATE_FRACTION)
+
+    for _ in range(100):
+        bucket.recover()
+    assert bucket.rate == 10
+
+
+def test_request_retries_transient_statuses(clock):
+    responses = iter([Response(503), Response(429), Response(200)])
+    scheduler = RequestScheduler(default_rate=100, max_retries=3, retry_delay=0.1)
+
+    response = scheduler.request('https://play.limitlesstcg.com/decks', lambda: next(responses))
+
+    assert response.status_code == 200
+    assert scheduler.stats == {"requests": 3, "retries": 2, "throttled": 1, "failed": 0}
+    assert scheduler.bucket('play.limitlesstcg.com').rate < 100
+
+
+def test_request_honours_retry_after(clock, monkeypatch):
+    monkeypatch.setattr(requestScheduler.random, 'uniform', lambda low, high: low)
+    responses = iter([Response(429, {'Retry-After': '7'}), Response(200)])
+    scheduler = RequestScheduler(default_rate=100, max_retries=1, retry_delay=0.1)
+
+    scheduler.request('https://example.test/', lambda: next(responses))
+
+    assert 7 in clock.sleeps
+
+
+def test_request_gives_up_after_max_retries(clock):
+    scheduler = RequestScheduler(default_rate=100, max_retries=2, retry_delay=0.1, retry_exceptions=(TimeoutError,))
+
+    def send():
+        raise TimeoutError()
+
+    with pytest.raises(TransientRequestError) as error:
+        scheduler.request('https://example.test/page', send)
+    assert error.value.reason == 'TimeoutError'
+    assert scheduler.stats["requests"] == 3
+    assert scheduler.stats["failed"] == 1
+
+
+def test_retry_queue_drains_and_reports_what_still_fails(clock):
+    queue = RetryQueue()
+    done = []
+    attempts = []
+
+    def flaky(key):
+        attempts.append(key)
+        if key == 'broken':
+            raise RuntimeError('still down')
+        done.append(key)
+
+    queue.defer('ok', flaky, 'ok')
+    queue.defer('ok', flaky, 'ok')
+    queue.defer('broken', flaky, 'broken')
+    assert len(queue) == 2
+
+    assert queue.drain(rounds=2, cooldown=0.1) == ['broken']
+    assert done == ['ok']
+    assert attempts.count('broken') == 2
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from scrapeMetrics import BUCKETS, MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    registry.reset(scraper='cards')
+    for seconds in (0.004, 0.02, 0.02, 3.0):
+        registry.observe('page_load', seconds)
+    registry.observe('parse', 0.001)
+    registry.increment('http_cache_hits', 3)
+    registry.increment('http_cache_hits')
+    return registry
+
+
+def test_prometheus_histogram_buckets_are_cumulative(registry):
+    lines = registry.to_prometheus().splitlines()
+
+    labels = 'scraper="cards",stage="page_load"'
+    buckets = [line for line in lines if line.startswith(f'ptcgp_stage_seconds_bucket{{{labels}')]
+    assert len(buckets) == len(BUCKETS) + 1
+    assert f'ptcgp_stage_seconds_bucket{{{labels},le="0.005"}} 1' in buckets
+    assert f'ptcgp_stage_seconds_bucket{{{labels},le="0.025"}} 3' in buckets
+    assert f'ptcgp_stage_seconds_bucket{{{labels},le="2.5"}} 3' in buckets
+    assert f'ptcgp_stage_seconds_bucket{{{labels},le="5"}} 4' in buckets
+    assert buckets[-1] == f'ptcgp_stage_seconds_bucket{{{labels},le="+Inf"}} 4'
+    assert f'ptcgp_stage_seconds_sum{{{labels}}} 3.044000' in lines
+    assert f'ptcgp_stage_seconds_count{{{labels}}} 4' in lines
+
+
+def test_prometheus_output_declares_every_metric_family(registry):
+    text = registry.to_prometheus()
+
+    assert text.endswith('\n')
+    assert 'ptcgp_events_total{scraper="cards",event="http_cache_hits"} 4' in text
+    for family, kind in (('ptcgp_stage_seconds', 'histogram'), ('ptcgp_events_total', 'counter'),
+                         ('ptcgp_run_duration_seconds', 'gauge'), ('ptcgp_run_start_timestamp_seconds', 'gauge')):
+        assert f'# TYPE {family} {kind}\n' in text
+        assert f'# HELP {family} ' in text
+
+
+def test_snapshot_orders_stages_and_reports_percentiles(registry):
+    snapshot = registry.snapshot()
+
+    assert list(snapshot['stages']) == ['page_load', 'parse']
+    page_load = snapshot['stages']['page_load']
+    assert page_load['count'] == 4
+    assert page_load['p50Ms'] == 20.0
+    assert page_load['maxMs'] == 3000.0
+    assert snapshot['counters'] == {'http_cache_hits': 4}
+
+
+def test_timer_records_a_block_that_raises(registry):
+    with pytest.raises(RuntimeError):
+        with registry.timer('json_save'):
+            raise RuntimeError('disk full')
+
+    assert registry.snapshot()['stages']['json_save']['count'] == 1
+
+
+def test_export_writes_both_formats(registry, tmp_path):
+    registry.export(json_path=str(tmp_path / 'metrics.json'), prometheus_path=str(tmp_path / 'metrics.prom'))
+
+    assert json.loads((tmp_path / 'metrics.json').read_text())['scraper'] == 'cards'
+    assert (tmp_path / 'metrics.prom').read_text().startswith('# HELP ptcgp_stage_seconds')
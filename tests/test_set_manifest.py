@@ -0,0 +1,50 @@
+import json
+
+from setManifest import SetManifest
+
+SET_LINK = {'setCode': 'A1', 'setName': 'Genetic Apex'}
+LINKS = [f"https://pocket.limitlesstcg.com/cards/A1/{number}" for number in (1, 2, 10)]
+
+
+def test_listing_hash_ignores_order():
+    assert SetManifest.listing_hash(LINKS) == SetManifest.listing_hash(list(reversed(LINKS)))
+    assert SetManifest.listing_hash(LINKS) != SetManifest.listing_hash(LINKS[:2])
+
+
+def test_resolved_cards_are_not_requested_again(tmp_path):
+    manifest = SetManifest(str(tmp_path / 'set_manifest.json'))
+    assert manifest.diff(SET_LINK, LINKS) == LINKS
+
+    manifest.mark_resolved('A1', '1')
+    manifest.mark_resolved('A1', '10')
+
+    assert manifest.diff(SET_LINK, LINKS) == [LINKS[1]]
+
+
+def test_new_cards_in_a_listing_are_pending(tmp_path):
+    manifest = SetManifest(str(tmp_path / 'set_manifest.json'))
+    manifest.diff(SET_LINK, LINKS)
+    for url in LINKS:
+        manifest.mark_resolved('A1', SetManifest.card_number(url))
+
+    grown = LINKS + ["https://pocket.limitlesstcg.com/cards/A1/11"]
+
+    assert manifest.diff(SET_LINK, grown) == [grown[-1]]
+    assert manifest.sets['A1']['cardCount'] == 4
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'set_manifest.json'
+    manifest = SetManifest(str(path))
+    manifest.diff(SET_LINK, LINKS)
+    for number in ('10', '2', '1'):
+        manifest.mark_resolved('A1', number)
+    manifest.save()
+
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert saved['sets']['A1']['resolved'] == ['1', '2', '10']
+    assert saved['sets']['A1']['hash'] == SetManifest.listing_hash(LINKS)
+
+    reloaded = SetManifest(str(path))
+    reloaded.load()
+    assert reloaded.diff(SET_LINK, LINKS) == []
@@ -0,0 +1,84 @@
+import json
+import pickle
+
+import pytest
+
+from cardStore import CardStore
+from sqliteStore import SqliteCardStore, SqliteMetaStore
+
+CARDS = [
+    ('A1-10', {'cardName': 'Venusaur ex', 'setNumber': 'A1', 'evolvesFrom': 'Ivysaur', 'finalEvolution': True}),
+    ('A1-1', {'cardName': 'Bulbasaur', 'setNumber': 'A1', 'finalEvolution': False}),
+    ('A1a-1', {'cardName': 'Bulbasaur', 'setNumber': 'A1a'}),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'data' / 'scraper.db')
+
+
+def test_card_store_matches_the_in_memory_store(db_path):
+    memory, sqlite = CardStore(), SqliteCardStore(db_path)
+    for store in (memory, sqlite):
+        store.upsert_many(CARDS)
+        store.set_field('A1a-1', 'evolvesFrom', 'Oddish')
+        store.upsert('A1-1', dict(CARDS[1][1], iconPath='icons/bulbasaur.png'))
+
+    assert sqlite.export() == memory.export()
+    assert list(sqlite.export()) == ['A1-1', 'A1-10', 'A1a-1']
+    assert sqlite.ids_by('cardName', 'Bulbasaur') == memory.ids_by('cardName', 'Bulbasaur') == {'A1-1', 'A1a-1'}
+    assert sqlite.values_of('setNumber') == memory.values_of('setNumber')
+    assert sqlite.get('A1-10')['finalEvolution'] is True
+    assert sqlite.get('A1a-1')['finalEvolution'] is None
+    with pytest.raises(KeyError):
+        sqlite.set_field('B9-1', 'cardName', 'Missing')
+    sqlite.close()
+
+
+def test_cards_and_settings_survive_reopening(db_path):
+    store = SqliteCardStore(db_path)
+    store.upsert_many(CARDS)
+    store.set_value('iconAtlas', {'cell': 48})
+    store.close()
+
+    reopened = SqliteCardStore(db_path)
+    assert len(reopened) == 3
+    assert 'A1-10' in reopened
+    assert reopened.get_value('iconAtlas') == {'cell': 48}
+    assert reopened.get_value('missing', default=[]) == []
+    reopened.close()
+
+
+def test_meta_snapshots_round_trip(db_path):
+    store = SqliteMetaStore(db_path)
+    day1 = [{'Deck Name': 'A', 'Share': '50.00%', 'Matchups': {'B': {'Matches': '10'}}}, {'Deck Name': 'B'}]
+    day2 = [{'Deck Name': 'B'}, {'Deck Name': 'A', 'Share': '40.00%'}]
+
+    assert store.append('2025-01-01', day1) is True
+    assert store.append('2025-01-02', day2) is True
+    assert store.append('2025-01-02', day1) is False
+
+    assert store.dates() == ['2025-01-01', '2025-01-02']
+    assert store.read('2025-01-01') == day1
+    assert store.read_range(start='2025-01-02') == {'2025-01-02': day2}
+    assert [date for date, _ in store.deck_history('A')] == ['2025-01-01', '2025-01-02']
+    with pytest.raises(KeyError):
+        store.read('2025-01-03')
+
+    assert store.append('2025-01-02', day2[:1], replace=True) is True
+    assert store.read('2025-01-02') == day2[:1]
+    store.close()
+
+
+def test_meta_store_imports_json_and_reconnects_after_pickling(db_path, tmp_path):
+    source = tmp_path / 'tournament_meta.json'
+    source.write_text(json.dumps({'2025-01-01': [{'Deck Name': 'A'}], '2025-01-02': [{'Deck Name': 'B'}]}))
+    store = SqliteMetaStore(db_path)
+    assert store.import_json(str(source)) == 2
+
+    copy = pickle.loads(pickle.dumps(store))
+
+    assert dict(copy.iter_snapshots()) == {'2025-01-01': [{'Deck Name': 'A'}], '2025-01-02': [{'Deck Name': 'B'}]}
+    store.close()
+    copy.close()
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+from webDriverPool import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.quit_calls = 0
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_calls += 1
+        self.alive = False
+
+
+class Factory:
+    def __init__(self):
+        self.drivers = []
+
+    def __call__(self):
+        driver = FakeDriver(len(self.drivers))
+        self.drivers.append(driver)
+        return driver
+
+
+def test_drivers_are_created_lazily_and_reused():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=3)
+    assert factory.drivers == []
+
+    for _ in range(5):
+        with pool.driver() as driver:
+            assert driver is factory.drivers[0]
+    assert len(factory.drivers) == 1
+
+
+def test_driver_is_recycled_after_max_pages():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=1, max_pages=2)
+
+    used = []
+    for _ in range(5):
+        with pool.driver() as driver:
+            used.append(driver.number)
+
+    assert used == [0, 0, 1, 1, 2]
+    assert factory.drivers[0].quit_calls == 1
+    assert factory.drivers[1].quit_calls == 1
+
+
+def test_driver_is_replaced_after_a_crash():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=1)
+
+    with pytest.raises(ValueError):
+        with pool.driver():
+            raise ValueError("page blew up")
+    with pool.driver() as driver:
+        assert driver.number == 1
+    assert factory.drivers[0].quit_calls == 1
+
+
+def test_unresponsive_idle_driver_is_discarded_on_checkout():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=1)
+    with pool.driver():
+        pass
+    factory.drivers[0].alive = False
+
+    with pool.driver() as driver:
+        assert driver.number == 1
+
+
+def test_checkouts_block_at_the_pool_size():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with pool.driver():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert len(factory.drivers) <= 2
+
+
+def test_close_quits_idle_drivers_and_rejects_new_checkouts():
+    factory = Factory()
+    pool = WebDriverPool(factory, size=2)
+    with pool.driver() as busy:
+        with pool.driver():
+            pass
+        pool.close()
+        assert factory.drivers[1].quit_calls == 1
+        assert busy.quit_calls == 0
+    assert busy.quit_calls == 1
+
+    with pytest.raises(RuntimeError):
+        with pool.driver():
+            pass